@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Migration: Create the indexes that were added to existing tables after deployment.
+
+``create_tables()`` relies on ``metadata.create_all``, which creates indexes only
+together with new tables, so indexes declared later on ``sightings`` and
+``ringings`` never reach a live database on their own. This script creates them
+with ``CREATE INDEX CONCURRENTLY`` (no write lock on the table), taking the column
+lists from the models so the two cannot drift apart.
+
+Idempotent: existing valid indexes are skipped; an invalid index left behind by an
+interrupted concurrent build is dropped and rebuilt.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/migrate_add_indexes.py
+    # or on the Pi:
+    docker exec vogelring-api uv run python scripts/migrate_add_indexes.py
+"""
+
+import logging
+import os
+import sys
+
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.database.models import Ringing, Sighting  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+# Indexes declared on tables that already existed in production, in model order
+INDEXES = [
+    # Bounding-box prefilter of radius searches
+    (Sighting, "idx_sightings_org_lat_lon"),
+    # Keyset pagination of GET /api/sightings
+    (Sighting, "idx_sightings_org_date_created_id"),
+    # Delta sync feeds (rows changed since a token)
+    (Sighting, "idx_sightings_org_updated_at"),
+    (Ringing, "idx_ringings_org_updated_at"),
+]
+
+
+def get_database_url() -> str:
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        logger.error("DATABASE_URL environment variable not set")
+        sys.exit(1)
+    return url
+
+
+def _index(model, name: str):
+    for index in model.__table__.indexes:
+        if index.name == name:
+            return index
+    raise LookupError(f"{model.__name__} declares no index {name}")
+
+
+def _is_valid(conn, name: str) -> bool | None:
+    """True/False for an existing valid/invalid index, None if it does not exist"""
+    return conn.execute(
+        text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+        ),
+        {"name": name},
+    ).scalar()
+
+
+def run_migration(engine) -> dict:
+    counts = {"created": 0, "skipped": 0}
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for model, name in INDEXES:
+            index = _index(model, name)
+            valid = _is_valid(conn, name)
+            if valid:
+                logger.info("%s already exists, skipping.", name)
+                counts["skipped"] += 1
+                continue
+            if valid is False:
+                logger.warning(
+                    "Dropping invalid index %s from an interrupted build", name
+                )
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+            columns = ", ".join(column.name for column in index.columns)
+            logger.info("Creating %s on %s (%s)...", name, index.table.name, columns)
+            conn.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {index.table.name} ({columns})"
+                )
+            )
+            counts["created"] += 1
+    return counts
+
+
+def main():
+    logger.info("=" * 60)
+    logger.info("Vogelring: create indexes added to existing tables")
+    logger.info("=" * 60)
+    engine = create_engine(get_database_url())
+    try:
+        counts = run_migration(engine)
+    except Exception as e:
+        logger.error("Migration failed: %s", e)
+        raise
+    logger.info("=" * 60)
+    logger.info("Done. Summary: %s", counts)
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
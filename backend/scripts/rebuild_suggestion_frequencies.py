@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Rebuild the suggestion frequency table from sightings and ringings.
+
+Sighting/ringing writes through the API keep the table up to date, and orgs
+without counts yet are backfilled when the API starts. Run this after bulk
+imports that write to the database directly, or as a deploy step to backfill
+every org before the API serves requests.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/rebuild_suggestion_frequencies.py
+    DATABASE_URL=postgresql://... python scripts/rebuild_suggestion_frequencies.py --org-id <uuid>
+    # or on the Pi:
+    docker exec vogelring-api uv run python scripts/rebuild_suggestion_frequencies.py
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.connection import create_tables, get_db_session  # noqa: E402
+from src.database.suggestion_repository import (  # noqa: E402
+    SuggestionFrequencyRepository,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the per-org suggestion frequency table"
+    )
+    parser.add_argument(
+        "--org-id", help="Only rebuild this organization (default: all)"
+    )
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        logger.error("DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    # Makes sure the table exists when run before the API has started once
+    create_tables()
+
+    with get_db_session() as db:
+        written = SuggestionFrequencyRepository(db).rebuild(args.org_id)
+
+    scope = f"org {args.org_id}" if args.org_id else "all orgs"
+    logger.info(f"Rebuilt suggestion frequencies for {scope}: {written} values")
+
+
+if __name__ == "__main__":
+    main()
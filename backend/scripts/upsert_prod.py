@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 """
 Production upsert script for pi-server.local database
+
+Usage:
+    PROD_DB_PASSWORD=... python upsert_prod.py                    # row by row
+    PROD_DB_PASSWORD=... python upsert_prod.py dry-run [max_rows]
+    PROD_DB_PASSWORD=... ORG_ID=... python upsert_prod.py bulk [chunk_size]
 """
 
 import os
@@ -34,6 +39,11 @@ os.environ["DATABASE_URL"] = (
 
 from src.database.connection import get_db_session
 from src.database.models import Ringing
+from src.database.ringing_import import (
+    BULK_CHUNK_SIZE,
+    RINGING_IMPORT_COLUMNS,
+    bulk_upsert_ringings,
+)
 from src.api.services.ringing_service import RingingService
 from sqlalchemy import text
 
@@ -455,6 +465,61 @@ def upsert_ringings_from_csv(csv_file: str, places_file: str):
     return stats
 
 
+def bulk_upsert_ringings_from_csv(
+    csv_file: str, places_file: str, org_id: str, chunk_size: int = BULK_CHUNK_SIZE
+):
+    """Bulk mode: COPY the CSV in chunks into a staging table and merge set-based.
+
+    Same rules as the row-by-row upsert (new rings inserted in full, existing rings
+    only get their comment updated), but one COPY + one INSERT ... ON CONFLICT per
+    chunk instead of a lookup and a commit per row.
+    """
+    logger.info(f"Starting bulk ringing upsert (chunks of {chunk_size} rows)...")
+    place_map = read_places(places_file)
+    skipped = 0
+
+    def rows():
+        nonlocal skipped
+        with open(csv_file, "r", encoding="utf-8") as f:
+            # Skip header
+            next(f)
+            reader = csv.reader(f, delimiter=";")
+            for row_num, row in enumerate(reader, start=2):
+                if len(row) < max([col.value for col in RingingCols]) + 1:
+                    logger.warning(f"Row {row_num}: Insufficient columns, skipping")
+                    skipped += 1
+                    continue
+                ringing = convert_csv_row_to_ringing(row, place_map)
+                if not ringing:
+                    skipped += 1
+                    continue
+                yield {col: getattr(ringing, col) for col in RINGING_IMPORT_COLUMNS}
+
+    def progress(number: int, stats: Dict[str, int]):
+        logger.info(
+            f"Chunk {number}: {stats['total_rows']} rows processed "
+            f"({stats['new_ringings']} new, {stats['updated_comments']} comments "
+            f"updated, {stats['errors']} errors)"
+        )
+
+    with get_db_session() as db:
+        stats = bulk_upsert_ringings(db, org_id, rows(), chunk_size, progress)
+    stats["skipped_rows"] = skipped
+
+    logger.info("=" * 60)
+    logger.info("PRODUCTION BULK UPSERT COMPLETED")
+    logger.info("=" * 60)
+    logger.info(f"Total rows processed: {stats['total_rows']}")
+    logger.info(f"Skipped rows: {stats['skipped_rows']}")
+    logger.info(f"New ringings created: {stats['new_ringings']}")
+    logger.info(f"Comments updated: {stats['updated_comments']}")
+    logger.info(f"Unchanged: {stats['unchanged']}")
+    logger.info(f"Errors: {stats['errors']}")
+    logger.info("=" * 60)
+
+    return stats
+
+
 if __name__ == "__main__":
     # File paths
     csv_file = "/Users/anton/Desktop/tblRingingNew.csv"
@@ -474,9 +539,32 @@ if __name__ == "__main__":
             except Exception as e:
                 logger.error(f"Production dry run failed: {e}")
                 sys.exit(1)
+        elif sys.argv[1] == "bulk":
+            org_id = os.getenv("ORG_ID")
+            if not org_id:
+                logger.error("Bulk mode needs the target organization: set ORG_ID")
+                sys.exit(1)
+            chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else BULK_CHUNK_SIZE
+            logger.warning(
+                "⚠️  PRODUCTION BULK UPSERT - This will modify the production database!"
+            )
+            try:
+                stats = bulk_upsert_ringings_from_csv(
+                    csv_file, places_file, org_id, chunk_size
+                )
+                if stats["errors"] > 0:
+                    logger.warning(
+                        f"⚠️ Production bulk upsert completed with {stats['errors']} errors"
+                    )
+                    sys.exit(1)
+                logger.info("✅ Production bulk upsert completed successfully!")
+            except Exception as e:
+                logger.error(f"❌ Production bulk upsert failed: {e}")
+                sys.exit(1)
         else:
             logger.error(
-                "Usage: PROD_DB_PASSWORD='password' python upsert_prod.py [dry-run [max_rows]]"
+                "Usage: PROD_DB_PASSWORD='password' python upsert_prod.py "
+                "[dry-run [max_rows] | bulk [chunk_size]]"
             )
             sys.exit(1)
     else:
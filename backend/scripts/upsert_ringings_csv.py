@@ -6,6 +6,9 @@ Rules:
 - Each ring can only exist once in the DB
 - If ring already exists: ONLY update the comment, leave all other fields unchanged
 - If ring doesn't exist: Insert the complete ringing record
+
+Pass ``bulk [chunk_size]`` (with ORG_ID set) to import in set-based chunks via COPY
+instead of row by row.
 """
 
 import os
@@ -21,6 +24,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 from src.database.connection import get_db_session
 from src.database.models import Ringing
+from src.database.ringing_import import (
+    BULK_CHUNK_SIZE,
+    RINGING_IMPORT_COLUMNS,
+    bulk_upsert_ringings,
+)
 from src.api.services.ringing_service import RingingService
 
 # Configure logging
@@ -295,6 +303,61 @@ def upsert_ringings_from_csv(csv_file: str, places_file: str):
     return stats
 
 
+def bulk_upsert_ringings_from_csv(
+    csv_file: str, places_file: str, org_id: str, chunk_size: int = BULK_CHUNK_SIZE
+):
+    """Bulk mode: COPY the CSV in chunks into a staging table and merge set-based.
+
+    Same rules as the row-by-row upsert (new rings inserted in full, existing rings
+    only get their comment updated), but one COPY + one INSERT ... ON CONFLICT per
+    chunk instead of a lookup and a commit per row.
+    """
+    logger.info(f"Starting bulk ringing upsert (chunks of {chunk_size} rows)...")
+    place_map = read_places(places_file)
+    skipped = 0
+
+    def rows():
+        nonlocal skipped
+        with open(csv_file, "r", encoding="utf-8") as f:
+            # Skip header
+            next(f)
+            reader = csv.reader(f, delimiter=";")
+            for row_num, row in enumerate(reader, start=2):
+                if len(row) < max([col.value for col in RingingCols]) + 1:
+                    logger.warning(f"Row {row_num}: Insufficient columns, skipping")
+                    skipped += 1
+                    continue
+                ringing = convert_csv_row_to_ringing(row, place_map)
+                if not ringing:
+                    skipped += 1
+                    continue
+                yield {col: getattr(ringing, col) for col in RINGING_IMPORT_COLUMNS}
+
+    def progress(number: int, stats: Dict[str, int]):
+        logger.info(
+            f"Chunk {number}: {stats['total_rows']} rows processed "
+            f"({stats['new_ringings']} new, {stats['updated_comments']} comments "
+            f"updated, {stats['errors']} errors)"
+        )
+
+    with get_db_session() as db:
+        stats = bulk_upsert_ringings(db, org_id, rows(), chunk_size, progress)
+    stats["skipped_rows"] = skipped
+
+    logger.info("=" * 60)
+    logger.info("BULK UPSERT COMPLETED")
+    logger.info("=" * 60)
+    logger.info(f"Total rows processed: {stats['total_rows']}")
+    logger.info(f"Skipped rows: {stats['skipped_rows']}")
+    logger.info(f"New ringings created: {stats['new_ringings']}")
+    logger.info(f"Comments updated: {stats['updated_comments']}")
+    logger.info(f"Unchanged: {stats['unchanged']}")
+    logger.info(f"Errors: {stats['errors']}")
+    logger.info("=" * 60)
+
+    return stats
+
+
 if __name__ == "__main__":
     # File paths
     csv_file = "/Users/anton/Desktop/tblRingingNew.csv"
@@ -310,7 +373,18 @@ if __name__ == "__main__":
         sys.exit(1)
 
     try:
-        stats = upsert_ringings_from_csv(csv_file, places_file)
+        if len(sys.argv) > 1 and sys.argv[1] == "bulk":
+            # Set-based import: python upsert_ringings_csv.py bulk [chunk_size]
+            org_id = os.getenv("ORG_ID")
+            if not org_id:
+                logger.error("Bulk mode needs the target organization: set ORG_ID")
+                sys.exit(1)
+            chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else BULK_CHUNK_SIZE
+            stats = bulk_upsert_ringings_from_csv(
+                csv_file, places_file, org_id, chunk_size
+            )
+        else:
+            stats = upsert_ringings_from_csv(csv_file, places_file)
 
         if stats["errors"] > 0:
             logger.warning(f"Completed with {stats['errors']} errors")
@@ -2,7 +2,7 @@
 Analytics API router
 """
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from ...database.connection import get_db
@@ -57,11 +57,28 @@ async def get_groups_from_ring(
 
 @router.get("/seasonal-analysis")
 async def get_seasonal_analysis(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    species: str | None = Query(None, description="Only analyse this species"),
+    start_year: int | None = Query(
+        None, ge=1, le=9999, description="First year to include"
+    ),
+    end_year: int | None = Query(
+        None, ge=1, le=9999, description="Last year to include"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """Get seasonal analysis data"""
+    if start_year is not None and end_year is not None and start_year > end_year:
+        raise HTTPException(
+            status_code=400, detail="start_year must not be after end_year"
+        )
     service = AnalyticsService(db)
-    analysis = service.get_seasonal_analysis(org_id=str(current_user.org_id))
+    analysis = service.get_seasonal_analysis(
+        org_id=str(current_user.org_id),
+        species=species,
+        start_year=start_year,
+        end_year=end_year,
+    )
 
     # Convert SeasonalCount objects to dictionaries
     result = {}
@@ -2,7 +2,7 @@
 Birds API router
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from ...utils.auth import get_current_user
@@ -12,9 +12,12 @@ from ..services.bird_service import BirdService
 
 router = APIRouter()
 
+# Most rings accepted by one POST /birds/batch request
+MAX_BIRD_BATCH_SIZE = 500
+
 
 @router.get("/birds/{ring}")
-async def get_bird_by_ring(
+def get_bird_by_ring(
     ring: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -48,8 +51,24 @@ async def get_bird_by_ring(
     return bird
 
 
+@router.post("/birds/batch")
+def get_birds_by_rings(
+    rings: list[str] = Body(..., max_length=MAX_BIRD_BATCH_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get bird information for several ring numbers at once
+
+    Returns one BirdMeta (as for GET /birds/{ring}) per distinct ring, in request
+    order. Sightings, ringings, partners and children are loaded with one query
+    each for the whole batch.
+    """
+    service = BirdService(db)
+    return list(service.get_bird_metas_by_rings(rings, current_user.org_id).values())
+
+
 @router.get("/birds/suggestions/{partial_reading}")
-async def get_bird_suggestions_by_partial_reading(
+def get_bird_suggestions_by_partial_reading(
     partial_reading: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -148,9 +148,11 @@ class BirdSibling(BaseModel):
 
     ring: str
     year: int
-    confidence: Optional[str]
-    source: Optional[str]
-    notes: Optional[str]
+    confidence: Optional[str] = None
+    source: Optional[str] = None
+    notes: Optional[str] = None
+    # Only set for siblings derived from shared parents (include_half_siblings)
+    shares_both_parents: Optional[bool] = None
 
 
 class FamilyTreeResponse(BaseModel):
@@ -338,7 +340,7 @@ async def get_bird_siblings(
 
 
 @router.get("/family-tree/{bird_ring}", response_model=FamilyTreeResponse)
-async def get_family_tree(
+def get_family_tree(
     bird_ring: str,
     max_generations: int = Query(
         3, ge=1, le=5, description="Maximum generations to retrieve"
@@ -358,8 +360,18 @@ async def get_family_tree(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/statistics", response_model=Dict[str, RelationshipStatistics])
+def get_all_relationship_statistics(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get relationship statistics of every bird with relationships, keyed by ring"""
+    repo = FamilyRepository(db)
+    return repo.get_all_relationship_statistics(current_user.org_id)
+
+
 @router.get("/statistics/{bird_ring}", response_model=RelationshipStatistics)
-async def get_relationship_statistics(
+def get_relationship_statistics(
     bird_ring: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -429,26 +441,25 @@ async def update_relationship(
 
     try:
         # Update only provided fields
+        changes = {}
         if relationship_data.relationship_type is not None:
-            db_relationship_type = DBRelationshipType[
+            changes["relationship_type"] = DBRelationshipType[
                 relationship_data.relationship_type.value.upper()
             ]
-            existing_relationship.relationship_type = db_relationship_type
 
         if relationship_data.year is not None:
-            existing_relationship.year = relationship_data.year
+            changes["year"] = relationship_data.year
 
         if relationship_data.confidence is not None:
-            existing_relationship.confidence = relationship_data.confidence
+            changes["confidence"] = relationship_data.confidence
 
         if relationship_data.source is not None:
-            existing_relationship.source = relationship_data.source
+            changes["source"] = relationship_data.source
 
         if relationship_data.notes is not None:
-            existing_relationship.notes = relationship_data.notes
+            changes["notes"] = relationship_data.notes
 
-        db.commit()
-        db.refresh(existing_relationship)
+        repo.update_relationship(existing_relationship, **changes)
 
         return RelationshipResponse(
             id=existing_relationship.id,
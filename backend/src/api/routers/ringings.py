@@ -2,15 +2,18 @@
 Ringings API router
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from datetime import date as DateType
 from pydantic import BaseModel
 
 from ...utils.auth import get_current_user
+from ...utils.etag import org_etag
 from ...database.connection import get_db
 from ..services.ringing_service import RingingService
 from ...database.user_models import User
+from ...utils.ndjson import ndjson_response, wants_ndjson
+from ...utils.pagination import InvalidCursorError
 
 router = APIRouter()
 
@@ -50,7 +53,7 @@ class RingingUpdate(BaseModel):
 
 
 @router.get("/ringings/count")
-async def get_ringings_count(
+def get_ringings_count(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -59,8 +62,28 @@ async def get_ringings_count(
     return {"count": service.get_ringings_count(current_user.org_id)}
 
 
+@router.get("/ringings/changes")
+def get_ringing_changes(
+    since: str | None = Query(None, description="token of the previous call"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get the ringings created, updated or deleted since a sync token.
+
+    Returns ``changed`` ringings, ``deleted`` tombstones (with their ring number)
+    and the ``token`` to pass as ``since`` next time. Without ``since`` all
+    ringings are returned. Apply the deletions before the changes; a few rows may
+    be repeated across calls.
+    """
+    service = RingingService(db)
+    try:
+        return service.get_ringing_changes(current_user.org_id, since)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/ringings/statistics")
-async def get_ringings_statistics(
+def get_ringings_statistics(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -70,7 +93,7 @@ async def get_ringings_statistics(
 
 
 @router.get("/ringings/autocomplete/{field}")
-async def get_autocomplete_suggestions(
+def get_autocomplete_suggestions(
     field: str,
     q: str = Query(..., description="Query string"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
@@ -83,18 +106,24 @@ async def get_autocomplete_suggestions(
     return {"suggestions": suggestions}
 
 
-@router.get("/ringings")
-async def get_ringings(
+@router.get("/ringings", dependencies=[Depends(org_etag)])
+def get_ringings(
+    request: Request,
     start_date: DateType | None = Query(None, description="Start date filter"),
     end_date: DateType | None = Query(None, description="End date filter"),
     species: str | None = Query(None, description="Species filter"),
     place: str | None = Query(None, description="Place filter"),
     ring: str | None = Query(None, description="Ring filter"),
     ringer: str | None = Query(None, description="Ringer filter"),
+    stream: bool = Query(False, description="Stream all matches as NDJSON"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get all ringings with optional filters. Pagination is handled client-side."""
+    """Get all ringings with optional filters. Pagination is handled client-side.
+
+    ``stream=1`` or ``Accept: application/x-ndjson`` streams the rows as one JSON
+    object per line instead of building the whole list in memory.
+    """
     service = RingingService(db)
 
     # Build filters
@@ -112,6 +141,9 @@ async def get_ringings(
     if ringer:
         filters["ringer"] = ringer
 
+    if wants_ndjson(request, stream):
+        return ndjson_response(service.iter_ringings(current_user.org_id, filters), db)
+
     # Get ringings
     if filters:
         ringings = service.search_ringings(filters, current_user.org_id)
@@ -122,7 +154,7 @@ async def get_ringings(
 
 
 @router.get("/ringing/{ring}")
-async def get_ringing_by_ring(
+def get_ringing_by_ring(
     ring: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -136,7 +168,7 @@ async def get_ringing_by_ring(
 
 
 @router.post("/ringing")
-async def upsert_ringing(
+def upsert_ringing(
     ringing_data: RingingCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -151,7 +183,7 @@ async def upsert_ringing(
 
 
 @router.put("/ringing")
-async def update_ringing(
+def update_ringing(
     ringing_data: RingingUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -169,7 +201,7 @@ async def update_ringing(
 
 
 @router.delete("/ringing/{ring}")
-async def delete_ringing(
+def delete_ringing(
     ring: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
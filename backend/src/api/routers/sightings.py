@@ -2,23 +2,34 @@
 Sightings API router
 """
 
-import io
-from fastapi import APIRouter, Depends, HTTPException, Query
+import logging
+import tempfile
+from typing import Any
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from datetime import date as DateType
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from ...utils.auth import get_current_user
+from ...utils.etag import org_etag
 from ...database.connection import get_db
 from ...database.user_models import User
 from ...database.models import Sighting as SightingDB
+from ...database.repositories import STREAM_BATCH_SIZE
 from ...utils.sighting_coding import ring_age_label, ring_sex_label
-from ...utils.ring_places import lookup_place, smart_match_place
+from ...utils.ring_places import PlaceResolver
+from ...utils.pagination import InvalidCursorError
+from ...utils.ndjson import ndjson_response, wants_ndjson
 from ..services.sighting_service import SightingService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Most sightings accepted by one POST /sightings/batch request
+MAX_SIGHTING_BATCH_SIZE = 500
+
 
 class SightingCreate(BaseModel):
     """Pydantic model for creating sightings"""
@@ -80,7 +91,7 @@ class SightingUpdate(BaseModel):
 
 
 @router.get("/sightings/count")
-async def get_sightings_count(
+def get_sightings_count(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -89,22 +100,56 @@ async def get_sightings_count(
     return {"count": service.get_sightings_count(current_user.org_id)}
 
 
+@router.get("/sightings/changes")
+def get_sighting_changes(
+    since: str | None = Query(None, description="token of the previous call"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get the sightings created, updated or deleted since a sync token.
+
+    Returns ``changed`` sightings, ``deleted`` tombstones and the ``token`` to pass
+    as ``since`` next time. Without ``since`` all sightings are returned. Apply the
+    deletions before the changes; a few rows may be repeated across calls.
+    """
+    service = SightingService(db)
+    try:
+        return service.get_sighting_changes(current_user.org_id, since)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/sightings/radius")
-async def get_sightings_by_radius(
+def get_sightings_by_radius(
     lat: float = Query(..., description="Latitude"),
     lon: float = Query(..., description="Longitude"),
     radius_m: int = Query(..., description="Radius in meters"),
+    start_date: DateType | None = Query(None, description="Start date filter"),
+    end_date: DateType | None = Query(None, description="End date filter"),
+    species: str | None = Query(None, description="Species filter"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of sightings"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get sightings within a radius of a location"""
+    """Get sightings within a radius of a location, newest first"""
     service = SightingService(db)
-    sightings = service.get_sightings_by_radius(lat, lon, radius_m, current_user.org_id)
+
+    filters = {}
+    if start_date:
+        filters["start_date"] = start_date
+    if end_date:
+        filters["end_date"] = end_date
+    if species:
+        filters["species"] = species
+
+    sightings = service.get_sightings_by_radius(
+        lat, lon, radius_m, current_user.org_id, filters=filters, limit=limit
+    )
     return sightings
 
 
 @router.get("/sightings/statistics")
-async def get_sightings_statistics(
+def get_sightings_statistics(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -114,7 +159,7 @@ async def get_sightings_statistics(
 
 
 @router.get("/sightings/autocomplete/{field}")
-async def get_autocomplete_suggestions(
+def get_autocomplete_suggestions(
     field: str,
     q: str = Query(..., description="Query string"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
@@ -127,6 +172,11 @@ async def get_autocomplete_suggestions(
     return {"suggestions": suggestions}
 
 
+# The finished export workbook is kept in memory up to this size, then spooled
+# to a temp file; it is streamed out in chunks of EXPORT_CHUNK_SIZE.
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+EXPORT_CHUNK_SIZE = 64 * 1024
+
 # Status code -> RING (Vogelwarte) status text mapping for the export.
 # Only these two Vogelring statuses carry over to the RING Status field.
 # MG = Mausergast, BV = Brutvogel; everything else / empty is left blank.
@@ -167,20 +217,31 @@ _BEMERKUNGEN_FIELDS: list[tuple[str, "callable"]] = [
 ]
 
 
-def _ring_place_columns(s: SightingDB) -> tuple[str, object, object]:
+def _ring_place_columns(
+    s: SightingDB, resolver: PlaceResolver
+) -> tuple[str, object, object]:
     """Return (RING-Ort, Lat, Lon) for a sighting.
 
     Prefer Ingo's explicit mapping; otherwise fall back to the GPS-nearest RING
     place (within 500 m + name overlap), flagged "(auto)" so it's clearly an
-    unverified suggestion. Blank when neither resolves.
+    unverified suggestion. Blank when neither resolves. Resolutions are memoized
+    per (place, ~11 m coordinate bucket) in the export's ``resolver``.
     """
-    explicit = lookup_place(s.place)
-    if explicit is not None:
-        return explicit.ring_place, explicit.lat, explicit.lon
-    auto = smart_match_place(s.place, s.lat, s.lon)
-    if auto is not None:
-        return f"{auto.ring_place} (auto)", auto.lat, auto.lon
-    return "", "", ""
+    place, auto = resolver.resolve(s.place, s.lat, s.lon)
+    if place is None:
+        return "", "", ""
+    if auto:
+        return f"{place.ring_place} (auto)", place.lat, place.lon
+    return place.ring_place, place.lat, place.lon
+
+
+def _iter_file(file, chunk_size: int):
+    """Yield a file's contents in chunks, closing it once the response is sent."""
+    try:
+        while chunk := file.read(chunk_size):
+            yield chunk
+    finally:
+        file.close()
 
 
 def _build_bemerkungen(s: SightingDB) -> str:
@@ -202,7 +263,7 @@ def _build_bemerkungen(s: SightingDB) -> str:
 
 
 @router.get("/sightings/export/vogelwarte")
-async def export_sightings_vogelwarte(
+def export_sightings_vogelwarte(
     start_date: DateType = Query(
         DateType(2026, 1, 1),
         description="Only Wiederfunde on/after this date (default 2026-01-01)",
@@ -225,7 +286,9 @@ async def export_sightings_vogelwarte(
     """
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font
+        from openpyxl.utils import get_column_letter
     except ImportError as exc:  # pragma: no cover - dependency guard
         raise HTTPException(
             status_code=500,
@@ -239,9 +302,9 @@ async def export_sightings_vogelwarte(
     )
     if end_date is not None:
         query = query.filter(SightingDB.date <= end_date)
-    sightings = query.order_by(
-        SightingDB.date.asc(), SightingDB.place.asc()
-    ).all()
+    sightings = query.order_by(SightingDB.date.asc(), SightingDB.place.asc()).yield_per(
+        STREAM_BATCH_SIZE
+    )
 
     headers = [
         "Datum",
@@ -257,17 +320,29 @@ async def export_sightings_vogelwarte(
         "Bemerkungen",
     ]
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Wiederfunde"
-    ws.append(headers)
-    for cell in ws[1]:
+    # Write-only mode streams rows to disk instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Wiederfunde")
+
+    # Reasonable default column widths for readability (must precede the rows).
+    widths = [12, 28, 30, 10, 10, 16, 22, 16, 12, 24, 60]
+    for idx, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = Font(bold=True)
+        header_cells.append(cell)
+    ws.append(header_cells)
 
+    resolver = PlaceResolver()
+    row_count = 0
     for s in sightings:
         # Match the Vogelring place to its RING place + coordinates (explicit map,
         # else GPS-nearest "(auto)" suggestion, else blank).
-        ring_ort, ring_lat, ring_lon = _ring_place_columns(s)
+        ring_ort, ring_lat, ring_lon = _ring_place_columns(s, resolver)
+        row_count += 1
         ws.append(
             [
                 s.date.strftime("%d.%m.%Y") if s.date else "",
@@ -287,27 +362,37 @@ async def export_sightings_vogelwarte(
             ]
         )
 
-    # Reasonable default column widths for readability.
-    widths = [12, 28, 30, 10, 10, 16, 22, 16, 12, 24, 60]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[chr(64 + idx)].width = width
+    logger.info(
+        f"Vogelwarte export: {row_count} rows, place resolution "
+        f"{resolver.hits} hits / {resolver.misses} misses "
+        f"({resolver.hit_rate:.0%} hit rate)"
+    )
 
-    buffer = io.BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+    # Small exports stay in memory; large ones roll over to a temp file
+    output = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+    try:
+        wb.save(output)
+        size = output.tell()
+        output.seek(0)
+    except Exception:
+        output.close()
+        raise
 
     filename = f"vogelring_wiederfunde_{DateType.today().isoformat()}.xlsx"
     return StreamingResponse(
-        buffer,
+        _iter_file(output, EXPORT_CHUNK_SIZE),
         media_type=(
             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         ),
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        },
     )
 
 
 @router.get("/sightings/{id}")
-async def get_sighting_by_id(
+def get_sighting_by_id(
     id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -320,18 +405,34 @@ async def get_sighting_by_id(
     return sighting
 
 
-@router.get("/sightings")
-async def get_sightings(
+@router.get("/sightings", dependencies=[Depends(org_etag)])
+def get_sightings(
+    request: Request,
     start_date: DateType | None = Query(None, description="Start date filter"),
     end_date: DateType | None = Query(None, description="End date filter"),
     species: str | None = Query(None, description="Species filter"),
     place: str | None = Query(None, description="Place filter"),
     ring: str | None = Query(None, description="Ring filter"),
     enriched: bool = Query(False, description="Include ringing data"),
+    stream: bool = Query(False, description="Stream all matches as NDJSON"),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    all_rows: bool = Query(
+        False,
+        alias="all",
+        description="Return every matching sighting unpaginated (legacy behaviour)",
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get all sightings with optional filters. Pagination is handled client-side."""
+    """Get sightings with optional filters.
+
+    Paginated by keyset on ``date DESC, created_at DESC, id``: pass the returned
+    ``next_cursor`` as ``cursor`` to fetch the next page (``null`` on the last
+    page). ``all=true`` returns the full unpaginated list instead. ``stream=1`` or
+    ``Accept: application/x-ndjson`` streams every match as one JSON object per
+    line with flat memory use.
+    """
     service = SightingService(db)
 
     # Build filters
@@ -347,6 +448,25 @@ async def get_sightings(
     if ring:
         filters["ring"] = ring
 
+    if wants_ndjson(request, stream):
+        return ndjson_response(
+            service.iter_sightings(current_user.org_id, filters, enriched=enriched),
+            db,
+        )
+
+    if not all_rows:
+        try:
+            sightings, next_cursor = service.get_sightings_page(
+                current_user.org_id,
+                filters,
+                limit,
+                cursor=cursor,
+                enriched=enriched,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"sightings": sightings, "next_cursor": next_cursor, "limit": limit}
+
     # Get sightings
     if filters:
         sightings = service.search_sightings(filters, current_user.org_id)
@@ -359,7 +479,7 @@ async def get_sightings(
 
 
 @router.post("/sightings")
-async def add_sighting(
+def add_sighting(
     sighting_data: SightingCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -375,8 +495,52 @@ async def add_sighting(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/sightings/batch")
+def add_sightings_batch(
+    items: list[dict[str, Any]] = Body(..., max_length=MAX_SIGHTING_BATCH_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create many sightings in one transaction.
+
+    Each item is validated on its own; valid items are inserted together with a
+    single commit, invalid ones are reported by index and skipped. ``ids`` lines up
+    with the request (None for items that failed validation).
+    """
+    valid: list[tuple[int, dict[str, Any]]] = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            sighting = SightingCreate.model_validate(item)
+        except ValidationError as e:
+            errors.append(
+                {
+                    "index": index,
+                    "errors": e.errors(include_url=False, include_context=False),
+                }
+            )
+            continue
+        # All fields (not only the set ones) so every row has the same columns and
+        # the batch becomes one multi-row INSERT
+        valid.append((index, sighting.model_dump()))
+
+    ids: list[str | None] = [None] * len(items)
+    if valid:
+        service = SightingService(db)
+        try:
+            created = service.add_sightings(
+                current_user.org_id, [data for _, data in valid]
+            )
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        for (index, _), sighting in zip(valid, created):
+            ids[index] = str(sighting.id)
+
+    return {"ids": ids, "created": len(valid), "errors": errors}
+
+
 @router.put("/sightings")
-async def update_sighting(
+def update_sighting(
     sighting_data: SightingUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -399,7 +563,7 @@ async def update_sighting(
 
 
 @router.delete("/sightings/{id}")
-async def delete_sighting(
+def delete_sighting(
     id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
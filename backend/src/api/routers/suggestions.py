@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from ...utils.auth import get_current_user
+from ...utils.etag import org_etag
 from ...database.connection import get_db
 from ...database.user_models import User
 from ..services.suggestion_service import SuggestionService
@@ -13,8 +14,8 @@ from ..services.suggestion_service import SuggestionService
 router = APIRouter()
 
 
-@router.get("/suggestions")
-async def get_all_suggestions(
+@router.get("/suggestions", dependencies=[Depends(org_etag)])
+def get_all_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -23,8 +24,8 @@ async def get_all_suggestions(
     return service.get_suggestion_lists(current_user.org_id)
 
 
-@router.get("/suggestions/species")
-async def get_species_suggestions(
+@router.get("/suggestions/species", dependencies=[Depends(org_etag)])
+def get_species_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -33,8 +34,8 @@ async def get_species_suggestions(
     return {"species": service.get_species_name_list(current_user.org_id)}
 
 
-@router.get("/suggestions/places")
-async def get_place_suggestions(
+@router.get("/suggestions/places", dependencies=[Depends(org_etag)])
+def get_place_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -43,8 +44,8 @@ async def get_place_suggestions(
     return {"places": service.get_place_name_list(current_user.org_id)}
 
 
-@router.get("/suggestions/habitats")
-async def get_habitat_suggestions(
+@router.get("/suggestions/habitats", dependencies=[Depends(org_etag)])
+def get_habitat_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -53,8 +54,8 @@ async def get_habitat_suggestions(
     return {"habitats": service.get_habitat_list(current_user.org_id)}
 
 
-@router.get("/suggestions/melders")
-async def get_melder_suggestions(
+@router.get("/suggestions/melders", dependencies=[Depends(org_etag)])
+def get_melder_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -63,8 +64,8 @@ async def get_melder_suggestions(
     return {"melders": service.get_melder_list(current_user.org_id)}
 
 
-@router.get("/suggestions/field-fruits")
-async def get_field_fruit_suggestions(
+@router.get("/suggestions/field-fruits", dependencies=[Depends(org_etag)])
+def get_field_fruit_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -73,8 +74,8 @@ async def get_field_fruit_suggestions(
     return {"field_fruits": service.get_field_fruit_list(current_user.org_id)}
 
 
-@router.get("/suggestions/ringers")
-async def get_ringer_suggestions(
+@router.get("/suggestions/ringers", dependencies=[Depends(org_etag)])
+def get_ringer_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -3,10 +3,9 @@ Analytics service layer - migrated from AWS Lambda to use PostgreSQL
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, date
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 from collections import defaultdict
 
 from ...database.repositories import SightingRepository, RingingRepository
@@ -63,129 +62,84 @@ class AnalyticsService:
     def get_friends_from_ring(
         self, ring: str, org_id: str, min_shared_sightings: int = 2
     ) -> Dict[str, Any]:
-        """Get friends analysis for a specific ring"""
-        # Get all sightings for the target ring
-        target_sightings = self.get_all_sightings_from_ring(ring, org_id)
-
-        # Create list of (place, date) tuples for the target ring
-        place_dates = [
-            (sighting.place, sighting.date)
-            for sighting in target_sightings
-            if sighting.place and sighting.date
-        ]
-
-        if not place_dates:
-            return {
-                "bird": BirdService(self.db).get_bird_meta_by_ring(ring, org_id),
-                "friends": [],
-                "seen_status": {},
-            }
-
-        # Find all other sightings that share the same place and date
-        friends = defaultdict(list)
-        seen_together_ids = []
-
-        for place, date_val in place_dates:
-            # Query for sightings on the same date and place, excluding the target ring
-            shared_sightings = (
-                self.db.query(SightingDB)
-                .filter(
-                    and_(
-                        SightingDB.org_id == org_id,
-                        SightingDB.place == place,
-                        SightingDB.date == date_val,
-                        SightingDB.ring != ring,
-                        SightingDB.ring.isnot(None),
-                    )
-                )
-                .all()
-            )
+        """Get friends analysis for a specific ring.
 
-            for sighting in shared_sightings:
-                friends[sighting.ring].append(sighting.place)
-                seen_together_ids.append(str(sighting.id))
+        Runs in a constant number of queries: the co-sightings are grouped in one
+        self-join and the metadata of the bird and its top friends is batch-loaded.
+        """
+        top_friends = self.sighting_repository.get_co_sighted_rings(
+            ring, org_id, min_shared=min_shared_sightings, limit=10
+        )
+        metas = BirdService(self.db).get_bird_metas_by_rings(
+            [ring] + [friend_ring for friend_ring, _ in top_friends], org_id
+        )
+        bird_meta = metas[ring]
 
-        # Filter friends with at least min_shared_sightings, then get top 10
-        filtered_friends = {
-            k: v for k, v in friends.items() if len(v) >= min_shared_sightings
+        # (place, date) pairs where the target ring was seen
+        spots = {
+            (s["place"], s["date"])
+            for s in bird_meta["sightings"]
+            if s["place"] and s["date"]
         }
-        top_friends = sorted(
-            filtered_friends.items(), key=lambda x: len(x[1]), reverse=True
-        )[:10]
 
-        # Build friend metadata
+        seen_status = {s["id"]: "CURRENT_BIRD" for s in bird_meta["sightings"]}
         friend_metas = []
-        for friend_ring, places in top_friends:
-            friend_meta = BirdService(self.db).get_bird_meta_by_ring(
-                friend_ring, org_id
-            )
-            friend_meta["count"] = len(places)
-            friend_meta["places"] = list(set(places))
+        for friend_ring, count in top_friends:
+            friend_meta = metas[friend_ring]
+            places = set()
+            for sighting in friend_meta["sightings"]:
+                if (sighting["place"], sighting["date"]) in spots:
+                    places.add(sighting["place"])
+                    seen_status[sighting["id"]] = "SEEN_TOGETHER"
+                else:
+                    seen_status[sighting["id"]] = "SEEN_SEPARATE"
+            friend_meta["count"] = count
+            friend_meta["places"] = list(places)
             friend_metas.append(friend_meta)
 
-        # Get bird metadata for the target ring
-        bird_meta = BirdService(self.db).get_bird_meta_by_ring(ring, org_id)
-
-        # Build seen status
-        seen_status = {}
-        for sighting in target_sightings:
-            seen_status[str(sighting.id)] = "CURRENT_BIRD"
-
-        # Add seen together status for friend sightings
-        for friend_meta in friend_metas:
-            if "sightings" in friend_meta:
-                for sighting in friend_meta["sightings"]:
-                    sighting_id = str(sighting.get("id", ""))
-                    if sighting_id in seen_together_ids:
-                        seen_status[sighting_id] = "SEEN_TOGETHER"
-                    else:
-                        seen_status[sighting_id] = "SEEN_SEPARATE"
-
         return {"bird": bird_meta, "friends": friend_metas, "seen_status": seen_status}
 
-    def get_seasonal_analysis(self, org_id: str) -> SeasonalAnalysis:
-        """Get seasonal analysis of sightings"""
-        # Get all sightings with species and date
-        sightings = (
-            self.db.query(SightingDB)
-            .filter(
-                and_(
-                    SightingDB.org_id == org_id,
-                    SightingDB.species.isnot(None),
-                    SightingDB.date.isnot(None),
-                )
-            )
-            .all()
+    def get_seasonal_analysis(
+        self,
+        org_id: str,
+        species: Optional[str] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> SeasonalAnalysis:
+        """Get seasonal analysis of sightings.
+
+        The sightings are counted per species/year/month in the database; only
+        those counts are loaded. Optionally limited to one species and/or an
+        inclusive year range.
+        """
+        rows = self.sighting_repository.get_species_month_counts(
+            org_id, species=species, start_year=start_year, end_year=end_year
         )
 
-        # Group by species and year-month
-        year_species_counts = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-        recent_counts = defaultdict(lambda: defaultdict(int))
+        # species -> year -> 12 monthly counts (January first)
+        year_species_counts: Dict[str, Dict[int, List[int]]] = defaultdict(
+            lambda: defaultdict(lambda: [0] * 12)
+        )
+        recent_counts: Dict[str, Dict[int, int]] = defaultdict(dict)
 
         current_date = datetime.now().date()
         current_month = current_date.month
         current_year = current_date.year
 
-        for sighting in sightings:
-            species = sighting.species or "Unbekannt"
-            year = sighting.date.year
-            month = sighting.date.month
-
-            # Regular counts
-            year_species_counts[species][year][month] += 1
+        for row_species, year, month, count in rows:
+            year_species_counts[row_species][year][month - 1] = count
 
             # Recent counts (last 12 months)
             months_diff = (current_year - year) * 12 + (current_month - month)
             if 0 <= months_diff < 12:
-                recent_counts[species][month] += 1
+                recent_counts[row_species][month] = count
 
         # Calculate seasonal counts for each species
         species_seasonal_counts = {}
-        for species, year_counts in year_species_counts.items():
-            seasonal_counts = self._get_seasonal_counts(
-                species, year_counts, recent_counts.get(species, {})
+        for row_species, year_counts in year_species_counts.items():
+            species_seasonal_counts[row_species] = self._get_seasonal_counts(
+                row_species, year_counts, recent_counts.get(row_species, {})
             )
-            species_seasonal_counts[species] = seasonal_counts
 
         return SeasonalAnalysis(counts=species_seasonal_counts)
 
@@ -194,78 +148,61 @@ class AnalyticsService:
     def _get_seasonal_counts(
         self,
         species: str,
-        year_counts: Dict[int, Dict[int, int]],
+        year_counts: Dict[int, List[int]],
         recent_counts: Dict[int, int],
     ) -> List[SeasonalCount]:
-        """Calculate seasonal counts for a species"""
-        # Initialize lists to store counts for each month
-        month_counts = {month: [] for month in range(1, 13)}
-
-        # Collect all counts for each month across years
-        for year_data in year_counts.values():
-            for month in range(1, 13):
-                count = year_data.get(month, 0)
-                month_counts[month].append(count)
-
-        # Calculate statistics for each month
-        seasonal_counts = []
-        medians = []
-        q3s = []
-
-        for month in range(1, 13):
-            counts_list = month_counts[month]
-            if not counts_list:
-                median = q1 = q3 = max_count = 0
-            else:
-                sorted_counts = sorted(counts_list)
-                n = len(sorted_counts)
-
-                # Calculate median (Q2)
-                if n % 2 == 0:
-                    median = (sorted_counts[n // 2 - 1] + sorted_counts[n // 2]) / 2
-                else:
-                    median = sorted_counts[n // 2]
+        """Calculate seasonal counts for a species.
 
-                # Calculate Q1
-                q1_pos = n // 4
-                if n % 4 == 0 and q1_pos > 0:
-                    q1 = (sorted_counts[q1_pos - 1] + sorted_counts[q1_pos]) / 2
-                else:
-                    q1 = sorted_counts[q1_pos] if q1_pos < n else 0
+        ``year_counts`` maps each year with sightings of the species to its twelve
+        monthly counts; the statistics run column-wise over that years x months
+        matrix, sorting each month's column once.
 
-                # Calculate Q3
-                q3_pos = (3 * n) // 4
-                if n % 4 == 0 and q3_pos < n:
-                    q3 = (sorted_counts[q3_pos - 1] + sorted_counts[q3_pos]) / 2
-                else:
-                    q3 = sorted_counts[min(q3_pos, n - 1)] if n > 0 else 0
+        The quantiles stay in Python rather than percentile_cont: the matrix
+        holds only a few numbers per species, its zero months come from years
+        without a row for that month, and _upper_quartile keeps the legacy Q3
+        rule, which differs from linear interpolation.
+        """
+        month_columns = [sorted(column) for column in zip(*year_counts.values())]
 
-                max_count = max(sorted_counts)
-
-            medians.append(median)
-            q3s.append(q3)
+        medians = [_median(column) for column in month_columns]
+        q3s = [_upper_quartile(column) for column in month_columns]
 
         # Find the maximum value for normalization
         max_value = max(q3s) if any(q3s) else 1
 
-        # Create seasonal counts
-        for month in range(1, 13):
-            median = medians[month - 1]
-            q1 = 0  # Simplified for now
-            q3 = q3s[month - 1]
-            max_count = max(month_counts[month]) if month_counts[month] else 0
-            recent_count = recent_counts.get(month, 0)
-
-            seasonal_count = SeasonalCount(
+        return [
+            SeasonalCount(
                 species=species,
                 month=month,
                 absolute_avg=round(median),
                 relative_avg=round(median / max_value, 2) if max_value > 0 else 0,
-                q1_avg=round(q1),
+                q1_avg=0,  # Simplified for now
                 q3_avg=round(q3),
-                max_count=round(max_count),
-                recent_count=round(recent_count),
+                max_count=column[-1] if column else 0,
+                recent_count=recent_counts.get(month, 0),
+            )
+            for month, (column, median, q3) in enumerate(
+                zip(month_columns, medians, q3s), start=1
             )
-            seasonal_counts.append(seasonal_count)
+        ]
+
 
-        return seasonal_counts
+def _median(sorted_counts: List[int]) -> float:
+    """Median of an already sorted list (0 when empty)"""
+    n = len(sorted_counts)
+    if n == 0:
+        return 0
+    if n % 2 == 0:
+        return (sorted_counts[n // 2 - 1] + sorted_counts[n // 2]) / 2
+    return sorted_counts[n // 2]
+
+
+def _upper_quartile(sorted_counts: List[int]) -> float:
+    """Q3 of an already sorted list (0 when empty)"""
+    n = len(sorted_counts)
+    if n == 0:
+        return 0
+    q3_pos = (3 * n) // 4
+    if n % 4 == 0:
+        return (sorted_counts[q3_pos - 1] + sorted_counts[q3_pos]) / 2
+    return sorted_counts[min(q3_pos, n - 1)]
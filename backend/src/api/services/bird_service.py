@@ -4,12 +4,20 @@ Bird service layer for bird-centric operations (bird meta by ring)
 
 from collections import Counter
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from sqlalchemy.orm import Session
 
 from ...database.repositories import SightingRepository, RingingRepository
 from ...database.family_repository import FamilyRepository
+from ...database.models import Sighting as SightingDB, Ringing as RingingDB
+from ...utils.cache import get_bird_cached_data
+from ...utils.ring_index import (
+    RingIndex,
+    RingSummary,
+    get_ring_index,
+    matches_partial_reading,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +32,52 @@ class BirdService:
         self.family_repository = FamilyRepository(db)
 
     def get_bird_meta_by_ring(self, ring: str, org_id: str) -> Dict[str, Any]:
-        """Get bird metadata for a specific ring in the shape expected by the frontend"""
-        # Get all sightings for this ring
-        sightings = self.sighting_repository.get_by_ring(ring, org_id)
+        """Get bird metadata for a specific ring in the shape expected by the frontend
 
-        # Get ringing data if available
-        ringing = self.ringing_repository.get_by_ring(ring, org_id)
+        Cached per bird; writes to the ring's sightings, ringing or relationships
+        invalidate it.
+        """
+        return get_bird_cached_data(
+            org_id, ring, lambda: self.get_bird_metas_by_rings([ring], org_id)[ring]
+        )
+
+    def get_bird_metas_by_rings(
+        self, rings: List[str], org_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get bird metadata for several rings with a fixed number of queries.
+
+        Sightings, ringings, partners and children are each loaded for all rings
+        at once; the result maps every requested ring to its bird meta.
+        """
+        rings = list(dict.fromkeys(rings))
+        sightings_by_ring = self.sighting_repository.get_by_rings(rings, org_id)
+        ringing_by_ring = self.ringing_repository.get_by_rings(rings, org_id)
+
+        # Family data is only shown for birds we know anything about
+        known = [r for r in rings if sightings_by_ring[r] or r in ringing_by_ring]
+        partners = self.family_repository.get_partners_by_rings(org_id, known)
+        children = self.family_repository.get_children_by_rings(org_id, known)
+
+        return {
+            ring: self._build_bird_meta(
+                ring,
+                sightings_by_ring[ring],
+                ringing_by_ring.get(ring),
+                partners.get(ring, []),
+                children.get(ring, []),
+            )
+            for ring in rings
+        }
 
+    def _build_bird_meta(
+        self,
+        ring: str,
+        sightings: List[SightingDB],
+        ringing: Optional[RingingDB],
+        partners: List[Dict[str, Any]],
+        children: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Assemble the bird meta dict from already loaded rows"""
         if not sightings and not ringing:
             return {
                 "ring": ring,
@@ -97,10 +144,6 @@ class BirdService:
                 }
             )
 
-        # Get partners from family tree (placeholder for now)
-        partners = self.family_repository.get_partners(org_id=org_id, bird_ring=ring)
-        children = self.family_repository.get_children(org_id=org_id, parent_ring=ring)
-
         return {
             "ring": ring,
             "species": species,
@@ -116,90 +159,59 @@ class BirdService:
         }
 
     def get_bird_suggestions_by_partial_reading(
-        self, partial_reading: str, org_id: str
+        self, partial_reading: str, org_id: str, limit: int = 30
     ) -> List[Dict[str, Any]]:
         """Return a list of bird suggestions by partial ring reading.
-        Partial reading can be only front, back, outer or middle reading."""
-
-        # Normalize partial reading (replace ... and … with *)
-        partial_reading = partial_reading.replace("...", "*").replace("…", "*")
-
-        # Get all sightings from the database
-        all_sightings = self.sighting_repository.get_all(org_id)
-
-        suggestions = {}
-
-        for sighting in all_sightings:
-            if len(suggestions) >= 30:  # Limit to 30 suggestions
-                break
-
-            if sighting.ring and self._is_suggestion(partial_reading, sighting.ring):
-                if sighting.ring not in suggestions:
-                    suggestions[sighting.ring] = {
-                        "ring": sighting.ring,
-                        "species": [sighting.species],
-                        "sighting_count": 1,
-                        "last_seen": sighting.date,
-                        "first_seen": sighting.date,
-                    }
-                else:
-                    suggestions[sighting.ring]["sighting_count"] += 1
-                    suggestions[sighting.ring]["species"].append(sighting.species)
-                    suggestions[sighting.ring]["last_seen"] = self._max_or_none(
-                        suggestions[sighting.ring]["last_seen"], sighting.date
-                    )
-                    suggestions[sighting.ring]["first_seen"] = self._min_or_none(
-                        suggestions[sighting.ring]["first_seen"], sighting.date
-                    )
-
-        # Convert to the expected format
-        suggestion_birds = []
-        for suggestion in suggestions.values():
-            # Find most common species
-            from collections import Counter
-
-            species_counter = Counter(suggestion["species"])
-            most_common_species = (
-                species_counter.most_common(1)[0][0] if species_counter else None
+        Partial reading can be only front, back, outer or middle reading.
+
+        Served from the org's cached ring index, so no sightings are scanned.
+        """
+        index = get_ring_index(org_id, lambda: self._build_ring_index(org_id))
+        matches = sorted(
+            index.match(partial_reading),
+            key=lambda s: (-s.sighting_count, s.ring),
+        )[:limit]
+        return [
+            {
+                "ring": summary.ring,
+                "species": summary.species,
+                "sighting_count": summary.sighting_count,
+                "last_seen": summary.last_seen.isoformat()
+                if summary.last_seen
+                else None,
+                "first_seen": summary.first_seen.isoformat()
+                if summary.first_seen
+                else None,
+            }
+            for summary in matches
+        ]
+
+    def _build_ring_index(self, org_id: str) -> RingIndex:
+        """Build the ring index of an org from one grouped query"""
+        rows = self.sighting_repository.get_ring_species_counts(org_id)
+        per_ring: Dict[str, Dict[str, Any]] = {}
+        for ring, species, count, first, last in rows:
+            entry = per_ring.setdefault(
+                ring, {"species": Counter(), "first": None, "last": None}
             )
-
-            suggestion_birds.append(
-                {
-                    "ring": suggestion["ring"],
-                    "species": most_common_species,
-                    "sighting_count": suggestion["sighting_count"],
-                    "last_seen": suggestion["last_seen"].isoformat()
-                    if suggestion["last_seen"]
-                    else None,
-                    "first_seen": suggestion["first_seen"].isoformat()
-                    if suggestion["first_seen"]
-                    else None,
-                }
+            entry["species"][species] += count
+            entry["first"] = self._min_or_none(entry["first"], first)
+            entry["last"] = self._max_or_none(entry["last"], last)
+
+        return RingIndex(
+            RingSummary(
+                ring=ring,
+                species=entry["species"].most_common(1)[0][0],
+                sighting_count=sum(entry["species"].values()),
+                first_seen=entry["first"],
+                last_seen=entry["last"],
             )
-
-        # Sort by sighting count descending
-        return sorted(suggestion_birds, key=lambda x: x["sighting_count"], reverse=True)
+            for ring, entry in per_ring.items()
+        )
 
     def _is_suggestion(self, partial_reading: str, ring: str) -> bool:
         """Check if a ring matches the partial reading pattern"""
-        # Case 1: Partial reading is missing both outer endings *8043*
-        if partial_reading.startswith("*") and partial_reading.endswith("*"):
-            if partial_reading[1:-1] in ring:
-                return True
-        # Case 2: Partial reading is missing ending 280*
-        elif partial_reading.endswith("*"):
-            if ring.startswith(partial_reading[:-1]):
-                return True
-        # Case 3: Partial reading is missing starting *35
-        elif partial_reading.startswith("*"):
-            if ring.endswith(partial_reading[1:]):
-                return True
-        # Case 4: Partial reading is missing middle 28*35
-        elif "*" in partial_reading:
-            start, end = partial_reading.split("*", 1)  # Split only on first *
-            if ring.startswith(start) and ring.endswith(end):
-                return True
-        return False
+        return matches_partial_reading(partial_reading, ring)
 
     def _max_or_none(self, a, b):
         """Return the maximum of two values, handling None values"""
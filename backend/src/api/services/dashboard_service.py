@@ -0,0 +1,107 @@
+"""
+Dashboard service layer - overview counters computed in a few aggregate queries
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import desc, func
+from sqlalchemy.orm import Session
+
+from ...database.models import Sighting
+from ...utils.cache import get_org_cached_data
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardService:
+    """Service for the dashboard overview using PostgreSQL"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_dashboard(self, org_id: str, days: int = 30) -> Dict[str, Any]:
+        """Get the dashboard overview for an org, cached per org data version
+
+        The key also carries the day, so "today"/"this week" roll over at midnight.
+        """
+        today = date.today()
+        return get_org_cached_data(
+            org_id,
+            f"dashboard:{days}:{today.isoformat()}",
+            lambda: self._build_dashboard(org_id, days, today),
+        )
+
+    def _build_dashboard(self, org_id: str, days: int, today: date) -> Dict[str, Any]:
+        this_week_start = today - timedelta(days=today.weekday())
+        last_week_start = this_week_start - timedelta(days=7)
+        yesterday = today - timedelta(days=1)
+
+        # All counters in one pass over the org's sightings
+        counts = (
+            self.db.query(
+                func.count().filter(
+                    Sighting.date >= this_week_start, Sighting.date <= today
+                ),
+                func.count().filter(
+                    Sighting.date >= last_week_start, Sighting.date <= this_week_start
+                ),
+                func.count().filter(Sighting.date == today),
+                func.count().filter(Sighting.date == yesterday),
+                func.count(),
+                func.count(func.distinct(Sighting.ring)),
+            )
+            .filter(Sighting.org_id == org_id)
+            .one()
+        )
+
+        # Sightings per day, covering both the recent activity window and the
+        # current week (for the day streak)
+        activity_start = min(today - timedelta(days=days - 1), this_week_start)
+        per_day = dict(
+            self.db.query(Sighting.date, func.count())
+            .filter(
+                Sighting.org_id == org_id,
+                Sighting.date >= activity_start,
+                Sighting.date <= today,
+            )
+            .group_by(Sighting.date)
+            .all()
+        )
+
+        # Days of the current week with at least one sighting
+        day_streak = sum(1 for day in per_day if day >= this_week_start)
+
+        recent_activity: List[Dict[str, Any]] = []
+        for offset in range(days - 1, -1, -1):
+            day = today - timedelta(days=offset)
+            recent_activity.append(
+                {"date": day.isoformat(), "count": per_day.get(day, 0)}
+            )
+
+        return {
+            "count_sightings_this_week": counts[0],
+            "count_sightings_last_week": counts[1],
+            "count_sightings_today": counts[2],
+            "count_sightings_yesterday": counts[3],
+            "day_streak": day_streak,
+            "count_total_sightings": counts[4],
+            "count_total_unique_birds": counts[5],
+            "top_species": self._top_counts(org_id, Sighting.species),
+            "top_locations": self._top_counts(org_id, Sighting.place),
+            "recent_activity": recent_activity,
+        }
+
+    def _top_counts(self, org_id: str, column, limit: int = 10) -> Dict[Any, int]:
+        """Top values of a column with their sighting counts"""
+        count = func.count(column).label("count")
+        rows = (
+            self.db.query(column, count)
+            .filter(Sighting.org_id == org_id)
+            .group_by(column)
+            .order_by(desc("count"))
+            .limit(limit)
+            .all()
+        )
+        return {row[0]: row[1] for row in rows}
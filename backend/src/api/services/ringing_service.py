@@ -3,7 +3,7 @@ Ringing service layer - migrated from AWS Lambda to use PostgreSQL
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import date
 from sqlalchemy.orm import Session
 
@@ -52,6 +52,26 @@ class RingingService:
         """Search ringings with multiple filters"""
         return self.repository.search_ringings(filters, org_id)
 
+    def iter_ringings(
+        self, org_id: str, filters: Dict[str, Any]
+    ) -> Iterator[RingingDB]:
+        """Lazily iterate all matching ringings (for streaming responses)"""
+        return self.repository.iter_ringings(org_id, filters)
+
+    def get_ringing_changes(
+        self, org_id: str, token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get ringings changed and deleted since a sync token, and the next token"""
+        changed, tombstones, next_token = self.repository.get_changes(org_id, token)
+        return {
+            "changed": changed,
+            "deleted": [
+                {"id": t.record_id, "ring": t.ring, "deleted_at": t.deleted_at}
+                for t in tombstones
+            ],
+            "token": next_token,
+        }
+
     def upsert_ringing(self, org_id: str, ringing_data: Dict[str, Any]) -> RingingDB:
         """Insert or update a ringing record"""
         try:
@@ -101,13 +121,13 @@ class RingingService:
         """Get autocomplete suggestions for a field"""
         return self.repository.get_autocomplete_suggestions(field, query, limit)
 
-    def get_species_list(self) -> List[str]:
+    def get_species_list(self, org_id: str) -> List[str]:
         """Get list of all unique species from ringings"""
-        return self.repository.get_species_list()
+        return self.repository.get_species_list(org_id)
 
-    def get_ringer_list(self) -> List[str]:
+    def get_ringer_list(self, org_id: str) -> List[str]:
         """Get list of all unique ringers"""
-        return self.repository.get_ringer_list()
+        return self.repository.get_ringer_list(org_id)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get basic statistics about ringings"""
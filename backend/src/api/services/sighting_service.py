@@ -3,7 +3,7 @@ Sighting service layer - migrated from AWS Lambda to use PostgreSQL
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from datetime import date
 from sqlalchemy.orm import Session
 from uuid import uuid4
@@ -66,25 +66,18 @@ class SightingService:
         return self.repository.get_by_date_range(start_date, end_date, org_id)
 
     def get_sightings_by_radius(
-        self, lat: float, lon: float, radius_m: int, org_id: str
+        self,
+        lat: float,
+        lon: float,
+        radius_m: int,
+        org_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
     ) -> List[SightingDB]:
         """Get sightings within a radius of a location"""
-        # Get all sightings with location data
-        all_sightings = self.repository.get_all(org_id)
-
-        # Filter by radius using Haversine formula
-        from ...utils.distance import calculate_distance
-
-        result = []
-        for sighting in all_sightings:
-            if sighting.lat is not None and sighting.lon is not None:
-                distance = calculate_distance(
-                    float(sighting.lat), float(sighting.lon), lat, lon
-                )
-                if distance <= radius_m:
-                    result.append(sighting)
-
-        return result
+        return self.repository.get_within_radius(
+            org_id, lat, lon, radius_m, filters=filters, limit=limit
+        )
 
     def search_sightings(
         self, filters: Dict[str, Any], org_id: str
@@ -92,6 +85,38 @@ class SightingService:
         """Search sightings with multiple filters"""
         return self.repository.search_sightings(filters, org_id)
 
+    def iter_sightings(
+        self, org_id: str, filters: Dict[str, Any], enriched: bool = False
+    ) -> Iterator[SightingDB]:
+        """Lazily iterate all matching sightings (for streaming responses)"""
+        return self.repository.iter_sightings(org_id, filters, enriched=enriched)
+
+    def get_sightings_page(
+        self,
+        org_id: str,
+        filters: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str] = None,
+        enriched: bool = False,
+    ) -> Tuple[List[SightingDB], Optional[str]]:
+        """Get one keyset-paginated page of sightings and the next cursor"""
+        return self.repository.get_page(
+            org_id, filters, limit, cursor=cursor, enriched=enriched
+        )
+
+    def get_sighting_changes(
+        self, org_id: str, token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get sightings changed and deleted since a sync token, and the next token"""
+        changed, tombstones, next_token = self.repository.get_changes(org_id, token)
+        return {
+            "changed": changed,
+            "deleted": [
+                {"id": t.record_id, "deleted_at": t.deleted_at} for t in tombstones
+            ],
+            "token": next_token,
+        }
+
     def add_sighting(self, org_id: str, sighting_data: Dict[str, Any]) -> SightingDB:
         """Create a new sighting"""
         try:
@@ -107,6 +132,22 @@ class SightingService:
             logger.error(f"Error creating sighting: {e}")
             raise
 
+    def add_sightings(
+        self, org_id: str, sightings_data: List[Dict[str, Any]]
+    ) -> List[SightingDB]:
+        """Create several sightings with a single commit"""
+        try:
+            rows = [
+                {**data, "id": data.get("id") or uuid4()} for data in sightings_data
+            ]
+            sightings = self.repository.create_many(org_id, rows)
+            logger.info(f"Created {len(sightings)} sightings in one batch")
+            return sightings
+
+        except Exception as e:
+            logger.error(f"Error creating sighting batch: {e}")
+            raise
+
     def update_sighting(
         self, sighting_id: str, org_id: str, sighting_data: Dict[str, Any]
     ) -> Optional[SightingDB]:
@@ -154,17 +195,17 @@ class SightingService:
         """Get autocomplete suggestions for a field"""
         return self.repository.get_autocomplete_suggestions(field, query, limit)
 
-    def get_species_list(self) -> List[str]:
+    def get_species_list(self, org_id: str) -> List[str]:
         """Get list of all unique species"""
-        return self.repository.get_species_list()
+        return self.repository.get_species_list(org_id)
 
-    def get_place_list(self) -> List[str]:
+    def get_place_list(self, org_id: str) -> List[str]:
         """Get list of all unique places"""
-        return self.repository.get_place_list()
+        return self.repository.get_place_list(org_id)
 
-    def get_ring_list(self) -> List[str]:
+    def get_ring_list(self, org_id: str) -> List[str]:
         """Get list of all unique rings"""
-        return self.repository.get_ring_list()
+        return self.repository.get_ring_list(org_id)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get basic statistics about sightings"""
@@ -98,7 +98,8 @@ def get_db_session():
 
 def create_tables():
     """
-    Create all database tables and performance indexes
+    Create all database tables and performance indexes, and backfill the
+    suggestion counts of orgs that have none yet
     """
     try:
         # Import all models to ensure they're registered with Base
@@ -118,6 +119,8 @@ def create_tables():
         # Create performance indexes after tables are created
         create_performance_indexes()
 
+        backfill_suggestion_frequencies()
+
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
         raise
@@ -138,6 +141,23 @@ def create_performance_indexes():
         # Don't raise here as indexes might already exist
 
 
+def backfill_suggestion_frequencies():
+    """
+    Build the suggestion counts of orgs that have none yet (e.g. orgs that
+    predate the table), before any request reads them
+    """
+    from .suggestion_repository import SuggestionFrequencyRepository
+
+    try:
+        with get_db_session() as db:
+            backfilled = SuggestionFrequencyRepository(db).backfill_missing()
+        if backfilled:
+            logger.info(f"Backfilled suggestion frequencies of {backfilled} orgs")
+    except Exception as e:
+        logger.warning(f"Error backfilling suggestion frequencies: {e}")
+        # Don't raise: suggestions are aggregated until the backfill succeeds
+
+
 def check_connection():
     """
     Check database connection health
@@ -9,14 +9,28 @@ Storage convention (unidirectional):
 'child_of' is derived at query time — when the perspective bird is bird2 in a PARENT_OF record.
 """
 
+from collections import Counter, defaultdict
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import (
+    Integer,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+)
 from sqlalchemy.exc import IntegrityError
 from uuid import UUID
 import logging
 
 from .family_models import BirdRelationship, RelationshipType
+from .models import Ringing, Sighting
+from ..utils.cache import bump_bird_versions
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +116,7 @@ class FamilyRepository:
                     existing, sighting1_id, sighting2_id, ringing1_id, ringing2_id
                 )
             raise
+        bump_bird_versions(org_id, [bird1_ring, bird2_ring])
         self.db.refresh(relationship)
         return relationship
 
@@ -172,11 +187,26 @@ class FamilyRepository:
         """Delete a relationship by ID"""
         relationship = self.get_relationship_by_id(org_id, relationship_id)
         if relationship:
+            rings = [relationship.bird1_ring, relationship.bird2_ring]
             self.db.delete(relationship)
             self.db.commit()
+            bump_bird_versions(org_id, rings)
             return True
         return False
 
+    def update_relationship(
+        self, relationship: BirdRelationship, **changes: Any
+    ) -> BirdRelationship:
+        """Apply field changes (e.g. year, notes, relationship_type) and commit"""
+        for key, value in changes.items():
+            setattr(relationship, key, value)
+        org_id = relationship.org_id
+        rings = [relationship.bird1_ring, relationship.bird2_ring]
+        self.db.commit()
+        bump_bird_versions(org_id, rings)
+        self.db.refresh(relationship)
+        return relationship
+
     # ============= Display Type Helper =============
 
     def _get_display_type(
@@ -360,6 +390,80 @@ class FamilyRepository:
             for rel in relationships
         ]
 
+    def get_partners_by_rings(
+        self, org_id: str, bird_rings: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Batch variant of get_partners (unique per year) for several birds in one query."""
+        partners: Dict[str, List[Dict[str, Any]]] = {ring: [] for ring in bird_rings}
+        if not bird_rings:
+            return partners
+
+        relationships = (
+            self.db.query(BirdRelationship)
+            .filter(
+                BirdRelationship.org_id == org_id,
+                or_(
+                    BirdRelationship.bird1_ring.in_(bird_rings),
+                    BirdRelationship.bird2_ring.in_(bird_rings),
+                ),
+                BirdRelationship._relationship_type
+                == RelationshipType.BREEDING_PARTNER.value,
+            )
+            .order_by(BirdRelationship.year.desc())
+            .all()
+        )
+
+        seen: set[tuple[str, str, int]] = set()
+        for rel in relationships:
+            for ring, other in (
+                (rel.bird1_ring, rel.bird2_ring),
+                (rel.bird2_ring, rel.bird1_ring),
+            ):
+                if ring not in partners or (ring, other, rel.year) in seen:
+                    continue
+                seen.add((ring, other, rel.year))
+                partners[ring].append(
+                    {
+                        "ring": other,
+                        "year": rel.year,
+                        "confidence": rel.confidence,
+                        "source": rel.source,
+                        "notes": rel.notes,
+                    }
+                )
+        return partners
+
+    def get_children_by_rings(
+        self, org_id: str, parent_rings: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Batch variant of get_children for several parents in one query."""
+        children: Dict[str, List[Dict[str, Any]]] = {ring: [] for ring in parent_rings}
+        if not parent_rings:
+            return children
+
+        relationships = (
+            self.db.query(BirdRelationship)
+            .filter(
+                BirdRelationship.org_id == org_id,
+                BirdRelationship.bird1_ring.in_(parent_rings),
+                BirdRelationship._relationship_type == RelationshipType.PARENT_OF.value,
+            )
+            .order_by(BirdRelationship.year.desc())
+            .all()
+        )
+
+        for rel in relationships:
+            children[rel.bird1_ring].append(
+                {
+                    "ring": rel.bird2_ring,
+                    "year": rel.year,
+                    "confidence": rel.confidence,
+                    "source": rel.source,
+                    "notes": rel.notes,
+                }
+            )
+        return children
+
     def get_parents(
         self, org_id: str, child_ring: str, year: Optional[int] = None
     ) -> List[Dict[str, Any]]:
@@ -393,22 +497,14 @@ class FamilyRepository:
         year: Optional[int] = None,
         include_half_siblings: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Get all siblings of a bird (checks both bird1 and bird2)."""
-        if include_half_siblings:
-            parents = self.get_parents(org_id, bird_ring, year)
-            parent_rings = [p["ring"] for p in parents]
+        """Get all siblings of a bird (checks both bird1 and bird2).
 
-            if not parent_rings:
-                return []
-
-            siblings: set[tuple[str, int]] = set()
-            for parent_ring in parent_rings:
-                children = self.get_children(org_id, parent_ring, year)
-                for child in children:
-                    if child["ring"] != bird_ring:
-                        siblings.add((child["ring"], child["year"]))
-
-            return [{"ring": ring, "year": yr} for ring, yr in siblings]
+        With include_half_siblings, siblings are instead derived from parent_of
+        records: every other child of any of the bird's parents, flagged with
+        whether it shares two parents with the bird or only one.
+        """
+        if include_half_siblings:
+            return self._get_siblings_via_parents(org_id, bird_ring, year)
 
         # Direct sibling relationships — check both directions
         query = self.db.query(BirdRelationship).filter(
@@ -435,3 +531,356 @@ class FamilyRepository:
             }
             for rel in relationships
         ]
+
+    def _get_siblings_via_parents(
+        self, org_id: str, bird_ring: str, year: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Resolve (half-)siblings with one self-join on parent_of records:
+        the bird's parent records joined to all records of the same parents.
+        """
+        own = aliased(BirdRelationship)
+        other = aliased(BirdRelationship)
+        parent_of = RelationshipType.PARENT_OF.value
+
+        shared_parents = func.count(func.distinct(other.bird1_ring))
+        query = (
+            select(
+                other.bird2_ring.label("ring"),
+                other.year,
+                (shared_parents >= 2).label("shares_both_parents"),
+            )
+            .join(
+                own,
+                and_(
+                    own.org_id == other.org_id,
+                    own.bird1_ring == other.bird1_ring,
+                    own._relationship_type == parent_of,
+                ),
+            )
+            .where(
+                other.org_id == org_id,
+                other._relationship_type == parent_of,
+                other.bird2_ring != bird_ring,
+                own.bird2_ring == bird_ring,
+            )
+            .group_by(other.bird2_ring, other.year)
+            .order_by(other.year.desc(), other.bird2_ring)
+        )
+
+        if year:
+            query = query.where(own.year == year, other.year == year)
+
+        return [
+            {
+                "ring": row.ring,
+                "year": row.year,
+                "shares_both_parents": row.shares_both_parents,
+                "confidence": None,
+                "source": None,
+                "notes": None,
+            }
+            for row in self.db.execute(query)
+        ]
+
+    # ============= Family Tree =============
+
+    def get_family_tree(
+        self, org_id: str, bird_ring: str, max_generations: int = 3
+    ) -> Dict[str, Any]:
+        """Get a bird's family tree: ancestors and descendants up to max_generations,
+        plus its siblings and partners.
+
+        Two recursive CTEs collect the ancestor and descendant rings; the
+        relationships of the whole tree are then fetched in the same statement.
+        Species/sex/ringing data of all nodes is batch-loaded afterwards.
+        """
+        relationships = self._load_family_tree_relationships(
+            org_id, bird_ring, max_generations
+        )
+
+        parents_of: Dict[str, List[BirdRelationship]] = defaultdict(list)
+        children_of: Dict[str, List[BirdRelationship]] = defaultdict(list)
+        siblings: List[BirdRelationship] = []
+        partners: List[BirdRelationship] = []
+        for rel in relationships:
+            rel_type = rel.relationship_type
+            if rel_type == RelationshipType.PARENT_OF:
+                parents_of[rel.bird2_ring].append(rel)
+                children_of[rel.bird1_ring].append(rel)
+            elif rel_type == RelationshipType.SIBLING_OF:
+                siblings.append(rel)
+            else:
+                partners.append(rel)
+
+        rings = {bird_ring}
+        for rel in relationships:
+            rings.update((rel.bird1_ring, rel.bird2_ring))
+        meta = self._get_bird_tree_meta(org_id, rings)
+
+        def node(ring: str, rel: BirdRelationship) -> Dict[str, Any]:
+            return {
+                "ring": ring,
+                "year": rel.year,
+                "confidence": rel.confidence,
+                "source": rel.source,
+                "notes": rel.notes,
+                "species": meta[ring]["species"],
+                "sex": meta[ring]["sex"],
+            }
+
+        def lineage(ring: str, up: bool, depth: int, path: frozenset) -> List:
+            """Parents (up) or children of ``ring``, nested down to max_generations"""
+            edges = parents_of[ring] if up else children_of[ring]
+            key = "parents" if up else "children"
+            result = []
+            for rel in edges:
+                other = rel.bird1_ring if up else rel.bird2_ring
+                if other in path:
+                    continue  # inconsistent data (a bird as its own ancestor)
+                entry = node(other, rel)
+                entry[key] = (
+                    lineage(other, up, depth + 1, path | {other})
+                    if depth < max_generations
+                    else []
+                )
+                result.append(entry)
+            return result
+
+        seen_partners: set[tuple[str, int]] = set()
+        unique_partners = []
+        for rel in partners:
+            other = rel.bird2_ring if rel.bird1_ring == bird_ring else rel.bird1_ring
+            if (other, rel.year) not in seen_partners:
+                seen_partners.add((other, rel.year))
+                unique_partners.append(node(other, rel))
+
+        root = meta[bird_ring]
+        return {
+            "ring": bird_ring,
+            "species": root["species"],
+            "sex": root["sex"],
+            "ringing_date": root["ringing_date"],
+            "ringing_place": root["ringing_place"],
+            "parents": lineage(bird_ring, True, 1, frozenset({bird_ring})),
+            "children": lineage(bird_ring, False, 1, frozenset({bird_ring})),
+            "siblings": [
+                node(
+                    rel.bird2_ring if rel.bird1_ring == bird_ring else rel.bird1_ring,
+                    rel,
+                )
+                for rel in siblings
+            ],
+            "partners": unique_partners,
+        }
+
+    def _load_family_tree_relationships(
+        self, org_id: str, bird_ring: str, max_generations: int
+    ) -> List[BirdRelationship]:
+        """Load every relationship a family tree needs in one statement"""
+        parent_of = RelationshipType.PARENT_OF.value
+
+        def walk(name: str, from_col, to_col):
+            # Rings reachable from bird_ring over parent_of edges (from -> to). The
+            # seed is cast to the column type: PostgreSQL rejects a recursive CTE
+            # whose terms disagree (text vs. varchar)
+            start = select(
+                cast(literal(bird_ring), to_col.type).label("ring"),
+                cast(literal(0), Integer).label("depth"),
+            ).cte(name, recursive=True)
+            return start.union(
+                select(to_col, start.c.depth + 1).where(
+                    from_col == start.c.ring,
+                    BirdRelationship.org_id == org_id,
+                    BirdRelationship._relationship_type == parent_of,
+                    start.c.depth < max_generations,
+                )
+            )
+
+        ancestors = walk(
+            "ancestors", BirdRelationship.bird2_ring, BirdRelationship.bird1_ring
+        )
+        descendants = walk(
+            "descendants", BirdRelationship.bird1_ring, BirdRelationship.bird2_ring
+        )
+
+        return (
+            self.db.query(BirdRelationship)
+            .filter(
+                BirdRelationship.org_id == org_id,
+                or_(
+                    and_(
+                        BirdRelationship._relationship_type == parent_of,
+                        or_(
+                            BirdRelationship.bird2_ring.in_(
+                                select(ancestors.c.ring).where(
+                                    ancestors.c.depth < max_generations
+                                )
+                            ),
+                            BirdRelationship.bird1_ring.in_(
+                                select(descendants.c.ring).where(
+                                    descendants.c.depth < max_generations
+                                )
+                            ),
+                        ),
+                    ),
+                    and_(
+                        BirdRelationship._relationship_type != parent_of,
+                        or_(
+                            BirdRelationship.bird1_ring == bird_ring,
+                            BirdRelationship.bird2_ring == bird_ring,
+                        ),
+                    ),
+                ),
+            )
+            .order_by(BirdRelationship.year.desc(), BirdRelationship.id)
+            .all()
+        )
+
+    def _get_bird_tree_meta(
+        self, org_id: str, rings: set[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Species, sex and ringing date/place for many rings in two queries.
+
+        The ringing record wins; birds without one fall back to the most common
+        species/sex of their sightings.
+        """
+        ringings = {
+            r.ring: r
+            for r in self.db.query(Ringing).filter(
+                Ringing.org_id == org_id, Ringing.ring.in_(rings)
+            )
+        }
+
+        species_counts: Dict[str, Counter] = defaultdict(Counter)
+        sex_counts: Dict[str, Counter] = defaultdict(Counter)
+        sighting_rows = (
+            self.db.query(Sighting.ring, Sighting.species, Sighting.sex, func.count())
+            .filter(Sighting.org_id == org_id, Sighting.ring.in_(rings))
+            .group_by(Sighting.ring, Sighting.species, Sighting.sex)
+        )
+        for ring, species, sex, count in sighting_rows:
+            if species:
+                species_counts[ring][species] += count
+            if sex:  # 0 = unknown
+                sex_counts[ring][sex] += count
+
+        def most_common(counts: Counter):
+            return counts.most_common(1)[0][0] if counts else None
+
+        meta = {}
+        for ring in rings:
+            ringing = ringings.get(ring)
+            meta[ring] = {
+                "species": ringing.species
+                if ringing
+                else most_common(species_counts[ring]),
+                "sex": ringing.sex if ringing else most_common(sex_counts[ring]),
+                "ringing_date": ringing.date.isoformat()
+                if ringing and ringing.date
+                else None,
+                "ringing_place": ringing.place if ringing else None,
+            }
+        return meta
+
+    # ============= Relationship Statistics =============
+
+    def get_relationship_statistics(
+        self, org_id: str, bird_ring: str
+    ) -> Dict[str, Any]:
+        """Get partner/child/sibling counts, breeding years and locations of a bird"""
+        return self._get_relationship_statistics(org_id, [bird_ring])[bird_ring]
+
+    def get_all_relationship_statistics(self, org_id: str) -> Dict[str, Dict[str, Any]]:
+        """Relationship statistics of every bird of the org that has relationships"""
+        return self._get_relationship_statistics(org_id)
+
+    def _get_relationship_statistics(
+        self, org_id: str, bird_rings: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Relationship statistics of some birds (all of the org if None) in one query.
+
+        Every relationship yields facts from both birds' perspectives: the other
+        bird (as partner/child/parent/sibling) and, for breeding relationships
+        (partner, or parent of a chick), the year and the places of the linked
+        sightings and ringings. GROUP BY removes duplicates; the counts are then
+        the sizes of the distinct fact sets.
+        """
+        parent_of = RelationshipType.PARENT_OF.value
+        partner = RelationshipType.BREEDING_PARTNER.value
+        rel = BirdRelationship
+        links = [
+            (aliased(Sighting), rel.sighting1_id),
+            (aliased(Sighting), rel.sighting2_id),
+            (aliased(Ringing), rel.ringing1_id),
+            (aliased(Ringing), rel.ringing2_id),
+        ]
+
+        base = select(
+            rel.bird1_ring,
+            rel.bird2_ring,
+            rel._relationship_type.label("type"),
+            rel.year,
+            *(linked.place.label(f"place{i}") for i, (linked, _) in enumerate(links)),
+        ).where(rel.org_id == org_id)
+        for linked, link_id in links:
+            base = base.outerjoin(linked, linked.id == link_id)
+        if bird_rings is not None:
+            base = base.where(
+                or_(rel.bird1_ring.in_(bird_rings), rel.bird2_ring.in_(bird_rings))
+            )
+        base = base.cte("relationships")
+        places = [base.c[f"place{i}"] for i in range(len(links))]
+
+        facts = []
+        # bird1 of parent_of is the parent, bird2 the child
+        for ring, other, parent_of_kind, breeding_types in (
+            (base.c.bird1_ring, base.c.bird2_ring, "child", [partner, parent_of]),
+            (base.c.bird2_ring, base.c.bird1_ring, "parent", [partner]),
+        ):
+            kind = case(
+                (base.c.type == parent_of, parent_of_kind),
+                (base.c.type == partner, "partner"),
+                else_="sibling",
+            )
+            breeding = base.c.type.in_(breeding_types)
+            scope = [ring.in_(bird_rings)] if bird_rings is not None else []
+            facts.append(select(ring, kind, other).where(*scope))
+            facts.append(
+                select(ring, literal("year"), cast(base.c.year, String)).where(
+                    breeding, *scope
+                )
+            )
+            for place in places:
+                facts.append(
+                    select(ring, literal("place"), place).where(
+                        breeding, place.isnot(None), *scope
+                    )
+                )
+
+        fact = union_all(*facts).subquery("facts")
+        ring_col, kind_col, value_col = fact.c
+        rows = self.db.execute(
+            select(ring_col, kind_col, value_col).group_by(
+                ring_col, kind_col, value_col
+            )
+        )
+
+        grouped: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+        for ring, kind, value in rows:
+            grouped[ring][kind].add(value)
+
+        rings = bird_rings if bird_rings is not None else list(grouped)
+        statistics = {}
+        for ring in rings:
+            found = grouped.get(ring, {})
+            kinds = ("partner", "child", "sibling", "parent")
+            relatives = set().union(*(found.get(k, set()) for k in kinds))
+            statistics[ring] = {
+                "total_partners": len(found.get("partner", ())),
+                "total_children": len(found.get("child", ())),
+                "total_siblings": len(found.get("sibling", ())),
+                "breeding_years": sorted(int(y) for y in found.get("year", ())),
+                "breeding_locations": sorted(found.get("place", ())),
+                "family_size": len(relatives),
+            }
+        return statistics
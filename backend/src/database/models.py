@@ -112,6 +112,9 @@ class Ringing(Base):
         Index("idx_ringings_ringer", "ringer"),
         Index("idx_ringings_org_species_date", "org_id", "species", "date"),
         Index("idx_ringings_org_place", "org_id", "place"),
+        # Delta sync feed (rows changed since a token) per org. Added to an
+        # existing table, so also in scripts/migrate_add_indexes.py
+        Index("idx_ringings_org_updated_at", "org_id", "updated_at"),
     )
 
 
@@ -177,4 +180,77 @@ class Sighting(Base):
         Index("idx_sightings_org_species_date", "org_id", "species", "date"),
         Index("idx_sightings_org_ring_date", "org_id", "ring", "date"),
         Index("idx_sightings_org_place", "org_id", "place"),
+        # Bounding-box prefilter for radius searches
+        Index("idx_sightings_org_lat_lon", "org_id", "lat", "lon"),
+        # Keyset pagination (date DESC, created_at DESC, id DESC) per org. Like every
+        # index added to this existing table, also listed in
+        # scripts/migrate_add_indexes.py: create_all skips existing tables.
+        Index(
+            "idx_sightings_org_date_created_id", "org_id", "date", "created_at", "id"
+        ),
+        # Delta sync feed (rows changed since a token) per org
+        Index("idx_sightings_org_updated_at", "org_id", "updated_at"),
+    )
+
+
+class Tombstone(Base):
+    """Marker left behind by a deleted sighting or ringing
+
+    Lets the delta sync feeds tell clients which rows to drop from their local
+    copy; the row itself is gone, so only its id (and ring for ringings) is kept.
+    """
+
+    __tablename__ = "tombstones"
+
+    id = Column(GUID(), primary_key=True, default=uuid4)
+    org_id = Column(GUID(), ForeignKey("organizations.id"), nullable=False)
+    entity = Column(String(20), nullable=False)  # "sighting" or "ringing"
+    record_id = Column(GUID(), nullable=False)
+    ring = Column(String(50))  # Ring number of a deleted ringing
+    deleted_at = Column(
+        TIMESTAMP, nullable=False, server_default=func.current_timestamp()
+    )
+
+    __table_args__ = (
+        Index("idx_tombstones_org_entity_deleted_at", "org_id", "entity", "deleted_at"),
+    )
+
+
+class SuggestionFrequency(Base):
+    """How often a value occurs in a suggestion field of an org (e.g. a place)
+
+    Kept up to date by the sighting/ringing repositories on every write, so the
+    suggestion lists are one indexed read instead of a GROUP BY per field.
+    """
+
+    __tablename__ = "suggestion_frequencies"
+
+    org_id = Column(GUID(), ForeignKey("organizations.id"), primary_key=True)
+    field = Column(String(20), primary_key=True)
+    value = Column(String(200), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+# Serves "WHERE org_id = ? ORDER BY field, count DESC, value" without a sort
+Index(
+    "idx_suggestion_frequencies_org_field_count",
+    SuggestionFrequency.org_id,
+    SuggestionFrequency.field,
+    SuggestionFrequency.count.desc(),
+    SuggestionFrequency.value,
+)
+
+
+class SuggestionFrequencyBackfill(Base):
+    """Marks an org whose suggestion frequencies have been counted from scratch
+
+    Until then its counts are not maintained by writes, and the suggestion lists
+    are aggregated from sightings and ringings instead.
+    """
+
+    __tablename__ = "suggestion_frequency_backfills"
+
+    org_id = Column(GUID(), ForeignKey("organizations.id"), primary_key=True)
+    backfilled_at = Column(
+        TIMESTAMP, nullable=False, server_default=func.current_timestamp()
     )
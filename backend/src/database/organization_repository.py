@@ -10,6 +10,7 @@ from sqlalchemy.exc import IntegrityError
 
 from .user_models import User
 from .organization_models import Organization
+from .suggestion_repository import SuggestionFrequencyRepository
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +142,9 @@ class OrganizationRepository:
         try:
             org = Organization(**kwargs)
             self.db.add(org)
+            self.db.flush()
+            # A new org has no records yet, so its suggestion counts are complete
+            SuggestionFrequencyRepository(self.db).mark_backfilled(org.id)
             self.db.commit()
             self.db.refresh(org)
             logger.info(f"Created new organization: {org.name}")
@@ -3,25 +3,79 @@ Database repository layer for data access operations
 """
 
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import date
+from collections import Counter
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from datetime import date, datetime, timedelta
+from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, extract
 from sqlalchemy.exc import IntegrityError
 
-from .models import Sighting, Ringing
-from ..utils.cache import get_cached_data
+from .models import Sighting, Ringing, Tombstone
+from .suggestion_repository import (
+    RINGING_SUGGESTION_FIELDS,
+    SIGHTING_SUGGESTION_FIELDS,
+    SuggestionFrequencyRepository,
+    suggestion_values,
+)
+from ..utils.cache import bump_bird_versions, bump_org_version, get_org_cached_data
+from ..utils.distance import bounding_box, haversine_sql
+from ..utils.pagination import decode_cursor, encode_cursor, keyset_after
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming large listings
+STREAM_BATCH_SIZE = 500
+
+# Cursor value parsers for the (date, created_at, id) sighting sort key
+_SIGHTING_CURSOR_PARSERS = (date.fromisoformat, datetime.fromisoformat, UUID)
+
+# How far a sync token's window reaches back before the token's time. Timestamps
+# are taken at transaction start, so a row can commit with an updated_at older
+# than a token handed out in the meantime; re-sending it is harmless.
+SYNC_OVERLAP = timedelta(minutes=1)
+
+# Sync token value parser (the database time of the previous read)
+_SYNC_TOKEN_PARSERS = (datetime.fromisoformat,)
+
 
 class BaseRepository:
     """Base repository class with common operations"""
 
+    # Suggestion field -> column whose values writes count in the frequency table
+    suggestion_fields: Dict[str, str] = {}
+
+    # Tombstone entity recorded when a record is deleted (None: not tracked)
+    tombstone_entity: Optional[str] = None
+
+    # Column holding the ring of the bird a record belongs to; writes invalidate
+    # that bird's cached summary (None: records don't belong to a bird)
+    bird_ring_field: Optional[str] = None
+
     def __init__(self, db: Session, model_class):
         self.db = db
         self.model_class = model_class
 
+    def _tombstone(self, instance) -> Tombstone:
+        return Tombstone(
+            org_id=instance.org_id, entity=self.tombstone_entity, record_id=instance.id
+        )
+
+    def _bird_ring(self, instance) -> Optional[str]:
+        if self.bird_ring_field is None:
+            return None
+        return getattr(instance, self.bird_ring_field)
+
+    def _suggestion_values(self, instance) -> Counter:
+        return suggestion_values(instance, self.suggestion_fields)
+
+    def _track_suggestions(self, org_id: str, before: Counter, after: Counter):
+        """Apply the change of a record's suggestion values (before its commit)"""
+        deltas = Counter(after)
+        deltas.subtract(before)
+        if any(deltas.values()):
+            SuggestionFrequencyRepository(self.db).apply(org_id, deltas)
+
     def get_by_id(self, id: str, org_id: str):
         """Get record by ID within organization"""
         return (
@@ -36,13 +90,38 @@ class BaseRepository:
             kwargs["org_id"] = org_id
             instance = self.model_class(**kwargs)
             self.db.add(instance)
+            self._track_suggestions(
+                org_id, Counter(), self._suggestion_values(instance)
+            )
+            ring = self._bird_ring(instance)
             self.db.commit()
+            bump_org_version(org_id)
+            bump_bird_versions(org_id, [ring])
             return instance
         except IntegrityError as e:
             self.db.rollback()
             logger.error(f"Error creating {self.model_class.__name__}: {e}")
             raise
 
+    def create_many(self, org_id: str, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Create several records in one transaction (batched into multi-row INSERTs)"""
+        try:
+            instances = [self.model_class(**row, org_id=org_id) for row in rows]
+            self.db.add_all(instances)
+            values = Counter()
+            for instance in instances:
+                values.update(self._suggestion_values(instance))
+            self._track_suggestions(org_id, Counter(), values)
+            rings = [self._bird_ring(instance) for instance in instances]
+            self.db.commit()
+            bump_org_version(org_id)
+            bump_bird_versions(org_id, rings)
+            return instances
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.error(f"Error creating {self.model_class.__name__} batch: {e}")
+            raise
+
     def update(self, id: str, org_id: str, **kwargs):
         """Update record by ID within organization"""
         try:
@@ -50,11 +129,17 @@ class BaseRepository:
             if not instance:
                 return None
 
+            before = self._suggestion_values(instance)
+            ring_before = self._bird_ring(instance)
             for key, value in kwargs.items():
                 if hasattr(instance, key):
                     setattr(instance, key, value)
 
+            self._track_suggestions(org_id, before, self._suggestion_values(instance))
+            rings = [ring_before, self._bird_ring(instance)]
             self.db.commit()
+            bump_org_version(org_id)
+            bump_bird_versions(org_id, rings)
             return instance
         except IntegrityError as e:
             self.db.rollback()
@@ -66,8 +151,16 @@ class BaseRepository:
         try:
             instance = self.get_by_id(id, org_id)
             if instance:
+                self._track_suggestions(
+                    org_id, self._suggestion_values(instance), Counter()
+                )
+                if self.tombstone_entity:
+                    self.db.add(self._tombstone(instance))
+                ring = self._bird_ring(instance)
                 self.db.delete(instance)
                 self.db.commit()
+                bump_org_version(org_id)
+                bump_bird_versions(org_id, [ring])
                 return True
             return False
         except IntegrityError as e:
@@ -75,10 +168,51 @@ class BaseRepository:
             logger.error(f"Error deleting {self.model_class.__name__}: {e}")
             raise
 
+    def get_changes(
+        self, org_id: str, token: Optional[str] = None
+    ) -> Tuple[List[Any], List[Tombstone], str]:
+        """Get the records changed and the tombstones left since a sync token.
+
+        Without a token every record is returned (the initial snapshot). Returns
+        the changed records ordered by ``updated_at``, the tombstones and the token
+        for the next call. Clients should drop the tombstoned records first and
+        then upsert the changed ones. Raises InvalidCursorError for a bad token.
+        """
+        model = self.model_class
+        # Database time, so tokens compare against the same clock as updated_at
+        now = self.db.query(func.current_timestamp()).scalar()
+        if now.tzinfo is not None:
+            # TIMESTAMP columns hold the session's local time without a zone
+            now = now.replace(tzinfo=None)
+
+        changed = self.db.query(model).filter(model.org_id == org_id)
+        tombstones = []
+        if token:
+            (since,) = decode_cursor(token, _SYNC_TOKEN_PARSERS)
+            window_start = since - SYNC_OVERLAP
+            changed = changed.filter(model.updated_at >= window_start)
+            tombstones = (
+                self.db.query(Tombstone)
+                .filter(
+                    Tombstone.org_id == org_id,
+                    Tombstone.entity == self.tombstone_entity,
+                    Tombstone.deleted_at >= window_start,
+                )
+                .order_by(Tombstone.deleted_at)
+                .all()
+            )
+
+        rows = changed.order_by(model.updated_at, model.id).all()
+        return rows, tombstones, encode_cursor([now])
+
 
 class SightingRepository(BaseRepository):
     """Repository for sighting data operations"""
 
+    suggestion_fields = SIGHTING_SUGGESTION_FIELDS
+    tombstone_entity = "sighting"
+    bird_ring_field = "ring"
+
     def __init__(self, db: Session):
         super().__init__(db, Sighting)
 
@@ -129,6 +263,114 @@ class SightingRepository(BaseRepository):
             .all()
         )
 
+    def get_by_rings(self, rings: List[str], org_id: str) -> Dict[str, List[Sighting]]:
+        """Get the sightings of several rings in one query, grouped by ring"""
+        by_ring: Dict[str, List[Sighting]] = {ring: [] for ring in rings}
+        if not rings:
+            return by_ring
+        sightings = (
+            self.db.query(Sighting)
+            .filter(Sighting.ring.in_(rings), Sighting.org_id == org_id)
+            .order_by(desc(Sighting.date))
+            .all()
+        )
+        for sighting in sightings:
+            by_ring[sighting.ring].append(sighting)
+        return by_ring
+
+    def get_ring_species_counts(
+        self, org_id: str
+    ) -> List[Tuple[str, Optional[str], int, Optional[date], Optional[date]]]:
+        """Summarize the org's ringed sightings per ring and species.
+
+        Returns (ring, species, count, first date, last date) rows.
+        """
+        rows = (
+            self.db.query(
+                Sighting.ring,
+                Sighting.species,
+                func.count(),
+                func.min(Sighting.date),
+                func.max(Sighting.date),
+            )
+            .filter(Sighting.org_id == org_id, Sighting.ring.isnot(None))
+            .group_by(Sighting.ring, Sighting.species)
+            .all()
+        )
+        return [tuple(row) for row in rows]
+
+    def get_co_sighted_rings(
+        self, ring: str, org_id: str, min_shared: int = 1, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Get the rings most often sighted at the same place on the same day as ring.
+
+        One self-join over the distinct (place, date) pairs of the ring's sightings,
+        grouped by the other ring. Returns (ring, shared sighting count) pairs with
+        at least min_shared shared sightings, most shared first.
+        """
+        target_spots = (
+            self.db.query(Sighting.place, Sighting.date)
+            .filter(
+                Sighting.org_id == org_id,
+                Sighting.ring == ring,
+                Sighting.place.isnot(None),
+                Sighting.date.isnot(None),
+            )
+            .distinct()
+            .subquery()
+        )
+        shared = func.count(Sighting.id)
+        rows = (
+            self.db.query(Sighting.ring, shared)
+            .join(
+                target_spots,
+                and_(
+                    Sighting.place == target_spots.c.place,
+                    Sighting.date == target_spots.c.date,
+                ),
+            )
+            .filter(
+                Sighting.org_id == org_id,
+                Sighting.ring != ring,
+                Sighting.ring.isnot(None),
+            )
+            .group_by(Sighting.ring)
+            .having(shared >= min_shared)
+            .order_by(shared.desc(), Sighting.ring)
+            .limit(limit)
+            .all()
+        )
+        return [(row[0], row[1]) for row in rows]
+
+    def get_species_month_counts(
+        self,
+        org_id: str,
+        species: Optional[str] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> List[Tuple[str, int, int, int]]:
+        """Count sightings per species, year and month in the database.
+
+        Returns (species, year, month, count) rows; sightings without species or
+        date are skipped. The year range is inclusive on both ends.
+        """
+        year = extract("year", Sighting.date)
+        month = extract("month", Sighting.date)
+        query = self.db.query(Sighting.species, year, month, func.count()).filter(
+            Sighting.org_id == org_id,
+            Sighting.species.isnot(None),
+            Sighting.date.isnot(None),
+        )
+        if species:
+            query = query.filter(Sighting.species == species)
+        if start_year is not None:
+            query = query.filter(Sighting.date >= date(start_year, 1, 1))
+        if end_year is not None:
+            query = query.filter(Sighting.date <= date(end_year, 12, 31))
+
+        rows = query.group_by(Sighting.species, year, month).all()
+        return [(row[0], int(row[1]), int(row[2]), row[3]) for row in rows]
+
     def get_by_species(self, species: str, org_id: str) -> List[Sighting]:
         """Get all sightings for a specific species"""
         return (
@@ -164,10 +406,136 @@ class SightingRepository(BaseRepository):
             .all()
         )
 
+    def get_within_radius(
+        self,
+        org_id: str,
+        lat: float,
+        lon: float,
+        radius_m: float,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Sighting]:
+        """Get sightings within radius_m meters of a point, newest first.
+
+        A lat/lon bounding box narrows the rows via the (org_id, lat, lon) index,
+        then the exact Haversine distance is checked in the same query.
+        """
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_m)
+
+        query = self._apply_search_filters(
+            self.db.query(Sighting).filter(
+                Sighting.org_id == org_id,
+                Sighting.lat.between(min_lat, max_lat),
+                Sighting.lon.between(min_lon, max_lon),
+                haversine_sql(Sighting.lat, Sighting.lon, lat, lon) <= radius_m,
+            ),
+            filters or {},
+        )
+        query = query.order_by(desc(Sighting.date), desc(Sighting.created_at))
+
+        if limit:
+            query = query.limit(limit)
+
+        return query.all()
+
     def search_sightings(self, filters: Dict[str, Any], org_id: str) -> List[Sighting]:
         """Search sightings with multiple filters using optimized queries"""
-        query = self.db.query(Sighting).filter(Sighting.org_id == org_id)
+        query = self._apply_search_filters(
+            self.db.query(Sighting).filter(Sighting.org_id == org_id), filters
+        )
+
+        # Use composite index for species+date or place+date when possible
+        if filters.get("species") and (
+            filters.get("start_date") or filters.get("end_date")
+        ):
+            return query.order_by(Sighting.species, desc(Sighting.date)).all()
+        elif filters.get("place") and (
+            filters.get("start_date") or filters.get("end_date")
+        ):
+            return query.order_by(Sighting.place, desc(Sighting.date)).all()
+        else:
+            return query.order_by(desc(Sighting.date)).all()
+
+    def get_page(
+        self,
+        org_id: str,
+        filters: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str] = None,
+        enriched: bool = False,
+    ) -> Tuple[List[Sighting], Optional[str]]:
+        """Get one keyset-paginated page of sightings.
+
+        Rows are ordered by ``date DESC, created_at DESC, id DESC`` (NULLs first,
+        as PostgreSQL sorts them by default for DESC).
+        Returns the page and the cursor for the next page (None on the last page).
+        Raises InvalidCursorError for a malformed cursor.
+        """
+        query = self._apply_search_filters(
+            self.db.query(Sighting).filter(Sighting.org_id == org_id), filters
+        )
+        if enriched:
+            query = query.options(joinedload(Sighting.ringing_data))
+
+        if cursor:
+            last_date, last_created_at, last_id = decode_cursor(
+                cursor, _SIGHTING_CURSOR_PARSERS
+            )
+            query = query.filter(
+                keyset_after(
+                    [
+                        (Sighting.date, last_date),
+                        (Sighting.created_at, last_created_at),
+                        (Sighting.id, last_id),
+                    ]
+                )
+            )
+
+        # Fetch one extra row to know whether another page follows
+        rows = (
+            query.order_by(
+                Sighting.date.desc().nulls_first(),
+                Sighting.created_at.desc().nulls_first(),
+                Sighting.id.desc(),
+            )
+            .limit(limit + 1)
+            .all()
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor([last.date, last.created_at, last.id])
 
+        return rows, next_cursor
+
+    def iter_sightings(
+        self,
+        org_id: str,
+        filters: Dict[str, Any],
+        enriched: bool = False,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Sighting]:
+        """Iterate all matching sightings in batches via a server-side cursor.
+
+        Same filters and order as get_page, but nothing is materialized up front,
+        so memory stays bounded by ``batch_size`` regardless of the org's size.
+        """
+        query = self._apply_search_filters(
+            self.db.query(Sighting).filter(Sighting.org_id == org_id), filters
+        )
+        if enriched:
+            query = query.options(joinedload(Sighting.ringing_data))
+
+        return query.order_by(
+            Sighting.date.desc().nulls_first(),
+            Sighting.created_at.desc().nulls_first(),
+            Sighting.id.desc(),
+        ).yield_per(batch_size)
+
+    def _apply_search_filters(self, query, filters: Dict[str, Any]):
+        """Apply the search_sightings filters to a sighting query"""
         # Apply filters with case-insensitive search for better performance
         if filters.get("species"):
             query = query.filter(
@@ -201,17 +569,7 @@ class SightingRepository(BaseRepository):
                 func.lower(Sighting.melder).like(f"%{filters['melder'].lower()}%")
             )
 
-        # Use composite index for species+date or place+date when possible
-        if filters.get("species") and (
-            filters.get("start_date") or filters.get("end_date")
-        ):
-            return query.order_by(Sighting.species, desc(Sighting.date)).all()
-        elif filters.get("place") and (
-            filters.get("start_date") or filters.get("end_date")
-        ):
-            return query.order_by(Sighting.place, desc(Sighting.date)).all()
-        else:
-            return query.order_by(desc(Sighting.date)).all()
+        return query
 
     def get_autocomplete_suggestions(
         self, field: str, query: str, limit: int = 10
@@ -242,50 +600,50 @@ class SightingRepository(BaseRepository):
 
         return [result[0] for result in results if result[0]]
 
-    def get_species_list(self) -> List[str]:
+    def get_species_list(self, org_id: str) -> List[str]:
         """Get list of all unique species with caching"""
 
         def fetch_species():
             results = (
                 self.db.query(Sighting.species)
-                .filter(Sighting.species.isnot(None))
+                .filter(Sighting.org_id == org_id, Sighting.species.isnot(None))
                 .distinct()
                 .order_by(func.lower(Sighting.species))
                 .all()
             )
             return [result[0] for result in results if result[0]]
 
-        return get_cached_data("sighting_species_list", fetch_species)
+        return get_org_cached_data(org_id, "sighting_species_list", fetch_species)
 
-    def get_place_list(self) -> List[str]:
+    def get_place_list(self, org_id: str) -> List[str]:
         """Get list of all unique places with caching"""
 
         def fetch_places():
             results = (
                 self.db.query(Sighting.place)
-                .filter(Sighting.place.isnot(None))
+                .filter(Sighting.org_id == org_id, Sighting.place.isnot(None))
                 .distinct()
                 .order_by(func.lower(Sighting.place))
                 .all()
             )
             return [result[0] for result in results if result[0]]
 
-        return get_cached_data("sighting_place_list", fetch_places)
+        return get_org_cached_data(org_id, "sighting_place_list", fetch_places)
 
-    def get_ring_list(self) -> List[str]:
+    def get_ring_list(self, org_id: str) -> List[str]:
         """Get list of all unique rings with caching"""
 
         def fetch_rings():
             results = (
                 self.db.query(Sighting.ring)
-                .filter(Sighting.ring.isnot(None))
+                .filter(Sighting.org_id == org_id, Sighting.ring.isnot(None))
                 .distinct()
                 .order_by(func.lower(Sighting.ring))
                 .all()
             )
             return [result[0] for result in results if result[0]]
 
-        return get_cached_data("sighting_ring_list", fetch_rings)
+        return get_org_cached_data(org_id, "sighting_ring_list", fetch_rings)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get basic statistics about sightings"""
@@ -331,9 +689,19 @@ class SightingRepository(BaseRepository):
 class RingingRepository(BaseRepository):
     """Repository for ringing data operations"""
 
+    suggestion_fields = RINGING_SUGGESTION_FIELDS
+    tombstone_entity = "ringing"
+    bird_ring_field = "ring"
+
     def __init__(self, db: Session):
         super().__init__(db, Ringing)
 
+    def _tombstone(self, instance) -> Tombstone:
+        # Clients key ringings by ring number, so keep it alongside the id
+        tombstone = super()._tombstone(instance)
+        tombstone.ring = instance.ring
+        return tombstone
+
     def get_all(
         self, org_id: str, limit: Optional[int] = None, offset: Optional[int] = None
     ) -> List[Ringing]:
@@ -359,6 +727,20 @@ class RingingRepository(BaseRepository):
             .first()
         )
 
+    def get_by_rings(self, rings: List[str], org_id: str) -> Dict[str, Ringing]:
+        """Get the ringings of several ring numbers in one query, keyed by ring"""
+        if not rings:
+            return {}
+        ringings = (
+            self.db.query(Ringing)
+            .filter(Ringing.ring.in_(rings), Ringing.org_id == org_id)
+            .all()
+        )
+        by_ring: Dict[str, Ringing] = {}
+        for ringing in ringings:
+            by_ring.setdefault(ringing.ring, ringing)
+        return by_ring
+
     def get_by_species(self, species: str, org_id: str) -> List[Ringing]:
         """Get all ringings for a specific species"""
         return (
@@ -405,8 +787,38 @@ class RingingRepository(BaseRepository):
 
     def search_ringings(self, filters: Dict[str, Any], org_id: str) -> List[Ringing]:
         """Search ringings with multiple filters using optimized queries"""
-        query = self.db.query(Ringing).filter(Ringing.org_id == org_id)
+        query = self._apply_search_filters(
+            self.db.query(Ringing).filter(Ringing.org_id == org_id), filters
+        )
+
+        # Use composite index for species+date or ringer+date when possible
+        if filters.get("species") and (
+            filters.get("start_date") or filters.get("end_date")
+        ):
+            return query.order_by(Ringing.species, desc(Ringing.date)).all()
+        elif filters.get("ringer") and (
+            filters.get("start_date") or filters.get("end_date")
+        ):
+            return query.order_by(Ringing.ringer, desc(Ringing.date)).all()
+        else:
+            return query.order_by(desc(Ringing.date)).all()
 
+    def iter_ringings(
+        self,
+        org_id: str,
+        filters: Dict[str, Any],
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Ringing]:
+        """Iterate all matching ringings in batches via a server-side cursor"""
+        query = self._apply_search_filters(
+            self.db.query(Ringing).filter(Ringing.org_id == org_id), filters
+        )
+        return query.order_by(
+            desc(Ringing.date), desc(Ringing.created_at), desc(Ringing.id)
+        ).yield_per(batch_size)
+
+    def _apply_search_filters(self, query, filters: Dict[str, Any]):
+        """Apply the search_ringings filters to a ringing query"""
         # Apply filters with case-insensitive search for better performance
         if filters.get("species"):
             query = query.filter(
@@ -440,17 +852,7 @@ class RingingRepository(BaseRepository):
         if filters.get("age") is not None:
             query = query.filter(Ringing.age == filters["age"])
 
-        # Use composite index for species+date or ringer+date when possible
-        if filters.get("species") and (
-            filters.get("start_date") or filters.get("end_date")
-        ):
-            return query.order_by(Ringing.species, desc(Ringing.date)).all()
-        elif filters.get("ringer") and (
-            filters.get("start_date") or filters.get("end_date")
-        ):
-            return query.order_by(Ringing.ringer, desc(Ringing.date)).all()
-        else:
-            return query.order_by(desc(Ringing.date)).all()
+        return query
 
     def upsert_ringing(self, ring: str, org_id: str, **kwargs) -> Ringing:
         """Insert or update ringing data"""
@@ -459,11 +861,18 @@ class RingingRepository(BaseRepository):
 
             if existing:
                 # Update existing record
+                before = self._suggestion_values(existing)
                 for key, value in kwargs.items():
                     if hasattr(existing, key):
                         setattr(existing, key, value)
 
+                self._track_suggestions(
+                    org_id, before, self._suggestion_values(existing)
+                )
+                rings = [ring, existing.ring]
                 self.db.commit()
+                bump_org_version(org_id)
+                bump_bird_versions(org_id, rings)
                 return existing
             else:
                 # Create new record
@@ -504,33 +913,35 @@ class RingingRepository(BaseRepository):
 
         return [result[0] for result in results if result[0]]
 
-    def get_species_list(self) -> List[str]:
+    def get_species_list(self, org_id: str) -> List[str]:
         """Get list of all unique species from ringings with caching"""
 
         def fetch_species():
             results = (
                 self.db.query(Ringing.species)
+                .filter(Ringing.org_id == org_id)
                 .distinct()
                 .order_by(func.lower(Ringing.species))
                 .all()
             )
             return [result[0] for result in results]
 
-        return get_cached_data("ringing_species_list", fetch_species)
+        return get_org_cached_data(org_id, "ringing_species_list", fetch_species)
 
-    def get_ringer_list(self) -> List[str]:
+    def get_ringer_list(self, org_id: str) -> List[str]:
         """Get list of all unique ringers with caching"""
 
         def fetch_ringers():
             results = (
                 self.db.query(Ringing.ringer)
+                .filter(Ringing.org_id == org_id)
                 .distinct()
                 .order_by(func.lower(Ringing.ringer))
                 .all()
             )
             return [result[0] for result in results]
 
-        return get_cached_data("ringing_ringer_list", fetch_ringers)
+        return get_org_cached_data(org_id, "ringing_ringer_list", fetch_ringers)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get basic statistics about ringings"""
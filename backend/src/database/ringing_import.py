@@ -0,0 +1,187 @@
+"""
+Set-based bulk import of ringings (PostgreSQL)
+
+Rows are loaded in chunks: each chunk is COPYed into a temporary staging table
+and merged into ``ringings`` with a single ``INSERT ... ON CONFLICT (ring)``.
+New rings are inserted in full; for existing rings of the org only the comment is
+updated (and only if it changed), matching the row-by-row import scripts.
+"""
+
+import csv
+import io
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import psycopg2
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .suggestion_repository import SuggestionFrequencyRepository
+
+logger = logging.getLogger(__name__)
+
+# Rows per COPY + merge; each chunk is committed on its own
+BULK_CHUNK_SIZE = 5000
+
+RINGING_IMPORT_COLUMNS = (
+    "ring",
+    "ring_scheme",
+    "species",
+    "date",
+    "place",
+    "lat",
+    "lon",
+    "ringer",
+    "sex",
+    "age",
+    "comment",
+)
+
+_STAGING_TABLE = "ringing_import_staging"
+_COPY_NULL = r"\N"
+
+# Rows are cleared on every commit, so each chunk starts from an empty table
+_CREATE_STAGING = f"""
+CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+    seq integer NOT NULL,
+    ring varchar(50),
+    ring_scheme varchar(50),
+    species varchar(100),
+    date date,
+    place varchar(200),
+    lat numeric(9, 6),
+    lon numeric(10, 6),
+    ringer varchar(100),
+    sex integer,
+    age integer,
+    comment text
+) ON COMMIT DELETE ROWS
+"""
+
+_COLUMN_LIST = ", ".join(RINGING_IMPORT_COLUMNS)
+
+# Rings of the chunk that already belong to another organization; ring numbers
+# are globally unique, so these cannot be imported
+_COUNT_FOREIGN = f"""
+SELECT count(DISTINCT s.ring)
+FROM {_STAGING_TABLE} s
+JOIN ringings r ON r.ring = s.ring AND r.org_id <> CAST(:org_id AS uuid)
+"""
+
+# The last row wins when a ring occurs more than once in a chunk. RETURNING only
+# reports inserted rows and changed comments; xmax = 0 marks a fresh insert.
+_MERGE = f"""
+INSERT INTO ringings (id, org_id, {_COLUMN_LIST})
+SELECT gen_random_uuid(), CAST(:org_id AS uuid), {_COLUMN_LIST}
+FROM (
+    SELECT DISTINCT ON (ring) *
+    FROM {_STAGING_TABLE}
+    ORDER BY ring, seq DESC
+) latest
+ON CONFLICT (ring) DO UPDATE
+SET comment = EXCLUDED.comment, updated_at = CURRENT_TIMESTAMP
+WHERE ringings.org_id = EXCLUDED.org_id
+  AND ringings.comment IS DISTINCT FROM EXCLUDED.comment
+RETURNING (xmax = 0) AS inserted
+"""
+
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of at most ``size`` items"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def copy_buffer(rows: Iterable[dict[str, Any]]) -> io.StringIO:
+    """Serialize ringing dicts as CSV for ``COPY ... (FORMAT csv)``
+
+    The first column is the row's position (for last-row-wins deduplication).
+    ``None`` is written as the ``_COPY_NULL`` marker, so empty strings stay empty.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for seq, row in enumerate(rows):
+        values = (row.get(col) for col in RINGING_IMPORT_COLUMNS)
+        writer.writerow([seq, *(_COPY_NULL if v is None else v for v in values)])
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_into_staging(db: Session, rows: list[dict[str, Any]]) -> None:
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {_STAGING_TABLE} (seq, {_COLUMN_LIST}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            copy_buffer(rows),
+        )
+    finally:
+        cursor.close()
+
+
+def bulk_upsert_ringings(
+    db: Session,
+    org_id: str,
+    rows: Iterable[dict[str, Any]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+    on_chunk: Callable[[int, dict[str, int]], None] | None = None,
+) -> dict[str, int]:
+    """Insert new ringings and update changed comments of existing ones, in chunks
+
+    A failing chunk is rolled back and counted in ``errors``; the import goes on
+    with the next chunk. ``on_chunk(chunk_number, stats)`` is called after every
+    chunk for progress reporting. Returns the accumulated statistics.
+    """
+    stats = {
+        "total_rows": 0,
+        "chunks": 0,
+        "new_ringings": 0,
+        "updated_comments": 0,
+        "unchanged": 0,
+        "errors": 0,
+    }
+
+    params = {"org_id": str(org_id)}
+    for number, chunk in enumerate(chunked(rows, chunk_size), start=1):
+        stats["total_rows"] += len(chunk)
+        stats["chunks"] += 1
+        try:
+            db.execute(text(_CREATE_STAGING))
+            _copy_into_staging(db, chunk)
+            foreign = db.execute(text(_COUNT_FOREIGN), params).scalar()
+            merged = db.execute(text(_MERGE), params).scalars().all()
+            db.commit()
+        except (SQLAlchemyError, psycopg2.Error) as e:
+            # COPY runs on the raw DBAPI cursor, so its errors are not wrapped
+            db.rollback()
+            stats["errors"] += len(chunk)
+            logger.error(f"Chunk {number}: import failed, {len(chunk)} rows: {e}")
+        else:
+            distinct_rings = len({row["ring"] for row in chunk})
+            inserted = sum(1 for is_new in merged if is_new)
+            stats["new_ringings"] += inserted
+            stats["updated_comments"] += len(merged) - inserted
+            stats["errors"] += foreign
+            stats["unchanged"] += distinct_rings - len(merged) - foreign
+            if foreign:
+                logger.warning(
+                    f"Chunk {number}: {foreign} rings belong to another organization"
+                )
+
+        if on_chunk is not None:
+            on_chunk(number, stats)
+
+    if stats["new_ringings"] or stats["updated_comments"]:
+        # The merge bypasses the repositories: recount ringers. This runs in the
+        # import script, so the API's cached data only catches up after its TTL.
+        SuggestionFrequencyRepository(db).rebuild(org_id)
+
+    return stats
@@ -0,0 +1,266 @@
+"""
+Repository for the per-org suggestion frequency table
+
+Every sighting/ringing write adjusts the counts of the values it adds or removes
+(in the same transaction), so the suggestion lists are read from one small,
+indexed table instead of aggregating all sightings per field. ``rebuild``
+recomputes the table from scratch, e.g. after a bulk import that bypassed the
+repositories.
+
+The counts are only read for orgs that have been backfilled: new orgs are
+marked on creation, existing ones are rebuilt at startup (``create_tables``) or
+by ``scripts/rebuild_suggestion_frequencies.py``. Until then, the lists are
+aggregated from sightings and ringings; reads never write.
+"""
+
+import logging
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import String, delete, func, literal, select, union, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from ..utils.cache import bump_org_version, clear_cache
+from .models import (
+    Ringing,
+    Sighting,
+    SuggestionFrequency,
+    SuggestionFrequencyBackfill,
+)
+from .organization_models import Organization
+
+logger = logging.getLogger(__name__)
+
+# Suggestion field -> model column it counts
+SIGHTING_SUGGESTION_FIELDS = {
+    "places": "place",
+    "species": "species",
+    "habitats": "habitat",
+    "melders": "melder",
+    "field_fruits": "field_fruit",
+}
+RINGING_SUGGESTION_FIELDS = {"ringers": "ringer"}
+
+_SOURCES = (
+    (Sighting, SIGHTING_SUGGESTION_FIELDS),
+    (Ringing, RINGING_SUGGESTION_FIELDS),
+)
+
+# Orgs known to be backfilled; a backfill is never undone, so only hits are kept
+_backfilled_orgs: set[str] = set()
+
+
+def suggestion_values(instance: Any, fields: Mapping[str, str]) -> Counter:
+    """The (field, value) pairs a record contributes to the suggestion lists"""
+    values = Counter()
+    for field, column in fields.items():
+        value = getattr(instance, column, None)
+        if value is not None and value != "":
+            values[(field, value)] += 1
+    return values
+
+
+def _value_counts(model, column, org_id: str | None = None):
+    """(org_id, value, count) of the non-empty values of a column"""
+    counts = (
+        select(model.org_id, column, func.count())
+        .where(column.isnot(None), column != "")
+        .group_by(model.org_id, column)
+    )
+    if org_id is not None:
+        counts = counts.where(model.org_id == org_id)
+    return counts
+
+
+class SuggestionFrequencyRepository:
+    """Repository for reading and maintaining suggestion value counts"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _insert(self):
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(SuggestionFrequency)
+        return pg_insert(SuggestionFrequency)
+
+    def is_backfilled(self, org_id: str) -> bool:
+        """Whether the org's counts are complete and maintained by writes"""
+        if str(org_id) in _backfilled_orgs:
+            return True
+        backfilled = (
+            self.db.execute(
+                select(SuggestionFrequencyBackfill.org_id).where(
+                    SuggestionFrequencyBackfill.org_id == org_id
+                )
+            ).first()
+            is not None
+        )
+        if backfilled:
+            _backfilled_orgs.add(str(org_id))
+        return backfilled
+
+    def mark_backfilled(self, org_id: str) -> None:
+        """Mark an org's counts as complete, e.g. of a new org; does not commit"""
+        self.db.add(SuggestionFrequencyBackfill(org_id=org_id))
+
+    def apply(self, org_id: str, deltas: Mapping[tuple[str, str], int]) -> None:
+        """Add count deltas per (field, value); does not commit
+
+        Also applied before the org is backfilled, so no write that commits while
+        the backfill runs goes uncounted; the backfill replaces the counts anyway.
+        """
+        increments = [
+            {"org_id": org_id, "field": field, "value": value, "count": delta}
+            for (field, value), delta in deltas.items()
+            if delta > 0
+        ]
+        decrements = [(key, -delta) for key, delta in deltas.items() if delta < 0]
+
+        if increments:
+            stmt = self._insert().values(increments)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["org_id", "field", "value"],
+                set_={"count": SuggestionFrequency.count + stmt.excluded.count},
+            )
+            self.db.execute(stmt)
+
+        for (field, value), amount in decrements:
+            self.db.execute(
+                update(SuggestionFrequency)
+                .where(
+                    SuggestionFrequency.org_id == org_id,
+                    SuggestionFrequency.field == field,
+                    SuggestionFrequency.value == value,
+                )
+                .values(count=SuggestionFrequency.count - amount)
+            )
+        if decrements:
+            # Values no record uses anymore drop out of the suggestions
+            self.db.execute(
+                delete(SuggestionFrequency).where(
+                    SuggestionFrequency.org_id == org_id,
+                    SuggestionFrequency.count <= 0,
+                )
+            )
+
+    def get_lists(
+        self, org_id: str, fields: Iterable[str] | None = None
+    ) -> dict[str, list[str]]:
+        """Values per suggestion field, most frequent first, in a single query
+
+        Orgs that are not backfilled yet get their values aggregated from
+        sightings and ringings instead.
+        """
+        if fields is None:
+            fields = [field for _, source in _SOURCES for field in source]
+        fields = list(fields)
+
+        if not self.is_backfilled(org_id):
+            return self._aggregate_lists(org_id, fields)
+
+        rows = self.db.execute(
+            select(SuggestionFrequency.field, SuggestionFrequency.value)
+            .where(
+                SuggestionFrequency.org_id == org_id,
+                SuggestionFrequency.field.in_(fields),
+            )
+            .order_by(
+                SuggestionFrequency.field,
+                SuggestionFrequency.count.desc(),
+                SuggestionFrequency.value,
+            )
+        )
+
+        lists: dict[str, list[str]] = {field: [] for field in fields}
+        for field, value in rows:
+            lists[field].append(value)
+        return lists
+
+    def _aggregate_lists(self, org_id: str, fields: list[str]) -> dict[str, list[str]]:
+        """Values per suggestion field from a GROUP BY over the source tables"""
+        lists: dict[str, list[str]] = {field: [] for field in fields}
+        for model, source_fields in _SOURCES:
+            for field, column_name in source_fields.items():
+                if field not in lists:
+                    continue
+                column = getattr(model, column_name)
+                rows = self.db.execute(
+                    _value_counts(model, column, org_id).order_by(
+                        func.count().desc(), column
+                    )
+                )
+                lists[field] = [value for _, value, _ in rows]
+        return lists
+
+    def get_values(self, org_id: str, field: str) -> list[str]:
+        """Values of one suggestion field, most frequent first"""
+        return self.get_lists(org_id, [field])[field]
+
+    def backfill_missing(self) -> int:
+        """Rebuild the counts of every org without a backfill marker
+
+        Meant for startup and scripts, not request handling. Returns the number
+        of orgs backfilled.
+        """
+        org_ids = union(
+            select(Organization.id),
+            *(select(model.org_id) for model, _ in _SOURCES),
+        ).subquery()
+        missing = self.db.scalars(
+            select(org_ids.c.id).where(
+                org_ids.c.id.isnot(None),
+                org_ids.c.id.notin_(select(SuggestionFrequencyBackfill.org_id)),
+            )
+        ).all()
+        for org_id in missing:
+            self.rebuild(org_id)
+        return len(missing)
+
+    def rebuild(self, org_id: str | None = None) -> int:
+        """Recompute the counts from sightings and ringings (one org or all orgs)
+
+        Returns the number of (field, value) rows written. Marks the rebuilt
+        org (or every org) as backfilled.
+        """
+        try:
+            for model in (SuggestionFrequency, SuggestionFrequencyBackfill):
+                stmt = delete(model)
+                if org_id is not None:
+                    stmt = stmt.where(model.org_id == org_id)
+                self.db.execute(stmt)
+
+            written = 0
+            for model, fields in _SOURCES:
+                for field, column_name in fields.items():
+                    column = getattr(model, column_name)
+                    counts = _value_counts(model, column, org_id).add_columns(
+                        literal(field, String)
+                    )
+                    result = self.db.execute(
+                        SuggestionFrequency.__table__.insert().from_select(
+                            ["org_id", "value", "count", "field"], counts
+                        )
+                    )
+                    written += result.rowcount
+
+            backfills = SuggestionFrequencyBackfill.__table__.insert()
+            if org_id is None:
+                backfills = backfills.from_select(["org_id"], select(Organization.id))
+            else:
+                backfills = backfills.values(org_id=org_id)
+            self.db.execute(backfills)
+
+            self.db.commit()
+            if org_id is None:
+                clear_cache()
+            else:
+                _backfilled_orgs.add(str(org_id))
+                bump_org_version(org_id)
+            return written
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error rebuilding suggestion frequencies: {e}")
+            raise
@@ -46,7 +46,7 @@ def decode_cf_jwt(jwt_token: str) -> dict:
         raise HTTPException(status_code=401, detail="Invalid JWT token")
 
 
-async def get_current_user_dev(db: Session = Depends(get_db)) -> User:
+def get_current_user_dev(db: Session = Depends(get_db)) -> User:
     """Development-only user provider - creates/returns a dev user"""
     email = get_dev_user_email()
     user_repo = UserRepository(db)
@@ -75,9 +75,7 @@ async def get_current_user_dev(db: Session = Depends(get_db)) -> User:
     return user
 
 
-async def get_current_user_prod(
-    request: Request, db: Session = Depends(get_db)
-) -> User:
+def get_current_user_prod(request: Request, db: Session = Depends(get_db)) -> User:
     """Production user provider - extracts user from Cloudflare cookie"""
     cf_jwt = request.cookies.get("CF_Authorization")
 
@@ -130,9 +128,13 @@ async def get_current_user_prod(
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 
-async def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
-    """Get current user - production or development mode"""
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
+    """Get current user - production or development mode
+
+    A plain function (like the endpoints using the sync Session) so FastAPI runs
+    its queries in the threadpool instead of on the event loop.
+    """
     if is_development_mode():
-        return await get_current_user_dev(db)
+        return get_current_user_dev(db)
     else:
-        return await get_current_user_prod(request, db)
+        return get_current_user_prod(request, db)
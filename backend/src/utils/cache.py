@@ -2,24 +2,92 @@
 Simple in-memory cache utility for frequently accessed data
 """
 
+import functools
+import inspect
+import itertools
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Optional
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
 
+def _approx_size(value: Any, depth: int = 4) -> int:
+    """Rough memory footprint of a cached value in bytes (containers included)"""
+    size = sys.getsizeof(value, 64)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _approx_size(k, depth - 1) + _approx_size(v, depth - 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _approx_size(item, depth - 1)
+    elif hasattr(value, "__dict__"):
+        size += _approx_size(vars(value), depth - 1)
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    size: int
+
+
+@dataclass
+class _Flight:
+    """A fetch in progress; concurrent misses on the same key wait for it"""
+
+    owner: int = field(default_factory=threading.get_ident)
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
 class SimpleCache:
     """
     Simple in-memory cache with TTL support
     Optimized for single-process applications like the Raspberry Pi deployment
+
+    - Bounded: least recently used entries are evicted beyond max_entries or
+      (approximately) max_bytes.
+    - Single-flight: concurrent misses on one key run fetch_func once; the lock is
+      never held while fetching, so a slow fetch does not block other keys.
+    - Stale-while-revalidate: for stale_ttl after expiry, readers get the old value
+      while one request refreshes it (the refresh runs in that request, so fetch
+      functions may keep using request-scoped sessions).
     """
 
-    def __init__(self, default_ttl: timedelta = timedelta(minutes=5)):
+    def __init__(
+        self,
+        default_ttl: timedelta = timedelta(minutes=5),
+        max_entries: int = 2048,
+        max_bytes: int = 64 * 1024 * 1024,
+        stale_ttl: timedelta = timedelta(seconds=30),
+        cleanup_interval: timedelta = timedelta(minutes=1),
+    ):
         self.default_ttl = default_ttl
-        self._cache: Dict[str, tuple[Any, datetime]] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.cleanup_interval = cleanup_interval.total_seconds()
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._flights: Dict[str, _Flight] = {}
+        self._bytes = 0
         self._lock = Lock()
+        self._last_cleanup = time.monotonic()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._fetch_errors = 0
 
     def get(
         self, key: str, fetch_func: Callable[[], Any], ttl: Optional[timedelta] = None
@@ -35,33 +103,123 @@ class SimpleCache:
         Returns:
             Cached or freshly fetched value
         """
-        ttl = ttl or self.default_ttl
-        now = datetime.now()
+        ttl_seconds = (self.default_ttl if ttl is None else ttl).total_seconds()
+        stale_seconds = self.stale_ttl.total_seconds()
 
         with self._lock:
-            if key in self._cache:
-                value, timestamp = self._cache[key]
-                if now - timestamp < ttl:
-                    logger.debug(f"Cache hit for key: {key}")
-                    return value
-                else:
-                    logger.debug(f"Cache expired for key: {key}")
+            now = time.monotonic()
+            entry = self._cache.get(key)
+            if entry is not None and now < entry.expires_at:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                logger.debug(f"Cache hit for key: {key}")
+                return entry.value
+
+            flight = self._flights.get(key)
+            if flight is not None:
+                if entry is not None and now < entry.expires_at + stale_seconds:
+                    # Someone is already refreshing; serve the stale value meanwhile
+                    self._stale_hits += 1
+                    logger.debug(f"Serving stale value while refreshing: {key}")
+                    return entry.value
+                if flight.owner == threading.get_ident():
+                    # Re-entrant fetch of the same key: don't wait on ourselves
+                    flight = None
             else:
+                flight = _Flight()
+                self._flights[key] = flight
+                self._misses += 1
                 logger.debug(f"Cache miss for key: {key}")
+                return self._fetch(key, fetch_func, flight, ttl_seconds)
+
+        if flight is None:
+            return fetch_func()
+
+        # Another thread is fetching this key: wait for its result
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _fetch(
+        self,
+        key: str,
+        fetch_func: Callable[[], Any],
+        flight: _Flight,
+        ttl_seconds: float,
+    ) -> Any:
+        """Run fetch_func for a key whose flight this thread owns.
 
-            # Cache miss or expired, fetch new data
+        Called with the lock held; releases it for the duration of the fetch (and
+        of sizing the fetched value). The flight is always finished, even when fetch_func raises a BaseException
+        (KeyboardInterrupt, SystemExit, cancellation), so waiters never hang.
+        """
+        try:
+            self._lock.release()
             try:
                 value = fetch_func()
-                self._cache[key] = (value, now)
-                logger.debug(f"Cached new value for key: {key}")
-                return value
-            except Exception as e:
-                logger.error(f"Error fetching data for cache key {key}: {e}")
-                # Return stale data if available, otherwise re-raise
-                if key in self._cache:
-                    logger.warning(f"Returning stale data for key: {key}")
-                    return self._cache[key][0]
+                size = _approx_size(value)
+            finally:
+                self._lock.acquire()
+
+            self._store(key, value, size, ttl_seconds)
+            logger.debug(f"Cached new value for key: {key}")
+            flight.value = value
+            return value
+        except Exception as error:
+            logger.error(f"Error fetching data for cache key {key}: {error}")
+            self._fetch_errors += 1
+            # Return stale data if available, otherwise re-raise
+            entry = self._cache.get(key)
+            if entry is None:
+                flight.error = error
                 raise
+            logger.warning(f"Returning stale data for key: {key}")
+            flight.value = entry.value
+            return entry.value
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            self._flights.pop(key, None)
+            flight.done.set()
+
+    def _store(self, key: str, value: Any, size: int, ttl_seconds: float) -> None:
+        """Insert or replace an entry and enforce the bounds (lock held).
+
+        ``size`` is measured by the caller before taking the lock: walking a large
+        value would otherwise stall every other cache user.
+        """
+        now = time.monotonic()
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._cache[key] = _Entry(value, now + ttl_seconds, size)
+        self._bytes += size
+
+        if now - self._last_cleanup >= self.cleanup_interval:
+            self._purge_expired(now)
+
+        while self._cache and (
+            len(self._cache) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            evicted_key, evicted = self._cache.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
+            logger.debug(f"Evicted cache key: {evicted_key}")
+
+    def _purge_expired(self, now: float) -> int:
+        """Drop entries past their stale window (lock held)"""
+        stale_seconds = self.stale_ttl.total_seconds()
+        expired_keys = [
+            key
+            for key, entry in self._cache.items()
+            if now >= entry.expires_at + stale_seconds
+        ]
+        for key in expired_keys:
+            self._bytes -= self._cache.pop(key).size
+        self._last_cleanup = now
+        return len(expired_keys)
 
     def set(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> None:
         """
@@ -72,8 +230,10 @@ class SimpleCache:
             value: Value to cache
             ttl: Time to live (uses default if None)
         """
+        ttl_seconds = (self.default_ttl if ttl is None else ttl).total_seconds()
+        size = _approx_size(value)
         with self._lock:
-            self._cache[key] = (value, datetime.now())
+            self._store(key, value, size, ttl_seconds)
             logger.debug(f"Set cache value for key: {key}")
 
     def delete(self, key: str) -> bool:
@@ -87,41 +247,54 @@ class SimpleCache:
             True if key existed and was deleted, False otherwise
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
                 logger.debug(f"Deleted cache key: {key}")
                 return True
             return False
 
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete all values whose key starts with prefix
+
+        Args:
+            prefix: Key prefix to delete
+
+        Returns:
+            Number of deleted keys
+        """
+        with self._lock:
+            keys = [key for key in self._cache if key.startswith(prefix)]
+            for key in keys:
+                self._bytes -= self._cache.pop(key).size
+        if keys:
+            logger.debug(f"Deleted {len(keys)} cache keys with prefix: {prefix}")
+        return len(keys)
+
     def clear(self) -> None:
         """Clear all cached data"""
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._bytes = 0
             logger.info(f"Cleared {count} items from cache")
 
     def cleanup_expired(self) -> int:
         """
-        Remove expired entries from cache
+        Remove expired entries from cache (also runs automatically on writes,
+        at most once per cleanup_interval)
 
         Returns:
             Number of expired entries removed
         """
-        now = datetime.now()
-        expired_keys = []
-
         with self._lock:
-            for key, (value, timestamp) in self._cache.items():
-                if now - timestamp >= self.default_ttl:
-                    expired_keys.append(key)
+            removed = self._purge_expired(time.monotonic())
 
-            for key in expired_keys:
-                del self._cache[key]
+        if removed:
+            logger.debug(f"Cleaned up {removed} expired cache entries")
 
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-
-        return len(expired_keys)
+        return removed
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -130,21 +303,31 @@ class SimpleCache:
         Returns:
             Dictionary with cache statistics
         """
-        now = datetime.now()
-        total_entries = len(self._cache)
-        expired_entries = 0
-
         with self._lock:
-            for key, (value, timestamp) in self._cache.items():
-                if now - timestamp >= self.default_ttl:
-                    expired_entries += 1
-
-        return {
-            "total_entries": total_entries,
-            "active_entries": total_entries - expired_entries,
-            "expired_entries": expired_entries,
-            "default_ttl_minutes": self.default_ttl.total_seconds() / 60,
-        }
+            now = time.monotonic()
+            total_entries = len(self._cache)
+            expired_entries = sum(
+                1 for entry in self._cache.values() if now >= entry.expires_at
+            )
+            lookups = self._hits + self._stale_hits + self._misses
+            return {
+                "total_entries": total_entries,
+                "active_entries": total_entries - expired_entries,
+                "expired_entries": expired_entries,
+                "default_ttl_minutes": self.default_ttl.total_seconds() / 60,
+                "max_entries": self.max_entries,
+                "approx_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "fetch_errors": self._fetch_errors,
+                "hit_rate": round((self._hits + self._stale_hits) / lookups, 3)
+                if lookups
+                else None,
+                "in_flight": len(self._flights),
+            }
 
 
 # Global cache instance for the application
@@ -168,6 +351,147 @@ def get_cached_data(
     return app_cache.get(key, fetch_func, ttl)
 
 
+# Org-scoped entries are invalidated by version bumps, but the versions live in
+# this process: writes made elsewhere (import and rebuild scripts) never bump
+# them, so the TTL bounds how long such changes stay invisible
+ORG_CACHE_TTL = timedelta(minutes=5)
+
+# Data version per org, bumped on every sighting/ringing write
+_org_versions: Dict[str, int] = {}
+_org_versions_lock = Lock()
+
+
+def get_org_version(org_id: Any) -> int:
+    """Get the current data version of an organization"""
+    with _org_versions_lock:
+        return _org_versions.get(str(org_id), 0)
+
+
+def bump_org_version(org_id: Any) -> int:
+    """
+    Mark an organization's data as changed
+
+    Every org-scoped cache key of older versions becomes unreachable; those
+    entries are dropped right away.
+
+    Args:
+        org_id: Organization whose data changed
+
+    Returns:
+        The new data version
+    """
+    org_id = str(org_id)
+    with _org_versions_lock:
+        version = _org_versions.get(org_id, 0) + 1
+        _org_versions[org_id] = version
+    app_cache.delete_prefix(f"org:{org_id}:")
+    return version
+
+
+def org_cache_key(org_id: Any, key: str) -> str:
+    """Build a cache key scoped to an organization and its current data version"""
+    return f"org:{org_id}:v{get_org_version(org_id)}:{key}"
+
+
+def get_org_cached_data(
+    org_id: Any,
+    key: str,
+    fetch_func: Callable[[], Any],
+    ttl: Optional[timedelta] = None,
+) -> Any:
+    """
+    Like get_cached_data, but scoped to an organization's current data version
+
+    Args:
+        org_id: Organization the data belongs to
+        key: Cache key within the organization
+        fetch_func: Function to call if cache miss or expired
+        ttl: Time to live for this entry (default: ORG_CACHE_TTL)
+
+    Returns:
+        Cached or freshly fetched value
+    """
+    return app_cache.get(
+        org_cache_key(org_id, key),
+        fetch_func,
+        ORG_CACHE_TTL if ttl is None else ttl,
+    )
+
+
+# Data version per bird (org, ring) and when it was bumped. Unlike the org version,
+# a write only invalidates the birds it touches. Versions come from one counter,
+# so a bird whose entry was forgotten never gets an old version number again.
+_bird_versions: Dict[Tuple[str, str], Tuple[int, float]] = {}
+_bird_version_counter = itertools.count(1)
+_last_bird_version_prune = time.monotonic()
+
+# A bird's version can be forgotten (falling back to 0) once no entry of a version
+# before its last bump can still be cached, including entries stored by fetches
+# that were running during the bump and values kept for stale-while-revalidate
+_BIRD_VERSION_RETENTION = 2 * ORG_CACHE_TTL + app_cache.stale_ttl
+
+
+def _bird_cache_key(org_id: str, ring: str, version: int) -> str:
+    return f"bird:{org_id}:{ring}:v{version}"
+
+
+def _prune_bird_versions(now: float) -> None:
+    """Forget versions bumped longer than the retention ago (lock held)"""
+    global _last_bird_version_prune
+    if now - _last_bird_version_prune < app_cache.cleanup_interval:
+        return
+    cutoff = now - _BIRD_VERSION_RETENTION.total_seconds()
+    for key in [k for k, (_, bumped) in _bird_versions.items() if bumped < cutoff]:
+        del _bird_versions[key]
+    _last_bird_version_prune = now
+
+
+def get_bird_cached_data(org_id: Any, ring: str, fetch_func: Callable[[], Any]) -> Any:
+    """
+    Like get_cached_data, but scoped to one bird and its current data version
+
+    Entries live for ORG_CACHE_TTL: writes outside this process (bulk imports)
+    cannot invalidate them.
+
+    Args:
+        org_id: Organization the bird belongs to
+        ring: Ring number of the bird
+        fetch_func: Function to call if cache miss or expired
+
+    Returns:
+        Cached or freshly fetched value
+    """
+    org_id = str(org_id)
+    with _org_versions_lock:
+        version, _ = _bird_versions.get((org_id, ring), (0, 0.0))
+    return app_cache.get(
+        _bird_cache_key(org_id, ring, version), fetch_func, ORG_CACHE_TTL
+    )
+
+
+def bump_bird_versions(org_id: Any, rings: Iterable[Optional[str]]) -> None:
+    """
+    Mark the data of some birds as changed
+
+    Their cached entries of older versions become unreachable and are dropped.
+
+    Args:
+        org_id: Organization the birds belong to
+        rings: Ring numbers touched by a write (None/empty values are ignored)
+    """
+    org_id = str(org_id)
+    stale_keys = []
+    with _org_versions_lock:
+        now = time.monotonic()
+        _prune_bird_versions(now)
+        for ring in {ring for ring in rings if ring}:
+            version, _ = _bird_versions.get((org_id, ring), (0, 0.0))
+            _bird_versions[(org_id, ring)] = (next(_bird_version_counter), now)
+            stale_keys.append(_bird_cache_key(org_id, ring, version))
+    for key in stale_keys:
+        app_cache.delete(key)
+
+
 def clear_cache():
     """Clear the global cache"""
     app_cache.clear()
@@ -182,6 +506,9 @@ def cached(ttl: int = 300):
     """
     Decorator for caching function results
 
+    The key includes ``str(args)``; for service methods (whose ``self`` differs per
+    request) use org_cached_method instead.
+
     Args:
         ttl: Time to live in seconds (default: 5 minutes)
 
@@ -204,3 +531,42 @@ def cached(ttl: int = 300):
         return wrapper
 
     return decorator
+
+
+def org_cached_method(ttl: Optional[int] = None):
+    """
+    Decorator for caching the results of org-scoped service methods
+
+    The key is built from the method's qualified name, its ``org_id`` argument and
+    the remaining explicit arguments; the bound instance (and the request-scoped
+    Session it holds) is ignored, so results are shared across requests. Entries
+    belong to the org's data version and are invalidated by sighting/ringing writes.
+
+    Args:
+        ttl: Time to live in seconds (default: ORG_CACHE_TTL)
+
+    Returns:
+        Decorator function
+    """
+    ttl_delta = None if ttl is None else timedelta(seconds=ttl)
+
+    def decorator(method: Callable):
+        signature = inspect.signature(method)
+        if "org_id" not in signature.parameters:
+            raise TypeError(f"{method.__qualname__} has no org_id parameter")
+        name = f"{method.__module__}.{method.__qualname__}"
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])  # drop self
+            org_id = arguments.pop("org_id")
+            key = f"{name}:{sorted(arguments.items())!r}"
+            return get_org_cached_data(
+                org_id, key, lambda: method(self, *args, **kwargs), ttl_delta
+            )
+
+        return wrapper
+
+    return decorator
@@ -4,6 +4,14 @@ Distance calculation utilities
 
 import math
 
+from sqlalchemy import Float, case, cast, func
+
+# Mean radius of Earth in meters
+EARTH_RADIUS_M = 6371000
+
+# Meters per degree of latitude on the mean-radius sphere
+_METERS_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -28,7 +36,49 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     )
     c = 2 * math.asin(math.sqrt(a))
 
-    # Radius of Earth in meters
-    r = 6371000
+    return c * EARTH_RADIUS_M
+
+
+def bounding_box(
+    lat: float, lon: float, radius_m: float
+) -> tuple[float, float, float, float]:
+    """
+    Get a lat/lon box that contains every point within radius_m of (lat, lon).
+
+    Used as an index-friendly prefilter before the exact Haversine check.
+
+    Returns:
+        (min_lat, max_lat, min_lon, max_lon) in decimal degrees
+    """
+    dlat = radius_m / _METERS_PER_DEGREE
+    min_lat, max_lat = lat - dlat, lat + dlat
+
+    # Longitude degrees shrink towards the poles; near them, or when the circle
+    # crosses the antimeridian, fall back to the full longitude range.
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if max_lat >= 90 or min_lat <= -90 or cos_lat <= 0:
+        return min_lat, max_lat, -180.0, 180.0
+    dlon = dlat / cos_lat
+    if lon - dlon < -180 or lon + dlon > 180:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, lon - dlon, lon + dlon
+
+
+def haversine_sql(lat_column, lon_column, lat: float, lon: float):
+    """
+    Build a SQL expression for the Haversine distance in meters between
+    the given columns and a fixed point (same formula as calculate_distance).
+    """
+    row_lat = func.radians(cast(lat_column, Float))
+    row_lon = func.radians(cast(lon_column, Float))
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
 
-    return c * r
+    dlat_term = func.power(func.sin((row_lat - lat_rad) / 2), 2)
+    dlon_term = func.power(func.sin((row_lon - lon_rad) / 2), 2)
+    a = dlat_term + math.cos(lat_rad) * func.cos(row_lat) * dlon_term
+    # Rounding can push a a hair above 1 for (near-)antipodal points, which is
+    # outside asin's domain (PostgreSQL raises an error). A CASE instead of
+    # least() also works on SQLite.
+    a = case((a > 1.0, 1.0), else_=a)
+    return 2 * EARTH_RADIUS_M * func.asin(func.sqrt(a))
@@ -0,0 +1,78 @@
+"""
+Conditional GET (ETag / If-None-Match) for org-scoped read endpoints
+
+The ETag is derived from the org's data version (bumped on every sighting and
+ringing write) and the request itself, so it can be checked before any query
+runs: a matching ``If-None-Match`` is answered with 304 right away.
+"""
+
+import hashlib
+import time
+import uuid
+from datetime import date
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from ..database.user_models import User
+from .auth import get_current_user
+from .cache import ORG_CACHE_TTL, get_org_version
+
+# Data versions live in process memory and restart at 0, so ETags of a previous
+# process must never match
+_PROCESS_ID = uuid.uuid4().hex
+
+# Browsers keep the response but revalidate it on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def _time_bucket() -> int:
+    # Writes made outside the API (import scripts) do not bump the version; like
+    # the org caches, an ETag then stays valid for at most ORG_CACHE_TTL
+    return int(time.time() // ORG_CACHE_TTL.total_seconds())
+
+
+def compute_etag(request: Request, org_id) -> str:
+    """Weak ETag for the org's current data as seen through this request"""
+    raw = "|".join(
+        [
+            _PROCESS_ID,
+            str(org_id),
+            str(get_org_version(org_id)),
+            date.today().isoformat(),  # "today"/"this week" figures roll over
+            str(_time_bucket()),
+            request.url.path,
+            str(request.url.query),
+            request.headers.get("accept", ""),
+        ]
+    )
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def org_etag(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+) -> str:
+    """Dependency answering 304 when the client's copy is still current.
+
+    Otherwise the ETag and Cache-Control headers are set on the endpoint's
+    response (not on responses the endpoint builds itself, e.g. streams).
+    """
+    etag = compute_etag(request, current_user.org_id)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return etag
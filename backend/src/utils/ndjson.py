@@ -0,0 +1,36 @@
+"""
+Newline-delimited JSON (NDJSON) streaming responses for large listings
+"""
+
+import json
+from typing import Iterable
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request, stream: bool = False) -> bool:
+    """True if the client asked for NDJSON via ``?stream=1`` or the Accept header"""
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(rows: Iterable, db: Session) -> StreamingResponse:
+    """Stream ``rows`` as one JSON object per line.
+
+    ``rows`` should be a lazy iterator (e.g. a ``yield_per`` query) so that only
+    one batch is held in memory at a time. The session is closed once the stream
+    ends, since the body is produced after the request dependencies returned.
+    """
+
+    def generate():
+        try:
+            for row in rows:
+                yield json.dumps(jsonable_encoder(row), ensure_ascii=False) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE)
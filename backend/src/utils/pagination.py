@@ -0,0 +1,70 @@
+"""
+Keyset (cursor) pagination helpers
+
+A cursor is an opaque, URL-safe token encoding the sort key of the last row of a
+page. The next page continues strictly after that key, so deep pages cost the same
+as the first one (no OFFSET scan) and stay stable while new rows are inserted.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import and_, false, or_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return str(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key values of a row into an opaque cursor token"""
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, parsers: Sequence[Any]) -> List[Any]:
+    """Decode a cursor token, converting each value with the matching parser.
+
+    ``parsers`` holds one callable per sort key (e.g. ``date.fromisoformat``);
+    ``None`` values are passed through untouched.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("unexpected cursor shape")
+        return [
+            None if value is None else parse(value)
+            for value, parse in zip(values, parsers)
+        ]
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {token}") from e
+
+
+def keyset_after(keys: Sequence[Tuple[Any, Any]]):
+    """Build the WHERE clause selecting rows strictly after a cursor.
+
+    ``keys`` is a list of (column, cursor_value) pairs in sort order. Every column
+    is assumed to be sorted DESC NULLS FIRST (PostgreSQL's default for DESC, so a
+    plain ascending index can serve the query by scanning it backwards).
+    """
+    clauses = []
+    for i, (column, value) in enumerate(keys):
+        prefix = [
+            prev_col.is_(None) if prev_val is None else prev_col == prev_val
+            for prev_col, prev_val in keys[:i]
+        ]
+        # After NULL come all non-NULL values; after a value come smaller ones
+        after = column.isnot(None) if value is None else column < value
+        clauses.append(and_(*prefix, after))
+    return or_(*clauses) if clauses else false()
@@ -0,0 +1,126 @@
+"""
+In-memory ring index for partial ring readings
+
+Field readings are often incomplete: only the front (``280*``), the back
+(``*35``), the middle (``*8043*``) or both ends (``28*35``) of a ring are legible.
+A ``RingIndex`` answers these patterns for one org without scanning every ring:
+prefixes and suffixes by binary search over sorted (reversed) rings, infixes via
+a bigram posting index. Indexes are cached per org data version, so any sighting
+write makes the next lookup rebuild it.
+"""
+
+import bisect
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date
+
+from .cache import get_org_cached_data
+
+
+def normalize_partial_reading(partial_reading: str) -> str:
+    """Use ``*`` for every kind of gap marker ("..." and "…")"""
+    return partial_reading.replace("...", "*").replace("…", "*")
+
+
+def matches_partial_reading(partial_reading: str, ring: str) -> bool:
+    """Check if a ring matches a (normalized) partial reading pattern"""
+    # Case 1: Partial reading is missing both outer endings *8043*
+    if partial_reading.startswith("*") and partial_reading.endswith("*"):
+        return partial_reading[1:-1] in ring
+    # Case 2: Partial reading is missing ending 280*
+    if partial_reading.endswith("*"):
+        return ring.startswith(partial_reading[:-1])
+    # Case 3: Partial reading is missing starting *35
+    if partial_reading.startswith("*"):
+        return ring.endswith(partial_reading[1:])
+    # Case 4: Partial reading is missing middle 28*35
+    if "*" in partial_reading:
+        start, end = partial_reading.split("*", 1)  # Split only on first *
+        return ring.startswith(start) and ring.endswith(end)
+    return False
+
+
+@dataclass(frozen=True)
+class RingSummary:
+    """Sighting summary of one ring, as shown in the suggestion list"""
+
+    ring: str
+    species: str | None
+    sighting_count: int
+    first_seen: date | None
+    last_seen: date | None
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _prefix_bounds(sorted_keys: list[str], prefix: str) -> tuple[int, int]:
+    """Slice bounds of the keys starting with prefix in a sorted list"""
+    lo = bisect.bisect_left(sorted_keys, prefix)
+    hi = bisect.bisect_left(sorted_keys, prefix + "\U0010ffff", lo)
+    return lo, hi
+
+
+class RingIndex:
+    """Prefix/suffix/bigram index over the rings of one org"""
+
+    def __init__(self, summaries: Iterable[RingSummary]):
+        self.summaries: dict[str, RingSummary] = {s.ring: s for s in summaries}
+        self._rings = sorted(self.summaries)
+        self._reversed = sorted(ring[::-1] for ring in self._rings)
+        self._postings: dict[str, set[str]] = {}
+        for ring in self._rings:
+            for gram in _bigrams(ring):
+                self._postings.setdefault(gram, set()).add(ring)
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    def _with_prefix(self, prefix: str) -> list[str]:
+        lo, hi = _prefix_bounds(self._rings, prefix)
+        return self._rings[lo:hi]
+
+    def _with_suffix(self, suffix: str) -> list[str]:
+        lo, hi = _prefix_bounds(self._reversed, suffix[::-1])
+        return [ring[::-1] for ring in self._reversed[lo:hi]]
+
+    def _containing(self, infix: str) -> Iterable[str]:
+        if len(infix) < 2:
+            return self._rings
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in _bigrams(infix)), key=len
+        )
+        return set.intersection(*postings)
+
+    def _candidates(self, partial_reading: str) -> Iterable[str]:
+        """A superset of the matching rings, narrowed down by the index"""
+        if partial_reading.startswith("*") and partial_reading.endswith("*"):
+            return self._containing(partial_reading[1:-1])
+        if partial_reading.endswith("*"):
+            return self._with_prefix(partial_reading[:-1])
+        if partial_reading.startswith("*"):
+            return self._with_suffix(partial_reading[1:])
+        if "*" in partial_reading:
+            start, end = partial_reading.split("*", 1)
+            # Both ends are known: scan whichever range is narrower
+            lo, hi = _prefix_bounds(self._rings, start)
+            rlo, rhi = _prefix_bounds(self._reversed, end[::-1])
+            if hi - lo <= rhi - rlo:
+                return self._rings[lo:hi]
+            return [ring[::-1] for ring in self._reversed[rlo:rhi]]
+        return ()
+
+    def match(self, partial_reading: str) -> list[RingSummary]:
+        """Summaries of all rings matching the partial reading"""
+        partial_reading = normalize_partial_reading(partial_reading)
+        return [
+            self.summaries[ring]
+            for ring in self._candidates(partial_reading)
+            if matches_partial_reading(partial_reading, ring)
+        ]
+
+
+def get_ring_index(org_id, build: Callable[[], RingIndex]) -> RingIndex:
+    """Get the ring index of an org's current data version, building it on first use"""
+    return get_org_cached_data(org_id, "ring_index", build)
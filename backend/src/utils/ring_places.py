@@ -20,6 +20,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from .distance import EARTH_RADIUS_M, bounding_box, calculate_distance
+
 _DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 _DATA_PATH = _DATA_DIR / "ring_places.json"
 _GEO_PATH = _DATA_DIR / "ring_geo.json"
@@ -86,16 +88,6 @@ def _load_geo() -> list[RingPlace]:
     ]
 
 
-def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Great-circle distance in metres."""
-    r = 6371000.0
-    p1, p2 = math.radians(lat1), math.radians(lat2)
-    dp = math.radians(lat2 - lat1)
-    dl = math.radians(lon2 - lon1)
-    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
-    return 2 * r * math.asin(math.sqrt(a))
-
-
 def _core_and_distinctive(name: str) -> tuple[str, list[str]]:
     """Return (space-stripped core, distinctive tokens) for name-overlap matching.
 
@@ -114,10 +106,12 @@ def _core_and_distinctive(name: str) -> tuple[str, list[str]]:
     return core, distinctive
 
 
-def names_overlap(name_a: str, name_b: str) -> bool:
-    """True if the two place names share a distinctive token (substring-aware)."""
-    core_a, dist_a = _core_and_distinctive(name_a)
-    core_b, dist_b = _core_and_distinctive(name_b)
+def _tokens_overlap(
+    tokens_a: tuple[str, list[str]], tokens_b: tuple[str, list[str]]
+) -> bool:
+    """Overlap check on pre-tokenized names (see ``_core_and_distinctive``)."""
+    core_a, dist_a = tokens_a
+    core_b, dist_b = tokens_b
     if any(t in core_b for t in dist_a):
         return True
     if any(t in core_a for t in dist_b):
@@ -125,6 +119,59 @@ def names_overlap(name_a: str, name_b: str) -> bool:
     return False
 
 
+def names_overlap(name_a: str, name_b: str) -> bool:
+    """True if the two place names share a distinctive token (substring-aware)."""
+    return _tokens_overlap(_core_and_distinctive(name_a), _core_and_distinctive(name_b))
+
+
+@dataclass(frozen=True)
+class _GeoEntry:
+    place: RingPlace
+    tokens: tuple[str, list[str]]
+
+
+@dataclass(frozen=True)
+class _GeoIndex:
+    """RING places bucketed into lat/lon grid cells of ~``SMART_MATCH_MAX_METERS``."""
+
+    cell_lat: float
+    cell_lon: float
+    cells: dict[tuple[int, int], list[_GeoEntry]]
+
+    def cell_of(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_lat), math.floor(lon / self.cell_lon)
+
+    def near(self, lat: float, lon: float) -> list[_GeoEntry]:
+        """Entries in every cell overlapping the match radius around (lat, lon)."""
+        min_lat, max_lat, min_lon, max_lon = bounding_box(
+            lat, lon, SMART_MATCH_MAX_METERS
+        )
+        i0, j0 = self.cell_of(min_lat, min_lon)
+        i1, j1 = self.cell_of(max_lat, max_lon)
+        entries = []
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                entries.extend(self.cells.get((i, j), ()))
+        return entries
+
+
+@lru_cache(maxsize=1)
+def _geo_index() -> _GeoIndex:
+    """Grid index over ``_load_geo()`` with every RING name tokenized once."""
+    places = _load_geo()
+    # A cell is one match radius tall; its width is one radius at the data's
+    # highest latitude, so it is never narrower than the radius anywhere in it.
+    cell_lat = SMART_MATCH_MAX_METERS / (EARTH_RADIUS_M * math.pi / 180)
+    max_abs_lat = max((abs(p.lat) for p in places), default=0.0)
+    cell_lon = cell_lat / math.cos(math.radians(min(max_abs_lat + cell_lat, 89.0)))
+
+    index = _GeoIndex(cell_lat=cell_lat, cell_lon=cell_lon, cells={})
+    for place in places:
+        entry = _GeoEntry(place=place, tokens=_core_and_distinctive(place.ring_place))
+        index.cells.setdefault(index.cell_of(place.lat, place.lon), []).append(entry)
+    return index
+
+
 def smart_match_place(
     vogelring_place: str | None, lat: float | None, lon: float | None
 ) -> Optional[RingPlace]:
@@ -137,13 +184,64 @@ def smart_match_place(
     if lat is None or lon is None or not vogelring_place:
         return None
     lat, lon = float(lat), float(lon)
+    # The grid cell neighbourhood holds only a handful of places
     candidates = []
-    for place in _load_geo():
-        dist = _haversine_m(lat, lon, place.lat, place.lon)
+    for entry in _geo_index().near(lat, lon):
+        dist = calculate_distance(lat, lon, entry.place.lat, entry.place.lon)
         if dist <= SMART_MATCH_MAX_METERS:
-            candidates.append((dist, place))
+            candidates.append((dist, entry))
     # Nearest first; return the closest one that also matches by name.
-    for _dist, place in sorted(candidates, key=lambda c: c[0]):
-        if names_overlap(vogelring_place, place.ring_place):
-            return place
+    tokens = _core_and_distinctive(vogelring_place)
+    for _dist, entry in sorted(candidates, key=lambda c: c[0]):
+        if _tokens_overlap(tokens, entry.tokens):
+            return entry.place
     return None
+
+
+# Coordinates are rounded to this many decimals (~11 m) when memoizing resolutions,
+# so sightings reported from the same spot share one smart match.
+RESOLVE_COORD_DECIMALS = 4
+
+
+def _coord_bucket(value) -> float | None:
+    return None if value is None else round(float(value), RESOLVE_COORD_DECIMALS)
+
+
+class PlaceResolver:
+    """Memoized explicit-then-smart place resolution for one export.
+
+    Results are keyed on the normalized place name plus the coordinate bucket
+    (smart matching uses the bucket's rounded coordinates, so a key always resolves
+    the same way), making the matching cost scale with distinct places, not rows.
+    """
+
+    def __init__(self) -> None:
+        self._resolved: dict[tuple, tuple[Optional[RingPlace], bool]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(
+        self, vogelring_place: str | None, lat, lon
+    ) -> tuple[Optional[RingPlace], bool]:
+        """Return (RING place or None, whether it is an auto-suggested match)."""
+        key = (normalize(vogelring_place), _coord_bucket(lat), _coord_bucket(lon))
+        cached = self._resolved.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        name, lat, lon = key
+        explicit = lookup_place(name)
+        if explicit is not None:
+            resolved = (explicit, False)
+        else:
+            auto = smart_match_place(name, lat, lon)
+            resolved = (auto, auto is not None)
+        self._resolved[key] = resolved
+        return resolved
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -4,9 +4,10 @@ Test configuration and fixtures
 
 import pytest
 import os
+from contextlib import contextmanager
 from datetime import date
 from uuid import uuid4
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
@@ -16,6 +17,7 @@ os.environ["TESTING"] = "true"
 
 from src.database.connection import Base, get_db
 from src.database.models import Sighting, Ringing
+from src.database.user_models import User
 from src.main import app
 
 
@@ -67,6 +69,54 @@ def client(test_db):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def dev_org_id(client, test_db):
+    """Warm up the dev user (created on first authed request) and return its org_id.
+
+    In dev mode the endpoints scope to this org, so test rows must share it.
+    """
+    client.get("/api/sightings/count")
+    user = test_db.query(User).filter(User.email == "dev@vogelring.local").first()
+    return user.org_id
+
+
+@pytest.fixture
+def add_sighting(test_db):
+    """Factory inserting a sighting for an org and returning it"""
+
+    def add(org_id, **kwargs):
+        sighting = Sighting(id=uuid4(), org_id=org_id, **kwargs)
+        test_db.add(sighting)
+        test_db.commit()
+        return sighting
+
+    return add
+
+
+@pytest.fixture
+def count_queries():
+    """Context manager recording the SQL statements run on an engine
+
+    ``with count_queries() as statements:`` collects every statement executed
+    on the test engine inside the block; pass another engine to watch that one.
+    """
+
+    @contextmanager
+    def record_statements(engine=test_engine):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return record_statements
+
+
 @pytest.fixture
 def sample_ringing_data():
     """Sample ringing data for testing"""
@@ -0,0 +1,94 @@
+"""
+Tests for the friends analysis (GET /api/analytics/friends/{ring}).
+"""
+
+from datetime import date
+from uuid import uuid4
+
+from src.database.family_models import BirdRelationship, RelationshipType
+
+
+FRIENDS_URL = "/api/analytics/friends/{}"
+
+
+class TestFriendsAnalysis:
+    def test_counts_shared_sightings(self, client, add_sighting, dev_org_id):
+        for day in (1, 2, 3):
+            add_sighting(
+                dev_org_id, ring="BIRD", place="Teich", date=date(2024, 5, day)
+            )
+        # Seen together twice, once elsewhere
+        add_sighting(dev_org_id, ring="BUDDY", place="Teich", date=date(2024, 5, 1))
+        add_sighting(dev_org_id, ring="BUDDY", place="Teich", date=date(2024, 5, 2))
+        lonely = add_sighting(
+            dev_org_id, ring="BUDDY", place="See", date=date(2024, 5, 1)
+        )
+        # Only once together: below the default minimum of 2
+        add_sighting(dev_org_id, ring="ONCE", place="Teich", date=date(2024, 5, 3))
+        # Another org's bird at the same spot is not a friend
+        add_sighting(uuid4(), ring="OTHER", place="Teich", date=date(2024, 5, 1))
+        add_sighting(uuid4(), ring="OTHER", place="Teich", date=date(2024, 5, 2))
+
+        response = client.get(FRIENDS_URL.format("BIRD"))
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["bird"]["ring"] == "BIRD"
+        assert data["bird"]["sighting_count"] == 3
+        assert [f["ring"] for f in data["friends"]] == ["BUDDY"]
+        buddy = data["friends"][0]
+        assert buddy["count"] == 2
+        assert buddy["places"] == ["Teich"]
+        assert buddy["sighting_count"] == 3
+
+        statuses = data["seen_status"]
+        assert list(statuses.values()).count("CURRENT_BIRD") == 3
+        assert list(statuses.values()).count("SEEN_TOGETHER") == 2
+        assert statuses[str(lonely.id)] == "SEEN_SEPARATE"
+
+    def test_friend_meta_includes_family(
+        self, client, test_db, dev_org_id, add_sighting
+    ):
+        for day in (1, 2):
+            add_sighting(
+                dev_org_id, ring="BIRD", place="Teich", date=date(2024, 5, day)
+            )
+            add_sighting(
+                dev_org_id, ring="MATE", place="Teich", date=date(2024, 5, day)
+            )
+        test_db.add(
+            BirdRelationship(
+                id=uuid4(),
+                org_id=dev_org_id,
+                bird1_ring="BIRD",
+                bird2_ring="MATE",
+                relationship_type=RelationshipType.BREEDING_PARTNER,
+                year=2024,
+            )
+        )
+        test_db.commit()
+
+        data = client.get(FRIENDS_URL.format("BIRD")).json()
+        assert data["bird"]["partners"][0]["ring"] == "MATE"
+        mate = data["friends"][0]
+        assert mate["ring"] == "MATE"
+        assert mate["partners"][0]["ring"] == "BIRD"
+
+    def test_query_count_does_not_grow_with_sightings(
+        self, client, add_sighting, dev_org_id, count_queries
+    ):
+        def friends_queries(ring, friends, days):
+            for day in range(1, days + 1):
+                spot = {"place": f"{ring} {day}", "date": date(2023, 1, day)}
+                add_sighting(dev_org_id, ring=ring, **spot)
+                for i in range(friends):
+                    add_sighting(dev_org_id, ring=f"{ring}-F{i}", **spot)
+            with count_queries() as statements:
+                response = client.get(FRIENDS_URL.format(ring))
+            assert response.status_code == 200
+            assert len(response.json()["friends"]) == friends
+            return len(statements)
+
+        assert friends_queries("SMALL", friends=1, days=2) == friends_queries(
+            "LARGE", friends=8, days=20
+        )
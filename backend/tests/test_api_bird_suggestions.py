@@ -0,0 +1,91 @@
+"""
+Tests for the indexed partial-reading lookup (GET /api/birds/suggestions/{reading}).
+"""
+
+import random
+from datetime import date
+from uuid import uuid4
+
+from src.utils.cache import clear_cache
+from src.utils.ring_index import RingIndex, RingSummary, matches_partial_reading
+
+
+SUGGESTIONS_URL = "/api/birds/suggestions/{}"
+
+
+def _summary(ring):
+    return RingSummary(
+        ring=ring, species=None, sighting_count=1, first_seen=None, last_seen=None
+    )
+
+
+def test_index_agrees_with_full_scan():
+    rng = random.Random(7)
+    rings = {
+        "".join(rng.choice("0123456789ABX") for _ in range(rng.randint(3, 8)))
+        for _ in range(2000)
+    }
+    index = RingIndex(_summary(ring) for ring in rings)
+    patterns = ["*", "**", "*A*", "*1*", "X*", "*9", "1A*", "*0B", "*AB1*", "1*2"]
+    patterns += ["A*B*C", "*12*3*", "12", "AB...9", "…X0", "1…"]
+    for ring in rng.sample(sorted(rings), 50):
+        patterns += [ring[:2] + "*", "*" + ring[-3:], f"*{ring[1:4]}*"]
+        patterns += [ring[:1] + "*" + ring[-2:]]
+    for pattern in patterns:
+        normalized = pattern.replace("...", "*").replace("…", "*")
+        expected = {r for r in rings if matches_partial_reading(normalized, r)}
+        assert {s.ring for s in index.match(pattern)} == expected, pattern
+
+
+class TestBirdSuggestions:
+    def test_suggestions_summarize_rings(self, client, add_sighting, dev_org_id):
+        clear_cache()
+        add_sighting(
+            dev_org_id,
+            ring="DEW 12345",
+            species="Graugans",
+            date=date(2023, 4, 1),
+        )
+        add_sighting(
+            dev_org_id,
+            ring="DEW 12345",
+            species="Graugans",
+            date=date(2024, 6, 1),
+        )
+        add_sighting(dev_org_id, ring="DEW 12345", species="Kanadagans", date=None)
+        add_sighting(
+            dev_org_id,
+            ring="DEW 99345",
+            species="Lachmöwe",
+            date=date(2022, 1, 1),
+        )
+        add_sighting(dev_org_id, ring="XYZ", species="Lachmöwe")
+        add_sighting(uuid4(), ring="DEW 00345", species="Graugans")
+
+        response = client.get(SUGGESTIONS_URL.format("345"))
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["ring"] for s in data] == ["DEW 12345", "DEW 99345"]
+        assert data[0] == {
+            "ring": "DEW 12345",
+            "species": "Graugans",
+            "sighting_count": 3,
+            "first_seen": "2023-04-01",
+            "last_seen": "2024-06-01",
+        }
+
+        prefix = client.get(SUGGESTIONS_URL.format("DEW 9*")).json()
+        assert [s["ring"] for s in prefix] == ["DEW 99345"]
+        both_ends = client.get(SUGGESTIONS_URL.format("DEW…45")).json()
+        assert len(both_ends) == 2
+
+    def test_index_refreshes_after_sighting_write(self, client, test_db, dev_org_id):
+        clear_cache()
+        assert client.get(SUGGESTIONS_URL.format("NEU*")).json() == []
+
+        response = client.post(
+            "/api/sightings", json={"ring": "NEU 1", "species": "Graugans"}
+        )
+        assert response.status_code in (200, 201)
+        rings = [s["ring"] for s in client.get(SUGGESTIONS_URL.format("NEU*")).json()]
+        assert rings == ["NEU 1"]
@@ -0,0 +1,66 @@
+"""
+Tests for batch bird metadata (POST /api/birds/batch).
+"""
+
+from datetime import date
+from uuid import uuid4
+
+from src.database.family_models import RelationshipType
+from src.database.family_repository import FamilyRepository
+from src.database.models import Sighting
+
+BATCH_URL = "/api/birds/batch"
+
+
+def _add(test_db, org_id, ring, species="Graugans", day=1):
+    test_db.add(
+        Sighting(
+            id=uuid4(),
+            org_id=org_id,
+            ring=ring,
+            species=species,
+            date=date(2024, 4, day),
+        )
+    )
+    test_db.commit()
+
+
+class TestBirdsBatch:
+    def test_matches_single_lookups(self, client, test_db, dev_org_id):
+        _add(test_db, dev_org_id, "A1", day=1)
+        _add(test_db, dev_org_id, "A1", species="Nilgans", day=5)
+        _add(test_db, dev_org_id, "B2", day=3)
+        FamilyRepository(test_db).create_relationship(
+            dev_org_id, "A1", "B2", RelationshipType.BREEDING_PARTNER, 2024
+        )
+
+        response = client.post(BATCH_URL, json=["B2", "A1", "UNKNOWN", "A1"])
+
+        assert response.status_code == 200
+        birds = response.json()
+        assert [b["ring"] for b in birds] == ["B2", "A1", "UNKNOWN"]
+        for bird in birds:
+            assert bird == client.get(f"/api/birds/{bird['ring']}").json()
+        assert birds[1]["sighting_count"] == 2
+        assert [p["ring"] for p in birds[1]["partners"]] == ["B2"]
+        assert birds[2]["sighting_count"] == 0
+
+    def test_query_count_does_not_grow_with_rings(
+        self, client, test_db, dev_org_id, count_queries
+    ):
+        rings = [f"R{i}" for i in range(10)]
+        for ring in rings:
+            _add(test_db, dev_org_id, ring)
+
+        with count_queries() as few:
+            client.post(BATCH_URL, json=rings[:2])
+        with count_queries() as many:
+            response = client.post(BATCH_URL, json=rings)
+
+        assert len(response.json()) == 10
+        assert len(many) == len(few)
+
+    def test_empty_and_oversized_batches(self, client, dev_org_id):
+        assert client.post(BATCH_URL, json=[]).json() == []
+        too_many = [f"R{i}" for i in range(501)]
+        assert client.post(BATCH_URL, json=too_many).status_code == 422
@@ -0,0 +1,63 @@
+"""
+Tests that slow database work on the hot read endpoints runs off the event loop.
+"""
+
+import asyncio
+import inspect
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.api.services.dashboard_service import DashboardService
+from src.main import app
+from src.utils.auth import get_current_user
+
+HOT_PREFIXES = (
+    "/api/sightings",
+    "/api/ringing",
+    "/api/birds",
+    "/api/dashboard",
+    "/api/suggestions",
+)
+
+SLOW_QUERY_SECONDS = 0.3
+
+
+def test_hot_endpoints_are_sync():
+    """Endpoints using the sync Session must be plain functions (run in threadpool)"""
+    endpoints = [
+        route
+        for route in app.routes
+        if getattr(route, "path", "").startswith(HOT_PREFIXES)
+    ]
+    assert endpoints
+    assert [r.path for r in endpoints if inspect.iscoroutinefunction(r.endpoint)] == []
+    assert not inspect.iscoroutinefunction(get_current_user)
+
+
+@pytest.fixture
+def slow_dashboard(monkeypatch):
+    def get_dashboard(self, org_id, days=30):
+        time.sleep(SLOW_QUERY_SECONDS)  # stands in for a slow blocking query
+        return {"org_id": org_id}
+
+    monkeypatch.setattr(DashboardService, "get_dashboard", get_dashboard)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(org_id=uuid4())
+    yield
+    app.dependency_overrides.clear()
+
+
+async def test_slow_requests_do_not_serialize(slow_dashboard):
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.get("/api/dashboard") for _ in range(4))
+        )
+        elapsed = time.perf_counter() - start
+
+    assert all(response.status_code == 200 for response in responses)
+    # Serialized on the event loop this would take 4 * SLOW_QUERY_SECONDS
+    assert elapsed < 2 * SLOW_QUERY_SECONDS
@@ -0,0 +1,83 @@
+"""
+Tests for the aggregated dashboard overview (GET /api/dashboard).
+"""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+from src.utils.cache import clear_cache
+
+
+DASHBOARD_URL = "/api/dashboard"
+
+
+class TestDashboardAggregates:
+    def test_counters_and_streak(self, client, add_sighting, dev_org_id):
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        add_sighting(dev_org_id, ring="A", species="Graugans", place="See", date=today)
+        add_sighting(dev_org_id, ring="A", species="Graugans", place="See", date=today)
+        add_sighting(
+            dev_org_id,
+            ring="B",
+            species="Lachmöwe",
+            place="Teich",
+            date=today - timedelta(days=1),
+        )
+        add_sighting(
+            dev_org_id,
+            species="Graugans",
+            place="See",
+            date=week_start - timedelta(days=3),
+        )
+        add_sighting(
+            dev_org_id,
+            ring="C",
+            species="Graugans",
+            date=today - timedelta(days=100),
+        )
+        # Another org's sighting is never counted
+        add_sighting(uuid4(), ring="X", species="Graugans", date=today)
+
+        response = client.get(DASHBOARD_URL)
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["count_sightings_today"] == 2
+        assert data["count_sightings_yesterday"] == 1
+        assert data["count_sightings_this_week"] == (3 if today.weekday() else 2)
+        assert data["count_sightings_last_week"] == (1 if today.weekday() else 2)
+        assert data["count_total_sightings"] == 5
+        assert data["count_total_unique_birds"] == 3
+        assert data["day_streak"] == (2 if today.weekday() else 1)
+        assert data["top_species"] == {"Graugans": 4, "Lachmöwe": 1}
+        assert data["top_locations"]["See"] == 3
+
+    def test_days_controls_recent_activity(self, client, add_sighting, dev_org_id):
+        today = date.today()
+        add_sighting(dev_org_id, species="Graugans", date=today)
+        add_sighting(dev_org_id, species="Graugans", date=today - timedelta(days=6))
+        add_sighting(dev_org_id, species="Graugans", date=today - timedelta(days=7))
+
+        activity = client.get(DASHBOARD_URL, params={"days": 7}).json()[
+            "recent_activity"
+        ]
+        assert len(activity) == 7
+        assert activity[0] == {
+            "date": (today - timedelta(days=6)).isoformat(),
+            "count": 1,
+        }
+        assert activity[-1] == {"date": today.isoformat(), "count": 1}
+        assert sum(day["count"] for day in activity) == 2
+
+    def test_result_is_cached_per_org(self, client, add_sighting, dev_org_id):
+        clear_cache()
+        add_sighting(dev_org_id, species="Graugans", date=date.today())
+        assert client.get(DASHBOARD_URL).json()["count_total_sightings"] == 1
+
+        # Within the TTL the cached overview is served
+        add_sighting(dev_org_id, species="Graugans", date=date.today())
+        assert client.get(DASHBOARD_URL).json()["count_total_sightings"] == 1
+
+        clear_cache()
+        assert client.get(DASHBOARD_URL).json()["count_total_sightings"] == 2
@@ -0,0 +1,71 @@
+"""
+Tests for conditional GET (ETag / If-None-Match) on the list and reference endpoints.
+"""
+
+import pytest
+
+from src.api.services.sighting_service import SightingService
+from src.utils.etag import etag_matches
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/api/sightings", "/api/ringings", "/api/suggestions", "/api/dashboard"],
+)
+def test_matching_etag_answers_304(client, dev_org_id, url):
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get(url, headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_304_skips_the_query(client, dev_org_id, monkeypatch):
+    etag = client.get("/api/sightings").headers["etag"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("main query ran")
+
+    monkeypatch.setattr(SightingService, "get_sightings_page", fail)
+
+    response = client.get("/api/sightings", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_write_changes_etag(client, dev_org_id):
+    etag = client.get("/api/sightings").headers["etag"]
+
+    client.post("/api/sightings", json={"species": "Graugans"})
+    response = client.get("/api/sightings", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [s["species"] for s in response.json()["sightings"]] == ["Graugans"]
+
+
+def test_etag_depends_on_query(client, dev_org_id):
+    etag = client.get("/api/sightings").headers["etag"]
+
+    response = client.get(
+        "/api/sightings",
+        params={"species": "Graugans"},
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_etag_matches():
+    etag = 'W/"abc"'
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"x", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"x"', etag)
+    assert not etag_matches(None, etag)
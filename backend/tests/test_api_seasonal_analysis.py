@@ -0,0 +1,68 @@
+"""
+Tests for the database-aggregated seasonal analysis (GET /api/seasonal-analysis).
+"""
+
+from datetime import date
+from uuid import uuid4
+
+
+SEASONAL_URL = "/api/seasonal-analysis"
+
+
+def _add_many(add_sighting, org_id, species, year, month, count):
+    for day in range(1, count + 1):
+        add_sighting(org_id, species=species, date=date(year, month, day))
+
+
+class TestSeasonalAnalysis:
+    def test_monthly_statistics_across_years(self, client, add_sighting, dev_org_id):
+        # May: 2, 4 and 9 sightings over three years; June only in 2021
+        _add_many(add_sighting, dev_org_id, "Lachmöwe", 2020, 5, 2)
+        _add_many(add_sighting, dev_org_id, "Lachmöwe", 2021, 5, 4)
+        _add_many(add_sighting, dev_org_id, "Lachmöwe", 2022, 5, 9)
+        _add_many(add_sighting, dev_org_id, "Lachmöwe", 2021, 6, 3)
+        # Not counted: no date, other org
+        add_sighting(dev_org_id, species="Lachmöwe")
+        _add_many(add_sighting, uuid4(), "Lachmöwe", 2021, 5, 7)
+
+        response = client.get(SEASONAL_URL)
+        assert response.status_code == 200
+        months = response.json()["counts"]["Lachmöwe"]
+        assert [m["month"] for m in months] == list(range(1, 13))
+
+        may, june = months[4], months[5]
+        assert may["absolute_avg"] == 4
+        assert may["q3_avg"] == 9
+        assert may["max_count"] == 9
+        assert may["relative_avg"] == round(4 / 9, 2)
+        # Years without June sightings count as zero
+        assert june["absolute_avg"] == 0
+        assert june["max_count"] == 3
+        assert months[0]["max_count"] == 0
+
+    def test_species_and_year_filters(self, client, add_sighting, dev_org_id):
+        _add_many(add_sighting, dev_org_id, "Lachmöwe", 2019, 3, 1)
+        _add_many(add_sighting, dev_org_id, "Lachmöwe", 2021, 3, 5)
+        _add_many(add_sighting, dev_org_id, "Graugans", 2021, 3, 2)
+
+        counts = client.get(SEASONAL_URL, params={"species": "Graugans"}).json()[
+            "counts"
+        ]
+        assert list(counts) == ["Graugans"]
+
+        counts = client.get(
+            SEASONAL_URL, params={"start_year": 2020, "end_year": 2021}
+        ).json()["counts"]
+        assert set(counts) == {"Lachmöwe", "Graugans"}
+        # Only 2021 is in range, so March has a single year: 5
+        assert counts["Lachmöwe"][2]["absolute_avg"] == 5
+
+        counts = client.get(SEASONAL_URL, params={"end_year": 2019}).json()["counts"]
+        assert list(counts) == ["Lachmöwe"]
+        assert counts["Lachmöwe"][2]["max_count"] == 1
+
+    def test_rejects_inverted_year_range(self, client, dev_org_id):
+        response = client.get(
+            SEASONAL_URL, params={"start_year": 2022, "end_year": 2020}
+        )
+        assert response.status_code == 400
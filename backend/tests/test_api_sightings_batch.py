@@ -0,0 +1,82 @@
+"""
+Tests for batch sighting ingestion (POST /api/sightings/batch).
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from src.api.routers.sightings import MAX_SIGHTING_BATCH_SIZE
+from src.database.models import Sighting
+
+BATCH_URL = "/api/sightings/batch"
+
+
+@contextmanager
+def _commits(test_db):
+    commits = []
+
+    def count_commit(session):
+        commits.append(session)
+
+    event.listen(test_db, "after_commit", count_commit)
+    try:
+        yield commits
+    finally:
+        event.remove(test_db, "after_commit", count_commit)
+
+
+class TestSightingBatch:
+    def test_creates_valid_items_and_reports_invalid_ones(
+        self, client, test_db, dev_org_id
+    ):
+        items = [
+            {"species": "Graugans", "place": "See", "date": "2025-04-01"},
+            {"species": "Nilgans", "age": "not a code"},
+            {"ring": "A123", "place": "See", "lat": 50.1, "lon": 8.6},
+            {"date": "yesterday"},
+        ]
+        response = client.post(BATCH_URL, json=items)
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["created"] == 2
+        assert data["ids"][1] is None and data["ids"][3] is None
+        assert [error["index"] for error in data["errors"]] == [1, 3]
+        assert data["errors"][0]["errors"][0]["loc"] == ["age"]
+
+        stored = {
+            str(s.id): s
+            for s in test_db.query(Sighting).filter(Sighting.org_id == dev_org_id)
+        }
+        assert stored[data["ids"][0]].species == "Graugans"
+        assert stored[data["ids"][2]].ring == "A123"
+        assert stored[data["ids"][2]].is_exact_location is False
+        assert len(stored) == 2
+
+        suggestions = client.get("/api/suggestions").json()
+        assert suggestions["places"] == ["See"]
+        assert suggestions["species"] == ["Graugans"]
+
+    def test_one_insert_statement_and_one_commit(
+        self, client, test_db, dev_org_id, count_queries
+    ):
+        items = [{"species": "Graugans", "place": f"Teich {i}"} for i in range(25)]
+
+        with count_queries() as statements, _commits(test_db) as commits:
+            response = client.post(BATCH_URL, json=items)
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 25
+        inserts = [s for s in statements if s.startswith("INSERT INTO sightings")]
+        assert len(inserts) == 1
+        assert len(commits) == 1
+
+    def test_empty_batch(self, client, dev_org_id):
+        response = client.post(BATCH_URL, json=[])
+        assert response.status_code == 200
+        assert response.json() == {"ids": [], "created": 0, "errors": []}
+
+    def test_rejects_oversized_batch(self, client, dev_org_id):
+        items = [{"species": "Graugans"}] * (MAX_SIGHTING_BATCH_SIZE + 1)
+        assert client.post(BATCH_URL, json=items).status_code == 422
@@ -3,29 +3,18 @@ Tests for the Vogelwarte (RING) Wiederfunde Excel export endpoint.
 """
 
 import io
+import tempfile
 from datetime import date
 from uuid import uuid4
 
-import pytest
 from openpyxl import load_workbook
 
 from src.database.models import Sighting
-from src.database.user_models import User
 
 
 EXPORT_URL = "/api/sightings/export/vogelwarte"
 
 
-@pytest.fixture
-def dev_org_id(client, test_db):
-    """Warm up the dev user (created on first authed request) and return its org_id.
-
-    In dev mode the endpoint scopes to this org, so test sightings must share it.
-    """
-    client.get("/api/sightings/count")
-    user = test_db.query(User).filter(User.email == "dev@vogelring.local").first()
-    return user.org_id
-
 EXPECTED_HEADERS = [
     "Datum",
     "Ort",
@@ -339,3 +328,45 @@ class TestVogelwarteExport:
         client.get(EXPORT_URL)
         test_db.refresh(s)
         assert s.melded is False
+
+    def test_streamed_workbook_keeps_layout(self, client, test_db, dev_org_id):
+        for day in range(1, 29):
+            _add(
+                test_db,
+                dev_org_id,
+                date=date(2026, 2, day),
+                melded=False,
+                ring=f"R{day}",
+            )
+
+        response = client.get(EXPORT_URL)
+        assert int(response.headers["content-length"]) == len(response.content)
+
+        ws = load_workbook(io.BytesIO(response.content)).active
+        assert ws.title == "Wiederfunde"
+        assert all(cell.font.b for cell in ws[1])
+        assert ws.column_dimensions["K"].width == 60
+        rows = list(ws.iter_rows(min_row=2, values_only=True))
+        assert [row[COL_RING] for row in rows] == [f"R{day}" for day in range(1, 29)]
+
+    def test_large_export_spools_to_disk(
+        self, client, test_db, dev_org_id, monkeypatch
+    ):
+        from src.api.routers import sightings
+
+        monkeypatch.setattr(sightings, "EXPORT_SPOOL_MAX_SIZE", 1024)
+        monkeypatch.setattr(sightings, "EXPORT_CHUNK_SIZE", 512)
+        rollovers = []
+        rollover = tempfile.SpooledTemporaryFile.rollover
+
+        def spy(self):
+            rollovers.append(self)
+            rollover(self)
+
+        monkeypatch.setattr(tempfile.SpooledTemporaryFile, "rollover", spy)
+        _add(test_db, dev_org_id, date=date(2026, 3, 1), melded=False, ring="R1")
+
+        rows = _load_rows(client.get(EXPORT_URL))
+        assert rows[1][COL_RING] == "R1"
+        # The workbook outgrew the in-memory buffer and moved to a temp file
+        assert rollovers
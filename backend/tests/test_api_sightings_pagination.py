@@ -0,0 +1,88 @@
+"""
+Tests for keyset (cursor) pagination of GET /api/sightings.
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+
+SIGHTINGS_URL = "/api/sightings"
+
+
+@pytest.fixture
+def add_sighting(add_sighting):
+    # SQLite stores the CURRENT_TIMESTAMP server default in a different text format
+    # than bound datetimes, so set created_at explicitly to keep comparisons exact.
+    def add(org_id, **kwargs):
+        kwargs.setdefault("created_at", datetime(2026, 1, 1, 12, 0, 0))
+        return add_sighting(org_id, **kwargs)
+
+    return add
+
+
+def _walk(client, params):
+    """Follow next_cursor until the last page; return the pages' id lists."""
+    pages = []
+    cursor = None
+    while True:
+        query = dict(params)
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get(SIGHTINGS_URL, params=query)
+        assert response.status_code == 200
+        data = response.json()
+        pages.append([s["id"] for s in data["sightings"]])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+class TestSightingsKeysetPagination:
+    def test_pages_follow_date_created_at_id_order(
+        self, client, add_sighting, dev_org_id
+    ):
+        rows = [
+            add_sighting(dev_org_id, date=date(2026, 3, 1), ring="A"),
+            add_sighting(dev_org_id, date=date(2026, 2, 1), ring="B"),
+            # Same date + created_at: the id breaks the tie
+            add_sighting(dev_org_id, date=date(2026, 1, 1)),
+            add_sighting(dev_org_id, date=date(2026, 1, 1)),
+            add_sighting(dev_org_id, date=None, ring="NODATE"),
+        ]
+
+        pages = _walk(client, {"limit": 2})
+
+        assert [len(p) for p in pages] == [2, 2, 1]
+        ids = [i for page in pages for i in page]
+        tied = sorted([str(rows[2].id), str(rows[3].id)], reverse=True)
+        # NULL dates sort first, as PostgreSQL does for DESC
+        assert ids == [str(rows[4].id), str(rows[0].id), str(rows[1].id), *tied]
+
+    def test_filters_apply_to_every_page(self, client, add_sighting, dev_org_id):
+        for day in range(1, 6):
+            add_sighting(dev_org_id, date=date(2026, 1, day), species="Graugans")
+            add_sighting(dev_org_id, date=date(2026, 1, day), species="Nilgans")
+
+        pages = _walk(client, {"limit": 3, "species": "grau"})
+
+        assert sum(len(p) for p in pages) == 5
+        assert len({i for p in pages for i in p}) == 5
+
+    def test_last_page_has_no_cursor(self, client, add_sighting, dev_org_id):
+        add_sighting(dev_org_id, date=date(2026, 1, 1))
+        data = client.get(SIGHTINGS_URL, params={"limit": 1}).json()
+        assert len(data["sightings"]) == 1
+        assert data["next_cursor"] is None
+
+    def test_invalid_cursor_is_rejected(self, client):
+        response = client.get(SIGHTINGS_URL, params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_all_flag_returns_unpaginated_list(self, client, add_sighting, dev_org_id):
+        for day in range(1, 4):
+            add_sighting(dev_org_id, date=date(2026, 1, day))
+        response = client.get(SIGHTINGS_URL, params={"all": "true", "limit": 1})
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+        assert len(response.json()) == 3
@@ -0,0 +1,64 @@
+"""
+Tests for the database-side radius search (GET /api/sightings/radius).
+"""
+
+from datetime import date
+
+from src.utils.distance import bounding_box, calculate_distance
+
+
+RADIUS_URL = "/api/sightings/radius"
+
+# Frankfurt, Mainkai
+CENTER = (50.1080, 8.6830)
+
+
+def test_bounding_box_contains_radius():
+    min_lat, max_lat, min_lon, max_lon = bounding_box(*CENTER, 1000)
+    # The box edges sit at (about) exactly the radius on the axes
+    assert abs(calculate_distance(*CENTER, max_lat, CENTER[1]) - 1000) < 1
+    assert calculate_distance(*CENTER, CENTER[0], max_lon) >= 999
+    assert min_lat < CENTER[0] < max_lat and min_lon < CENTER[1] < max_lon
+
+
+def test_bounding_box_near_pole_spans_all_longitudes():
+    assert bounding_box(89.999, 10.0, 5000)[2:] == (-180.0, 180.0)
+
+
+class TestRadiusSearch:
+    def test_exact_distance_refinement(self, client, add_sighting, dev_org_id):
+        # ~440 m north: inside 500 m
+        add_sighting(dev_org_id, ring="NEAR", lat=50.1120, lon=8.6830)
+        # Inside the bounding box corner but ~650 m away diagonally: outside
+        add_sighting(dev_org_id, ring="CORNER", lat=50.1120, lon=8.6890)
+        # Far away
+        add_sighting(dev_org_id, ring="FAR", lat=50.2000, lon=8.6830)
+        # No coordinates
+        add_sighting(dev_org_id, ring="NOCOORDS")
+
+        response = client.get(
+            RADIUS_URL, params={"lat": CENTER[0], "lon": CENTER[1], "radius_m": 500}
+        )
+        assert response.status_code == 200
+        assert [s["ring"] for s in response.json()] == ["NEAR"]
+
+    def test_filters_and_limit(self, client, add_sighting, dev_org_id):
+        for day, species in [(1, "Graugans"), (2, "Nilgans"), (3, "Graugans")]:
+            add_sighting(
+                dev_org_id,
+                ring=f"R{day}",
+                species=species,
+                date=date(2026, 1, day),
+                lat=CENTER[0],
+                lon=CENTER[1],
+            )
+        params = {"lat": CENTER[0], "lon": CENTER[1], "radius_m": 100}
+
+        response = client.get(RADIUS_URL, params={**params, "species": "Graugans"})
+        assert [s["ring"] for s in response.json()] == ["R3", "R1"]
+
+        response = client.get(RADIUS_URL, params={**params, "start_date": "2026-01-02"})
+        assert [s["ring"] for s in response.json()] == ["R3", "R2"]
+
+        response = client.get(RADIUS_URL, params={**params, "limit": 1})
+        assert [s["ring"] for s in response.json()] == ["R3"]
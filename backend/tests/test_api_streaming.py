@@ -0,0 +1,75 @@
+"""
+Tests for the NDJSON streaming mode of the sighting and ringing listings.
+"""
+
+import json
+from datetime import date, datetime
+from uuid import uuid4
+
+from src.database.models import Ringing, Sighting
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def _add_sightings(test_db, org_id, n):
+    for day in range(1, n + 1):
+        test_db.add(
+            Sighting(
+                id=uuid4(),
+                org_id=org_id,
+                date=date(2026, 1, day),
+                created_at=datetime(2026, 1, 1),
+                species="Graugans" if day % 2 else "Nilgans",
+                ring=f"R{day}",
+            )
+        )
+    test_db.commit()
+
+
+class TestNdjsonStreaming:
+    def test_stream_query_param(self, client, test_db, dev_org_id):
+        _add_sightings(test_db, dev_org_id, 5)
+        response = client.get("/api/sightings", params={"stream": 1})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = _lines(response)
+        assert [r["ring"] for r in rows] == ["R5", "R4", "R3", "R2", "R1"]
+        assert rows[0]["date"] == "2026-01-05"
+
+    def test_accept_header_and_filters(self, client, test_db, dev_org_id):
+        _add_sightings(test_db, dev_org_id, 5)
+        response = client.get(
+            "/api/sightings",
+            params={"species": "grau"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert {r["ring"] for r in _lines(response)} == {"R1", "R3", "R5"}
+
+    def test_stream_ringings(self, client, test_db, dev_org_id):
+        for i in range(3):
+            test_db.add(
+                Ringing(
+                    id=uuid4(),
+                    org_id=dev_org_id,
+                    ring=f"RING{i}",
+                    ring_scheme="DEW",
+                    species="Graugans",
+                    date=date(2026, 1, i + 1),
+                    place="Nied",
+                    lat=50.1,
+                    lon=8.6,
+                    ringer="IR",
+                    sex=1,
+                    age=2,
+                )
+            )
+        test_db.commit()
+
+        response = client.get("/api/ringings", params={"stream": "true"})
+        assert response.status_code == 200
+        rows = _lines(response)
+        assert [r["ring"] for r in rows] == ["RING2", "RING1", "RING0"]
+        assert rows[0]["lat"] == 50.1
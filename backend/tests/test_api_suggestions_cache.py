@@ -0,0 +1,86 @@
+"""
+Tests that the suggestion endpoints are served from the org-scoped cache.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.database.models import Sighting
+from src.database.suggestion_repository import SuggestionFrequencyRepository
+from src.utils.cache import clear_cache, org_cached_method
+
+
+SUGGESTION_URLS = [
+    "/api/suggestions",
+    "/api/suggestions/species",
+    "/api/suggestions/places",
+    "/api/suggestions/habitats",
+    "/api/suggestions/melders",
+    "/api/suggestions/ringers",
+]
+
+
+def _data_queries(statements):
+    """The recorded statements that read suggestion data"""
+    tables = ("FROM sightings", "FROM ringings", "FROM suggestion_frequencies")
+    return [s for s in statements if any(table in s for table in tables)]
+
+
+@pytest.mark.parametrize("url", SUGGESTION_URLS)
+def test_second_request_hits_cache(client, test_db, dev_org_id, count_queries, url):
+    clear_cache()
+    test_db.add(
+        Sighting(id=uuid4(), org_id=dev_org_id, species="Graugans", place="See")
+    )
+    test_db.commit()
+    SuggestionFrequencyRepository(test_db).rebuild(dev_org_id)
+
+    with count_queries() as first:
+        first_response = client.get(url)
+    with count_queries() as second:
+        second_response = client.get(url)
+
+    assert first_response.status_code == 200
+    assert second_response.json() == first_response.json()
+    assert _data_queries(first)
+    assert _data_queries(second) == []
+
+
+def test_write_invalidates_suggestions(client, dev_org_id):
+    clear_cache()
+    assert client.get("/api/suggestions/species").json() == {"species": []}
+
+    response = client.post("/api/sightings", json={"species": "Nilgans"})
+    assert response.status_code in (200, 201)
+    assert client.get("/api/suggestions/species").json() == {"species": ["Nilgans"]}
+
+
+def test_key_ignores_instance_and_includes_args():
+    clear_cache()
+    calls = []
+
+    class Service:
+        def __init__(self, session):
+            self.session = session
+
+        @org_cached_method()
+        def lookup(self, org_id, query, limit=10):
+            calls.append((self.session, query, limit))
+            return f"{query}:{limit}"
+
+    org_id = uuid4()
+    assert Service("session-1").lookup(org_id, "a") == "a:10"
+    assert Service("session-2").lookup(org_id, "a", limit=10) == "a:10"
+    assert Service("session-2").lookup(str(org_id), query="a") == "a:10"
+    assert Service("session-3").lookup(org_id, "a", 5) == "a:5"
+    assert Service("session-3").lookup(uuid4(), "a") == "a:10"
+    assert len(calls) == 3
+
+
+def test_requires_org_id_parameter():
+    with pytest.raises(TypeError):
+
+        @org_cached_method()
+        def no_org(self, query):
+            return query
@@ -0,0 +1,109 @@
+"""
+Tests for the delta sync feeds GET /api/sightings/changes and /api/ringings/changes.
+"""
+
+from datetime import date, datetime
+from uuid import uuid4
+
+from src.database.models import Ringing, Sighting, Tombstone
+from src.database.repositories import SightingRepository
+
+# Long before the feed's overlap window, so these rows only show up in snapshots
+OLD = datetime(2020, 1, 1, 12, 0, 0)
+
+
+def _sighting(test_db, org_id, **kwargs):
+    sighting = Sighting(id=uuid4(), org_id=org_id, updated_at=OLD, **kwargs)
+    test_db.add(sighting)
+    test_db.commit()
+    return sighting
+
+
+def _ringing(test_db, org_id, ring):
+    ringing = Ringing(
+        id=uuid4(),
+        org_id=org_id,
+        ring=ring,
+        ring_scheme="DEW",
+        species="Graugans",
+        date=date(2024, 5, 1),
+        place="See",
+        lat=52.5,
+        lon=13.4,
+        ringer="Anna",
+        sex=1,
+        age=1,
+        updated_at=OLD,
+    )
+    test_db.add(ringing)
+    test_db.commit()
+    return ringing
+
+
+class TestSightingChanges:
+    def test_without_token_returns_snapshot(self, client, test_db, dev_org_id):
+        rows = [_sighting(test_db, dev_org_id, species="Graugans") for _ in range(2)]
+        _sighting(test_db, uuid4(), species="Nilgans")  # other org
+
+        response = client.get("/api/sightings/changes")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(s["id"] for s in data["changed"]) == sorted(
+            str(r.id) for r in rows
+        )
+        assert data["deleted"] == []
+        assert data["token"]
+
+    def test_token_returns_only_changes_and_tombstones(
+        self, client, test_db, dev_org_id
+    ):
+        kept = _sighting(test_db, dev_org_id, species="Graugans")
+        edited = _sighting(test_db, dev_org_id, species="Graugans")
+        removed = _sighting(test_db, dev_org_id, species="Graugans")
+        token = client.get("/api/sightings/changes").json()["token"]
+
+        created = client.post("/api/sightings", json={"species": "Nilgans"}).json()
+        client.put(
+            "/api/sightings", json={"id": str(edited.id), "species": "Kanadagans"}
+        )
+        client.delete(f"/api/sightings/{removed.id}")
+
+        data = client.get("/api/sightings/changes", params={"since": token}).json()
+
+        changed = {s["id"]: s["species"] for s in data["changed"]}
+        assert changed == {created["id"]: "Nilgans", str(edited.id): "Kanadagans"}
+        assert str(kept.id) not in changed
+        assert [t["id"] for t in data["deleted"]] == [str(removed.id)]
+        assert data["token"]
+
+    def test_tombstones_are_scoped_to_entity_and_org(self, test_db, dev_org_id):
+        test_db.add(Tombstone(org_id=uuid4(), entity="sighting", record_id=uuid4()))
+        test_db.add(Tombstone(org_id=dev_org_id, entity="ringing", record_id=uuid4()))
+        test_db.commit()
+
+        repo = SightingRepository(test_db)
+        _, _, token = repo.get_changes(dev_org_id)
+        _, tombstones, _ = repo.get_changes(dev_org_id, token)
+
+        assert tombstones == []
+
+    def test_invalid_token(self, client, dev_org_id):
+        response = client.get("/api/sightings/changes", params={"since": "bogus"})
+        assert response.status_code == 400
+
+
+class TestRingingChanges:
+    def test_deleted_ringing_tombstone_carries_ring(self, client, test_db, dev_org_id):
+        _ringing(test_db, dev_org_id, "R1")
+        _ringing(test_db, dev_org_id, "R2")
+        snapshot = client.get("/api/ringings/changes").json()
+        assert sorted(r["ring"] for r in snapshot["changed"]) == ["R1", "R2"]
+
+        client.delete("/api/ringing/R2")
+        data = client.get(
+            "/api/ringings/changes", params={"since": snapshot["token"]}
+        ).json()
+
+        assert data["changed"] == []
+        assert [t["ring"] for t in data["deleted"]] == ["R2"]
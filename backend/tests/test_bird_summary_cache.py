@@ -0,0 +1,120 @@
+"""
+Tests for the per-bird summary cache behind GET /api/birds/{ring}.
+"""
+
+from datetime import date
+
+import pytest
+
+from src.api.services.bird_service import BirdService
+from src.database.family_models import RelationshipType
+from src.database.family_repository import FamilyRepository
+from src.database.repositories import RingingRepository, SightingRepository
+from src.utils import cache
+from src.utils.cache import bump_bird_versions, clear_cache
+
+
+@pytest.fixture
+def meta(test_db, dev_org_id, count_queries):
+    """Load a bird meta and return it with the number of statements it took"""
+    clear_cache()
+
+    def load(ring):
+        with count_queries() as statements:
+            bird = BirdService(test_db).get_bird_meta_by_ring(ring, dev_org_id)
+        return bird, len(statements)
+
+    yield load
+    clear_cache()
+
+
+def test_repeat_view_costs_no_queries(test_db, dev_org_id, meta):
+    SightingRepository(test_db).create(dev_org_id, ring="A1", species="Graugans")
+
+    first, first_queries = meta("A1")
+    again, again_queries = meta("A1")
+
+    assert first_queries > 0
+    assert again_queries == 0
+    assert again == first
+    assert again["sighting_count"] == 1
+
+
+def test_sighting_writes_invalidate_only_their_ring(test_db, dev_org_id, meta):
+    repo = SightingRepository(test_db)
+    sighting = repo.create(dev_org_id, ring="A1", species="Graugans")
+    meta("A1")
+
+    repo.create(dev_org_id, ring="B2", species="Graugans")
+    assert meta("A1")[1] == 0
+
+    repo.create(dev_org_id, ring="A1", species="Nilgans", date=date(2024, 5, 1))
+    bird, queries = meta("A1")
+    assert queries > 0
+    assert bird["sighting_count"] == 2
+
+    # Moving a sighting to another ring changes both birds
+    meta("B2")
+    repo.update(sighting.id, dev_org_id, ring="B2")
+    assert meta("A1")[0]["sighting_count"] == 1
+    assert meta("B2")[0]["sighting_count"] == 2
+
+    repo.delete(sighting.id, dev_org_id)
+    assert meta("B2")[0]["sighting_count"] == 1
+
+
+def test_ringing_writes_invalidate(test_db, dev_org_id, meta):
+    assert meta("R1")[0]["species"] is None
+
+    RingingRepository(test_db).upsert_ringing(
+        "R1",
+        dev_org_id,
+        ring_scheme="DEW",
+        species="Graugans",
+        date=date(2024, 5, 1),
+        place="See",
+        lat=52.5,
+        lon=13.4,
+        ringer="Anna",
+        sex=1,
+        age=1,
+    )
+
+    assert meta("R1")[0]["species"] == "Graugans"
+
+
+def test_relationship_writes_invalidate_both_birds(test_db, dev_org_id, meta):
+    SightingRepository(test_db).create(dev_org_id, ring="A1", species="Graugans")
+    SightingRepository(test_db).create(dev_org_id, ring="B2", species="Graugans")
+    repo = FamilyRepository(test_db)
+    meta("A1")
+    meta("B2")
+
+    relationship = repo.create_relationship(
+        dev_org_id, "B2", "A1", RelationshipType.BREEDING_PARTNER, 2023
+    )
+    assert [p["year"] for p in meta("A1")[0]["partners"]] == [2023]
+    assert [p["ring"] for p in meta("B2")[0]["partners"]] == ["A1"]
+
+    repo.update_relationship(relationship, year=2024)
+    assert [p["year"] for p in meta("B2")[0]["partners"]] == [2024]
+
+    repo.delete_relationship(dev_org_id, relationship.id)
+    assert meta("A1")[0]["partners"] == []
+
+
+def test_bird_versions_are_forgotten_after_retention(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(cache, "_bird_versions", {})
+    monkeypatch.setattr(cache, "_last_bird_version_prune", clock[0])
+
+    bump_bird_versions("org", ["A1"])
+    ((old_version, _),) = cache._bird_versions.values()
+
+    clock[0] += cache._BIRD_VERSION_RETENTION.total_seconds() + 1
+    bump_bird_versions("org", ["B2"])
+
+    assert list(cache._bird_versions) == [("org", "B2")]
+    # Versions are never handed out twice, so A1 cannot hit an entry of a later one
+    assert cache._bird_versions[("org", "B2")][0] > old_version
@@ -0,0 +1,195 @@
+"""
+Tests for the bounded, single-flight SimpleCache.
+"""
+
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.utils.cache import SimpleCache
+
+
+def test_lru_eviction_by_entry_count():
+    cache = SimpleCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a", lambda: "fetched") == 1  # a is now most recent
+    cache.set("c", 3)
+
+    assert cache.get("b", lambda: "fetched") == "fetched"
+    assert cache.get_stats()["evictions"] >= 1
+    assert len(cache._cache) == 2
+
+
+def test_eviction_by_byte_budget():
+    cache = SimpleCache(max_bytes=20_000)
+    for i in range(10):
+        cache.set(f"k{i}", "x" * 5_000)
+    stats = cache.get_stats()
+    assert stats["approx_bytes"] <= 20_000
+    assert stats["total_entries"] < 10
+    # The newest entry survives
+    assert cache.get("k9", lambda: "fetched") == "x" * 5_000
+
+
+def test_values_are_sized_outside_the_lock(monkeypatch):
+    cache = SimpleCache()
+    locked = []
+
+    def approx_size(value):
+        locked.append(cache._lock.locked())
+        return 1
+
+    monkeypatch.setattr("src.utils.cache._approx_size", approx_size)
+    cache.set("a", [1, 2, 3])
+    cache.get("b", lambda: [4, 5, 6])
+    assert locked == [False, False]
+
+
+def test_concurrent_misses_fetch_once():
+    cache = SimpleCache()
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(2)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("k", slow_fetch)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_slow_fetch_does_not_block_other_keys():
+    cache = SimpleCache()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(2)
+        return "slow"
+
+    thread = threading.Thread(target=lambda: cache.get("slow", slow_fetch))
+    thread.start()
+    started.wait(2)
+    try:
+        assert cache.get("fast", lambda: "fast") == "fast"
+    finally:
+        release.set()
+        thread.join(2)
+
+
+def test_nested_gets_do_not_deadlock():
+    cache = SimpleCache()
+    outer = cache.get("outer", lambda: cache.get("inner", lambda: 1) + 1)
+    assert outer == 2
+    # Re-entrant fetch of the same key falls through to the fetch function
+    assert cache.get("same", lambda: cache.get("same", lambda: 3)) == 3
+
+
+def test_stale_value_served_while_refreshing():
+    cache = SimpleCache(stale_ttl=timedelta(seconds=10))
+    cache.set("k", "old", ttl=timedelta(seconds=0))
+    started, release = threading.Event(), threading.Event()
+
+    def refresh():
+        started.set()
+        release.wait(2)
+        return "new"
+
+    thread = threading.Thread(target=lambda: cache.get("k", refresh))
+    thread.start()
+    started.wait(2)
+    try:
+        assert cache.get("k", lambda: "unexpected") == "old"
+        assert cache.get_stats()["stale_hits"] == 1
+    finally:
+        release.set()
+        thread.join(2)
+    assert cache.get("k", lambda: "unexpected") == "new"
+
+
+def test_fetch_error_falls_back_to_stale_value():
+    cache = SimpleCache()
+    cache.set("k", "old", ttl=timedelta(seconds=0))
+
+    def failing():
+        raise RuntimeError("db down")
+
+    assert cache.get("k", failing) == "old"
+    with pytest.raises(RuntimeError):
+        cache.get("missing", failing)
+    assert cache.get_stats()["fetch_errors"] == 2
+
+
+class _Cancelled(BaseException):
+    pass
+
+
+def test_base_exception_in_fetch_releases_waiters():
+    cache = SimpleCache()
+    started, release = threading.Event(), threading.Event()
+
+    def cancelled_fetch():
+        started.set()
+        release.wait(2)
+        raise _Cancelled()
+
+    def owner():
+        with pytest.raises(_Cancelled):
+            cache.get("k", cancelled_fetch)
+
+    errors = []
+
+    def waiter():
+        try:
+            cache.get("k", lambda: "unexpected")
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=owner, daemon=True)]
+    threads[0].start()
+    started.wait(2)
+    threads.append(threading.Thread(target=waiter, daemon=True))
+    threads[1].start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert [type(e) for e in errors] == [_Cancelled]
+    assert cache.get_stats()["in_flight"] == 0
+    assert cache.get("k", lambda: "fetched") == "fetched"
+
+
+def test_hit_and_miss_counters():
+    cache = SimpleCache()
+    cache.get("k", lambda: 1)
+    cache.get("k", lambda: 2)
+    cache.get("k", lambda: 3)
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == round(2 / 3, 3)
+
+
+def test_expired_entries_are_cleaned_up():
+    cache = SimpleCache(stale_ttl=timedelta(0))
+    cache.set("k", 1, ttl=timedelta(0))
+    assert cache.cleanup_expired() == 1
+    assert cache.get_stats()["total_entries"] == 0
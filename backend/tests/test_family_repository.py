@@ -11,14 +11,17 @@ Tests verify:
 """
 
 import pytest
+from datetime import date
 from uuid import uuid4
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from src.api.routers.family import FamilyTreeResponse, RelationshipStatistics
 from src.database.connection import Base
 from src.database.family_models import BirdRelationship, RelationshipType
 from src.database.family_repository import FamilyRepository
+from src.database.models import Ringing, Sighting
 
 
 # ----------- Fixtures -----------
@@ -219,6 +222,42 @@ def test_get_siblings_as_bird2(repo):
     assert "A001" in rings
 
 
+def test_get_half_siblings_flags_shared_parents(repo, count_queries):
+    """Half-siblings are resolved via parents in one query, with the shared-parent flag."""
+    for parent, child, year in [
+        ("MOTHER", "ME", 2024),
+        ("FATHER", "ME", 2024),
+        ("MOTHER", "FULL", 2024),
+        ("FATHER", "FULL", 2024),
+        ("MOTHER", "HALF", 2025),
+        ("OTHER_FATHER", "HALF", 2025),
+        ("OTHER_FATHER", "STRANGER", 2025),
+    ]:
+        repo.create_relationship(
+            org_id=TEST_ORG_ID,
+            bird1_ring=parent,
+            bird2_ring=child,
+            relationship_type=RelationshipType.PARENT_OF,
+            year=year,
+        )
+
+    with count_queries(test_engine) as statements:
+        siblings = repo.get_siblings(TEST_ORG_ID, "ME", include_half_siblings=True)
+
+    assert len(statements) == 1
+    assert [(s["ring"], s["year"], s["shares_both_parents"]) for s in siblings] == [
+        ("HALF", 2025, False),
+        ("FULL", 2024, True),
+    ]
+    assert [
+        s["ring"]
+        for s in repo.get_siblings(
+            TEST_ORG_ID, "ME", year=2024, include_half_siblings=True
+        )
+    ] == ["FULL"]
+    assert repo.get_siblings(TEST_ORG_ID, "MOTHER", include_half_siblings=True) == []
+
+
 # ----------- display_type helper -----------
 
 def test_display_type_parent_perspective(repo):
@@ -362,3 +401,199 @@ def test_create_relationship_duplicate_does_not_overwrite_existing_sighting_ids(
     )
     assert second.id == first.id
     assert second.sighting1_id == original
+
+
+# ----------- get_family_tree -----------
+
+def _link(repo, bird1, bird2, relationship_type, year=2026):
+    repo.create_relationship(
+        org_id=TEST_ORG_ID,
+        bird1_ring=bird1,
+        bird2_ring=bird2,
+        relationship_type=relationship_type,
+        year=year,
+    )
+
+
+def _rings(nodes):
+    return sorted(node["ring"] for node in nodes)
+
+
+@pytest.fixture()
+def family(repo, db):
+    """GRAND -> PARENT -> BIRD -> CHILD -> GRANDCHILD, plus a sibling and a partner"""
+    for parent, child in [
+        ("GRAND", "PARENT"),
+        ("PARENT", "BIRD"),
+        ("PARENT", "SISTER"),
+        ("BIRD", "CHILD"),
+        ("CHILD", "GRANDCHILD"),
+    ]:
+        _link(repo, parent, child, RelationshipType.PARENT_OF)
+    _link(repo, "BIRD", "SISTER", RelationshipType.SIBLING_OF)
+    _link(repo, "BIRD", "MATE", RelationshipType.BREEDING_PARTNER, 2024)
+    _link(repo, "BIRD", "MATE", RelationshipType.BREEDING_PARTNER, 2025)
+    # Another org's relationship must not leak into the tree
+    repo.create_relationship(
+        org_id=str(uuid4()),
+        bird1_ring="STRANGER",
+        bird2_ring="BIRD",
+        relationship_type=RelationshipType.PARENT_OF,
+        year=2026,
+    )
+    db.add(
+        Ringing(
+            org_id=TEST_ORG_ID,
+            ring="BIRD",
+            ring_scheme="DEW",
+            species="Graugans",
+            date=date(2024, 5, 1),
+            place="See",
+            lat=52.5,
+            lon=13.4,
+            ringer="Anna",
+            sex=2,
+            age=1,
+        )
+    )
+    db.add(Sighting(org_id=TEST_ORG_ID, ring="MATE", species="Graugans", sex=1))
+    db.add(Sighting(org_id=TEST_ORG_ID, ring="MATE", species="Graugans", sex=1))
+    db.add(Sighting(org_id=TEST_ORG_ID, ring="MATE", species="Nilgans"))
+    db.commit()
+
+
+def test_family_tree_walks_generations(repo, family):
+    tree = repo.get_family_tree(TEST_ORG_ID, "BIRD", max_generations=3)
+
+    assert (tree["species"], tree["sex"], tree["ringing_place"]) == (
+        "Graugans",
+        2,
+        "See",
+    )
+    assert tree["ringing_date"] == "2024-05-01"
+    assert _rings(tree["parents"]) == ["PARENT"]
+    assert _rings(tree["parents"][0]["parents"]) == ["GRAND"]
+    assert _rings(tree["children"]) == ["CHILD"]
+    assert _rings(tree["children"][0]["children"]) == ["GRANDCHILD"]
+    assert _rings(tree["siblings"]) == ["SISTER"]
+    assert [(p["ring"], p["year"]) for p in tree["partners"]] == [
+        ("MATE", 2025),
+        ("MATE", 2024),
+    ]
+    # Birds without a ringing fall back to their sightings
+    assert (tree["partners"][0]["species"], tree["partners"][0]["sex"]) == (
+        "Graugans",
+        1,
+    )
+    FamilyTreeResponse(**tree)
+
+
+def test_family_tree_respects_max_generations(repo, family):
+    tree = repo.get_family_tree(TEST_ORG_ID, "BIRD", max_generations=1)
+
+    assert _rings(tree["parents"]) == ["PARENT"]
+    assert tree["parents"][0]["parents"] == []
+    assert tree["children"][0]["children"] == []
+
+
+def test_family_tree_uses_fixed_number_of_queries(repo, family, count_queries):
+    with count_queries(test_engine) as statements:
+        repo.get_family_tree(TEST_ORG_ID, "BIRD", max_generations=5)
+
+    # Relationships, ringings, sighting species/sex
+    assert len(statements) == 3
+
+
+def test_family_tree_survives_cycles(repo):
+    _link(repo, "A001", "B002", RelationshipType.PARENT_OF)
+    _link(repo, "B002", "A001", RelationshipType.PARENT_OF)
+
+    tree = repo.get_family_tree(TEST_ORG_ID, "A001", max_generations=5)
+
+    assert _rings(tree["parents"]) == ["B002"]
+    assert tree["parents"][0]["parents"] == []
+    assert tree["species"] is None
+
+
+# ----------- get_relationship_statistics -----------
+
+def test_relationship_statistics(repo, db, family):
+    nest = Sighting(id=uuid4(), org_id=TEST_ORG_ID, ring="MATE", place="Nest A")
+    chick = Ringing(
+        id=uuid4(),
+        org_id=TEST_ORG_ID,
+        ring="CHICK",
+        ring_scheme="DEW",
+        species="Graugans",
+        date=date(2025, 6, 1),
+        place="Nest B",
+        lat=52.5,
+        lon=13.4,
+        ringer="Anna",
+        sex=0,
+        age=1,
+    )
+    db.add_all([nest, chick])
+    db.commit()
+    repo.create_relationship(
+        org_id=TEST_ORG_ID,
+        bird1_ring="BIRD",
+        bird2_ring="MATE",
+        relationship_type=RelationshipType.BREEDING_PARTNER,
+        year=2023,
+        sighting2_id=nest.id,
+    )
+    repo.create_relationship(
+        org_id=TEST_ORG_ID,
+        bird1_ring="BIRD",
+        bird2_ring="CHICK",
+        relationship_type=RelationshipType.PARENT_OF,
+        year=2025,
+        ringing2_id=chick.id,
+    )
+
+    stats = repo.get_relationship_statistics(TEST_ORG_ID, "BIRD")
+
+    assert stats == {
+        "total_partners": 1,
+        "total_children": 2,
+        "total_siblings": 1,
+        "breeding_years": [2023, 2024, 2025, 2026],
+        "breeding_locations": ["Nest A", "Nest B"],
+        # MATE, CHILD, CHICK, SISTER and PARENT
+        "family_size": 5,
+    }
+    RelationshipStatistics(**stats)
+
+
+def test_relationship_statistics_of_unrelated_bird(repo):
+    assert repo.get_relationship_statistics(TEST_ORG_ID, "NOBODY") == {
+        "total_partners": 0,
+        "total_children": 0,
+        "total_siblings": 0,
+        "breeding_years": [],
+        "breeding_locations": [],
+        "family_size": 0,
+    }
+
+
+def test_all_relationship_statistics_match_single_bird(repo, family, count_queries):
+    with count_queries(test_engine) as statements:
+        everything = repo.get_all_relationship_statistics(TEST_ORG_ID)
+
+    assert len(statements) == 1
+    assert "STRANGER" not in everything
+    assert sorted(everything) == [
+        "BIRD",
+        "CHILD",
+        "GRAND",
+        "GRANDCHILD",
+        "MATE",
+        "PARENT",
+        "SISTER",
+    ]
+    for ring, stats in everything.items():
+        assert stats == repo.get_relationship_statistics(TEST_ORG_ID, ring)
+    # A child is not breeding: SISTER's parent_of record adds no breeding year
+    assert everything["SISTER"]["breeding_years"] == []
+    assert everything["PARENT"]["total_children"] == 2
@@ -0,0 +1,93 @@
+"""
+Tests for the org-scoped, version-invalidated application cache.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+from src.database.repositories import RingingRepository, SightingRepository
+from src.utils.cache import (
+    bump_org_version,
+    clear_cache,
+    get_org_cached_data,
+    get_org_version,
+)
+
+
+def test_bump_rolls_over_org_keys_only():
+    clear_cache()
+    org_a, org_b = uuid4(), uuid4()
+    calls = []
+
+    def fetch(value):
+        def fetch_func():
+            calls.append(value)
+            return value
+
+        return fetch_func
+
+    assert get_org_cached_data(org_a, "k", fetch("a1")) == "a1"
+    assert get_org_cached_data(org_b, "k", fetch("b1")) == "b1"
+    assert get_org_cached_data(org_a, "k", fetch("a2")) == "a1"
+
+    version = get_org_version(org_a)
+    assert bump_org_version(org_a) == version + 1
+    assert get_org_cached_data(org_a, "k", fetch("a3")) == "a3"
+    assert get_org_cached_data(org_b, "k", fetch("b2")) == "b1"
+    assert calls == ["a1", "b1", "a3"]
+
+
+class TestRepositoryLists:
+    def test_sighting_lists_are_scoped_and_fresh(self, test_db, dev_org_id):
+        clear_cache()
+        other_org = uuid4()
+        repo = SightingRepository(test_db)
+        repo.create(dev_org_id, id=uuid4(), species="Graugans", place="See", ring="A1")
+        repo.create(other_org, id=uuid4(), species="Nilgans", place="Teich", ring="B1")
+
+        assert repo.get_species_list(dev_org_id) == ["Graugans"]
+        assert repo.get_place_list(other_org) == ["Teich"]
+
+        # A write through the repository is visible right away
+        sighting = repo.create(
+            dev_org_id, id=uuid4(), species="Höckerschwan", ring="A2", date=date.today()
+        )
+        assert repo.get_species_list(dev_org_id) == ["Graugans", "Höckerschwan"]
+        assert repo.get_ring_list(dev_org_id) == ["A1", "A2"]
+
+        repo.delete(sighting.id, dev_org_id)
+        assert repo.get_ring_list(dev_org_id) == ["A1"]
+
+    def test_ringing_write_bumps_version(self, test_db, dev_org_id):
+        clear_cache()
+        repo = RingingRepository(test_db)
+        assert repo.get_ringer_list(dev_org_id) == []
+
+        version = get_org_version(dev_org_id)
+        repo.upsert_ringing(
+            "R1",
+            dev_org_id,
+            id=uuid4(),
+            ring_scheme="DEW",
+            species="Graugans",
+            date=date(2024, 5, 1),
+            place="See",
+            lat=50.1,
+            lon=8.6,
+            ringer="Ingo",
+            sex=0,
+            age=1,
+        )
+        assert get_org_version(dev_org_id) == version + 1
+        assert repo.get_ringer_list(dev_org_id) == ["Ingo"]
+        assert repo.get_species_list(uuid4()) == []
+
+
+def test_dashboard_sees_new_sighting(client, dev_org_id):
+    clear_cache()
+    before = client.get("/api/dashboard").json()["count_total_sightings"]
+    response = client.post(
+        "/api/sightings", json={"species": "Graugans", "date": date.today().isoformat()}
+    )
+    assert response.status_code in (200, 201)
+    assert client.get("/api/dashboard").json()["count_total_sightings"] == before + 1
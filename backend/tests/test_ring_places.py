@@ -1,6 +1,12 @@
 """Tests for the RING place lookup + GPS-nearest "smart" fallback."""
 
+from src.utils.distance import calculate_distance
+from src.utils import ring_places
 from src.utils.ring_places import (
+    SMART_MATCH_MAX_METERS,
+    PlaceResolver,
+    _geo_index,
+    _load_geo,
     lookup_place,
     names_overlap,
     smart_match_place,
@@ -57,3 +63,67 @@ def test_smart_match_rejects_when_nearest_is_far_or_unrelated():
 
 def test_smart_match_requires_coordinates():
     assert smart_match_place("F, Bethmannweiher", None, None) is None
+
+
+# ---- grid index ----
+
+def _brute_force_match(name, lat, lon):
+    best = None
+    for p in _load_geo():
+        dist = calculate_distance(lat, lon, p.lat, p.lon)
+        if dist <= SMART_MATCH_MAX_METERS and names_overlap(name, p.ring_place):
+            if best is None or dist < best[0]:
+                best = (dist, p)
+    return best[1] if best else None
+
+
+def test_grid_index_matches_brute_force_scan():
+    # Query at (and slightly off) every RING place, using its own name.
+    for p in _load_geo():
+        for dlat, dlon in ((0.0, 0.0), (0.003, -0.004), (-0.002, 0.005)):
+            lat, lon = p.lat + dlat, p.lon + dlon
+            expected = _brute_force_match(p.ring_place, lat, lon)
+            assert smart_match_place(p.ring_place, lat, lon) == expected
+
+
+def test_grid_index_only_scans_neighbouring_cells():
+    places = _load_geo()
+    p = places[0]
+    near = _geo_index().near(p.lat, p.lon)
+    assert any(e.place == p for e in near)
+    assert len(near) < len(places)
+    # Far away from every RING place: nothing to scan at all.
+    assert _geo_index().near(0.0, 0.0) == []
+
+
+# ---- memoized resolution ----
+
+def test_resolver_matches_direct_lookups():
+    resolver = PlaceResolver()
+    explicit = resolver.resolve("F, Mainkai, Innenstadt", 50.1, 8.6)
+    assert explicit == (lookup_place("F, Mainkai, Innenstadt"), False)
+    auto = resolver.resolve("F, Bethmannweiher", 50.11775, 8.69082)
+    assert auto == (smart_match_place("F, Bethmannweiher", 50.11775, 8.69082), True)
+    assert resolver.resolve("F, Erlenbruch", 50.12912, 8.72790) == (None, False)
+    assert resolver.resolve("F, Bethmannweiher", None, None) == (None, False)
+
+
+def test_resolver_matches_once_per_place_and_bucket(monkeypatch):
+    calls = []
+    real_smart_match = ring_places.smart_match_place
+
+    def counting_smart_match(*args):
+        calls.append(args)
+        return real_smart_match(*args)
+
+    monkeypatch.setattr(ring_places, "smart_match_place", counting_smart_match)
+    resolver = PlaceResolver()
+    for _ in range(50):
+        resolver.resolve("F, Bethmannweiher", 50.11775, 8.69082)
+        # Same spot (within the ~11 m bucket), different spelling/spacing
+        resolver.resolve("f,  Bethmannweiher ", 50.117751, 8.690819)
+    resolver.resolve("F, Bethmannweiher", 50.2, 8.7)
+
+    assert len(calls) == 2
+    assert (resolver.hits, resolver.misses) == (99, 2)
+    assert resolver.hit_rate == 99 / 101
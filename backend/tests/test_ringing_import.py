@@ -0,0 +1,72 @@
+"""
+Tests for the chunked bulk ringing import helpers.
+
+The COPY + merge itself needs PostgreSQL; these cover chunking, the COPY payload
+and the per-chunk error accounting.
+"""
+
+import csv
+from datetime import date
+
+from src.database.ringing_import import (
+    RINGING_IMPORT_COLUMNS,
+    bulk_upsert_ringings,
+    chunked,
+    copy_buffer,
+)
+
+
+def _row(ring, comment=None):
+    return {
+        "ring": ring,
+        "ring_scheme": "DEW",
+        "species": "Graugans",
+        "date": date(2024, 5, 1),
+        "place": "See",
+        "lat": 50.1,
+        "lon": 8.6,
+        "ringer": "",
+        "sex": 1,
+        "age": 2,
+        "comment": comment,
+    }
+
+
+def test_chunked_splits_lazily():
+    assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 3)) == []
+
+
+def test_copy_buffer_rows_match_columns():
+    rows = list(csv.reader(copy_buffer([_row("A", 'say "hi", ok'), _row("B")])))
+    assert len(rows) == 2
+    seq, *values = rows[0]
+    assert seq == "0"
+    assert dict(zip(RINGING_IMPORT_COLUMNS, values))["comment"] == 'say "hi", ok'
+    assert rows[1][0] == "1"
+
+
+def test_copy_buffer_distinguishes_null_from_empty():
+    line = copy_buffer([_row("A")]).read().strip()
+    fields = next(csv.reader([line]))
+    values = dict(zip(RINGING_IMPORT_COLUMNS, fields[1:]))
+    assert values["comment"] == r"\N"
+    assert values["ringer"] == ""
+
+
+def test_failed_chunks_are_counted_and_reported(test_db, dev_org_id):
+    # SQLite cannot run the PostgreSQL staging/merge, so every chunk fails
+    progress = []
+    stats = bulk_upsert_ringings(
+        test_db,
+        dev_org_id,
+        (_row(f"R{i}") for i in range(5)),
+        chunk_size=2,
+        on_chunk=lambda number, stats: progress.append((number, stats["errors"])),
+    )
+
+    assert progress == [(1, 2), (2, 4), (3, 5)]
+    assert stats["total_rows"] == 5
+    assert stats["chunks"] == 3
+    assert stats["errors"] == 5
+    assert stats["new_ringings"] == stats["updated_comments"] == 0
@@ -0,0 +1,172 @@
+"""
+Tests for the per-org suggestion frequency table and the reads served from it.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+from src.database.models import Sighting, SuggestionFrequency
+from src.database.repositories import RingingRepository, SightingRepository
+from src.database.suggestion_repository import SuggestionFrequencyRepository
+from src.utils.cache import clear_cache
+
+
+def _counts(test_db, org_id):
+    rows = test_db.query(SuggestionFrequency).filter(
+        SuggestionFrequency.org_id == org_id
+    )
+    return {(row.field, row.value): row.count for row in rows}
+
+
+def _ringing(ringer):
+    return {
+        "ring_scheme": "DEW",
+        "species": "Graugans",
+        "date": date(2024, 5, 1),
+        "place": "See",
+        "lat": 52.5,
+        "lon": 13.4,
+        "ringer": ringer,
+        "sex": 1,
+        "age": 1,
+    }
+
+
+class TestWriteMaintenance:
+    def test_create_update_delete_adjust_counts(self, test_db, dev_org_id):
+        repo = SightingRepository(test_db)
+        first = repo.create(dev_org_id, species="Graugans", place="See", melder="")
+        repo.create(dev_org_id, species="Graugans", place="Teich")
+        assert _counts(test_db, dev_org_id) == {
+            ("species", "Graugans"): 2,
+            ("places", "See"): 1,
+            ("places", "Teich"): 1,
+        }
+
+        repo.update(first.id, dev_org_id, place="Teich", habitat="Wiese")
+        assert _counts(test_db, dev_org_id) == {
+            ("species", "Graugans"): 2,
+            ("places", "Teich"): 2,
+            ("habitats", "Wiese"): 1,
+        }
+
+        repo.delete(first.id, dev_org_id)
+        assert _counts(test_db, dev_org_id) == {
+            ("species", "Graugans"): 1,
+            ("places", "Teich"): 1,
+        }
+
+    def test_ringing_upsert_tracks_ringers(self, test_db, dev_org_id):
+        repo = RingingRepository(test_db)
+        repo.create(dev_org_id, ring="R1", **_ringing("Anna"))
+        repo.upsert_ringing("R2", dev_org_id, **_ringing("Anna"))
+        repo.upsert_ringing("R2", dev_org_id, ringer="Ben")
+        assert _counts(test_db, dev_org_id) == {
+            ("ringers", "Anna"): 1,
+            ("ringers", "Ben"): 1,
+        }
+
+    def test_rebuild_matches_incremental_counts(self, test_db, dev_org_id):
+        repo = SightingRepository(test_db)
+        for place in ["See", "See", "Teich", None]:
+            repo.create(dev_org_id, species="Graugans", place=place, field_fruit="Mais")
+        RingingRepository(test_db).create(dev_org_id, ring="R1", **_ringing("Anna"))
+        incremental = _counts(test_db, dev_org_id)
+
+        # A row written behind the repositories' back, e.g. by a bulk import
+        other_org = uuid4()
+        test_db.add(Sighting(id=uuid4(), org_id=dev_org_id, species="Nilgans"))
+        test_db.add(Sighting(id=uuid4(), org_id=other_org, species="Nilgans"))
+        test_db.commit()
+
+        written = SuggestionFrequencyRepository(test_db).rebuild(dev_org_id)
+        rebuilt = _counts(test_db, dev_org_id)
+        assert written == len(rebuilt)
+        assert rebuilt == {
+            **incremental,
+            ("species", "Graugans"): 4,
+            ("species", "Nilgans"): 1,
+        }
+        assert _counts(test_db, other_org) == {}
+
+
+class TestSuggestionReads:
+    def test_lists_ordered_by_count(self, client, dev_org_id):
+        clear_cache()
+        for place in ["Teich", "See", "See", "Wiese", "See", "Teich"]:
+            response = client.post("/api/sightings", json={"place": place})
+            assert response.status_code in (200, 201)
+
+        data = client.get("/api/suggestions").json()
+        assert data["places"] == ["See", "Teich", "Wiese"]
+        assert data["species"] == []
+        assert client.get("/api/suggestions/places").json() == {
+            "places": ["See", "Teich", "Wiese"]
+        }
+
+    def test_suggestion_lists_are_a_single_query(
+        self, client, test_db, dev_org_id, count_queries
+    ):
+        repo = SightingRepository(test_db)
+        repo.create(dev_org_id, species="Graugans", place="See", habitat="Wiese")
+        RingingRepository(test_db).create(dev_org_id, ring="R1", **_ringing("Anna"))
+        clear_cache()
+
+        frequencies = SuggestionFrequencyRepository(test_db)
+        # The backfill marker is looked up once per process and org
+        assert frequencies.is_backfilled(dev_org_id)
+        with count_queries() as statements:
+            lists = frequencies.get_lists(dev_org_id)
+
+        assert len(statements) == 1
+        assert "FROM suggestion_frequencies" in statements[0]
+        assert lists == {
+            "places": ["See"],
+            "species": ["Graugans"],
+            "habitats": ["Wiese"],
+            "melders": [],
+            "field_fruits": [],
+            "ringers": ["Anna"],
+        }
+
+
+class TestBackfill:
+    def test_reads_aggregate_until_backfilled(self, test_db, count_queries):
+        # An org from before the table existed: no backfill marker yet
+        org_id = uuid4()
+        for place in ["Teich", "See", "See"]:
+            test_db.add(Sighting(id=uuid4(), org_id=org_id, place=place))
+        test_db.add(Sighting(id=uuid4(), org_id=uuid4(), place="Wiese"))
+        test_db.commit()
+
+        frequencies = SuggestionFrequencyRepository(test_db)
+        with count_queries() as statements:
+            lists = frequencies.get_lists(org_id)
+
+        assert lists["places"] == ["See", "Teich"]
+        assert lists["ringers"] == []
+        assert all(s.lstrip().startswith("SELECT") for s in statements)
+        assert not frequencies.is_backfilled(org_id)
+        assert _counts(test_db, org_id) == {}
+
+    def test_backfill_missing_rebuilds_unmarked_orgs(self, test_db):
+        org_id = uuid4()
+        repo = SightingRepository(test_db)
+        for place in ["Teich", "See", "See"]:
+            test_db.add(Sighting(id=uuid4(), org_id=org_id, place=place))
+        test_db.commit()
+        # Writes before the backfill are counted too; the backfill replaces them
+        repo.create(org_id, place="Teich")
+
+        frequencies = SuggestionFrequencyRepository(test_db)
+        assert frequencies.backfill_missing() == 1
+        assert frequencies.is_backfilled(org_id)
+        assert _counts(test_db, org_id) == {
+            ("places", "See"): 2,
+            ("places", "Teich"): 2,
+        }
+        assert frequencies.backfill_missing() == 0
+
+        # From now on writes keep the counts up to date
+        repo.create(org_id, place="Teich")
+        assert frequencies.get_values(org_id, "places") == ["Teich", "See"]
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import type { Sighting, BirdMeta, FriendResponse, Dashboard, Ringing, ShareableReport, SuggestionBird, FamilyTreeEntry } from '../types';
+import type { Sighting, BirdMeta, FriendResponse, Dashboard, Ringing, ShareableReport, SuggestionBird, FamilyTreeEntry, Changes } from '../types';
 
 // API configuration - uses relative /api path (works with nginx and vite proxy)
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || '/api';
@@ -47,7 +47,14 @@ export const getSightings = async (params?: {
   place?: string;
   ring?: string;
 }) => {
-  const response = await api.get<Sighting[]>('/sightings', { params });
+  // all=true: the list views still filter/paginate client-side on the full set
+  const response = await api.get<Sighting[]>('/sightings', { params: { ...params, all: true } });
+  return response.data;
+};
+
+// Sightings changed/deleted since the token of the previous call (all without one)
+export const getSightingChanges = async (since?: string) => {
+  const response = await api.get<Changes<Sighting>>('/sightings/changes', { params: since ? { since } : undefined });
   return response.data;
 };
 
@@ -101,6 +108,12 @@ export const deleteSighting = async (id: string) => {
   return response.data;
 };
 
+// Bird meta for many rings in one request (one entry per distinct ring, in order)
+export const getBirdsByRings = async (rings: string[]) => {
+  const response = await api.post<BirdMeta[]>('/birds/batch', rings);
+  return response.data;
+};
+
 export const getBirdSuggestions = async (partialReading: string) => {
   console.log('Fetching bird suggestions for:', partialReading);
   const response = await api.get<SuggestionBird[]>(`/birds/suggestions/${partialReading}`);
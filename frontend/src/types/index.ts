@@ -92,6 +92,7 @@ export interface Dashboard {
   count_total_unique_birds: number;
   top_species: { [species: string]: number };
   top_locations: { [location: string]: number };
+  recent_activity: { date: string; count: number }[];
 }
 
 export interface Ringing {
@@ -110,6 +111,19 @@ export interface Ringing {
   comment?: string;  // New optional comment field
 }
 
+// Delta sync feed (GET /sightings/changes, /ringings/changes)
+export interface Tombstone {
+  id: string;
+  ring?: string | null;  // Ring number, for deleted ringings
+  deleted_at: string;
+}
+
+export interface Changes<T> {
+  changed: T[];
+  deleted: Tombstone[];
+  token: string;  // Pass as `since` on the next call
+}
+
 export interface ShareableReport {
   view_url: string;
 }